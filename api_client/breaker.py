@@ -0,0 +1,160 @@
+"""
+Breaker module for the package api_client of rest-api-client-framework library.
+
+Classes:
+    CircuitState
+    CircuitBreaker
+"""
+
+import threading
+import time
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """CircuitState class."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker failing fast while a host is down.
+
+    The circuit opens after ``failure_threshold`` consecutive failures. Once
+    ``recovery_timeout`` has elapsed it is half open and lets
+    ``half_open_max_calls`` trial requests through: a success closes it, a
+    failure opens it again. Share one breaker between the clients of a host.
+
+    :param failure_threshold: Consecutive failures opening the circuit,
+        defaults to 5
+    :type failure_threshold: int, optional
+    :param recovery_timeout: Seconds the circuit stays open, defaults to 30
+    :type recovery_timeout: float, optional
+    :param half_open_max_calls: Concurrent trial requests when half open,
+        defaults to 1
+    :type half_open_max_calls: int, optional
+    :raises ValueError: If failure_threshold or half_open_max_calls is below 1
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Construct a CircuitBreaker object."""
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_calls must be at least 1.",
+            )
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the circuit.
+
+        :return: The state
+        :rtype: CircuitState
+        """
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures.
+
+        :return: Consecutive failures
+        :rtype: int
+        """
+        return self._failures
+
+    def retry_after(self) -> float:
+        """Return the seconds left before a request may be let through.
+
+        When the circuit is half open with all its trial slots taken, this is
+        the time until the slots are released; a trial reporting back may end
+        the wait sooner.
+
+        :return: Seconds, 0 when a request may be sent now
+        :rtype: float
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED or (
+                state == CircuitState.HALF_OPEN
+                and self._trials < self.half_open_max_calls
+            ):
+                return 0
+            return max(0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent, taking a trial slot if needed.
+
+        :return: True when the request may be sent
+        :rtype: bool
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.OPEN:
+                return False
+            if self._trials >= self.half_open_max_calls:
+                return False
+            self._trials += 1
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._trials = 0
+            self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN or (
+                state == CircuitState.CLOSED
+                and self._failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def reset(self) -> None:
+        """Close the circuit and forget the failures."""
+        self.record_success()
+
+    def _current_state(self) -> CircuitState:
+        """Return the state, moving from open to half open, the lock is held.
+
+        A trial request that never reported back does not keep the circuit
+        half open forever: trial slots are released after recovery_timeout.
+
+        :return: The state
+        :rtype: CircuitState
+        """
+        if self._state == CircuitState.CLOSED:
+            return self._state
+        now = time.monotonic()
+        if now - self._opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._opened_at = now
+            self._trials = 0
+        return self._state
+
+    def _open(self) -> None:
+        """Open the circuit, the lock is held."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._trials = 0
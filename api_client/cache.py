@@ -0,0 +1,551 @@
+"""
+Cache module for the package api_client of rest-api-client-framework library.
+
+Responses of safe requests are cached following their Cache-Control and Expires
+headers, and revalidated with If-None-Match / If-Modified-Since once stale.
+
+Classes:
+    CachedResponse
+    CacheBackend
+    MemoryCache
+    DiskCache
+    ResponseCache
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from pydantic import BaseModel
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+_MAX_AGE = re.compile(r"max-age\s*=\s*(\d+)")
+_ETAG = "etag"
+_LAST_MODIFIED = "last-modified"
+# Cached bodies are decoded, headers describing the encoded body are dropped.
+_ENCODED_BODY_HEADERS = ("content-encoding", "content-length")
+
+
+def _decoded_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Return the headers of a response whose body was decoded.
+
+    :param headers: Response headers, lower cased
+    :type headers: Mapping[str, str]
+    :return: The headers without those describing the encoded body
+    :rtype: Dict[str, str]
+    """
+    decoded = dict(headers)
+    for name in _ENCODED_BODY_HEADERS:
+        decoded.pop(name, None)
+    return decoded
+
+
+class CachedResponse(BaseModel):  # type: ignore[explicit-any]
+    """
+    A response stored in the cache.
+
+    :ivar status_code: HTTP status code
+    :vartype status_code: int
+    :ivar reason: HTTP reason phrase
+    :vartype reason: str
+    :ivar url: The prepared URL
+    :vartype url: str
+    :ivar headers: Response headers, lower cased
+    :vartype headers: Dict[str, str]
+    :ivar content: Response body
+    :vartype content: bytes
+    :ivar expires_at: Epoch time the response becomes stale
+    :vartype expires_at: float
+    :ivar vary: Request header values the response varies on
+    :vartype vary: Dict[str, str]
+    """
+
+    status_code: int
+    reason: str
+    url: str
+    headers: Dict[str, str]
+    content: bytes = b""
+    expires_at: float
+    vary: Dict[str, str] = {}
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Return the entity tag validator.
+
+        :return: The ETag header
+        :rtype: Optional[str]
+        """
+        return self.headers.get(_ETAG)
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Return the Last-Modified validator.
+
+        :return: The Last-Modified header
+        :rtype: Optional[str]
+        """
+        return self.headers.get(_LAST_MODIFIED)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Return True if the response can be served without revalidation.
+
+        :param now: Epoch time, defaults to None for the current time
+        :type now: Optional[float], optional
+        :return: True if fresh
+        :rtype: bool
+        """
+        return (time.time() if now is None else now) < self.expires_at
+
+    def to_response(self) -> Response:
+        """Rebuild a requests Response from the cached response.
+
+        :return: The response
+        :rtype: Response
+        """
+        resp = Response()
+        resp.status_code = self.status_code
+        resp.reason = self.reason
+        resp.url = self.url
+        resp.headers = CaseInsensitiveDict(self.headers)
+        resp._content = self.content  # noqa: WPS437
+        return resp
+
+
+class CacheBackend(ABC):
+    """Storage of cached responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the response stored under key marking it recently used.
+
+        :param key: The cache key
+        :type key: str
+        :return: The cached response if any
+        :rtype: Optional[CachedResponse]
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:  # noqa: WPS125
+        """Store a response, evicting the least recently used when full.
+
+        :param key: The cache key
+        :type key: str
+        :param entry: The response to store
+        :type entry: CachedResponse
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the response stored under key.
+
+        :param key: The cache key
+        :type key: str
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the stored responses."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+
+
+class MemoryCache(CacheBackend):
+    """In memory LRU storage of cached responses.
+
+    :param maxsize: Maximum number of responses, defaults to 256
+    :type maxsize: int, optional
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Construct a MemoryCache object."""
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the response stored under key marking it recently used.
+
+        :param key: The cache key
+        :type key: str
+        :return: The cached response if any
+        :rtype: Optional[CachedResponse]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:  # noqa: WPS125
+        """Store a response, evicting the least recently used when full.
+
+        :param key: The cache key
+        :type key: str
+        :param entry: The response to store
+        :type entry: CachedResponse
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove the response stored under key.
+
+        :param key: The cache key
+        :type key: str
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the stored responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """On disk LRU storage of cached responses.
+
+    Each response is stored as a JSON metadata file next to a raw body file,
+    both are read and written under a lock so a reader never mixes two entries.
+    Recency is tracked in memory, loaded from the file modification times when
+    the cache is opened, so a write never scans the directory.
+
+    :param directory: Cache directory, created if missing
+    :type directory: Union[str, Path]
+    :param maxsize: Maximum number of responses, defaults to 1024
+    :type maxsize: int, optional
+    """
+
+    def __init__(self, directory: Union[str, Path], maxsize: int = 1024) -> None:
+        """Construct a DiskCache object."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        metas = sorted(
+            self.directory.glob("*.json"),
+            key=lambda meta: meta.stat().st_mtime,
+        )
+        self._recency: "OrderedDict[str, None]" = OrderedDict(
+            (meta.stem, None) for meta in metas
+        )
+        with self._lock:
+            self._evict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the response stored under key marking it recently used.
+
+        :param key: The cache key
+        :type key: str
+        :return: The cached response if any
+        :rtype: Optional[CachedResponse]
+        """
+        meta, body = self._paths(key)
+        with self._lock:
+            try:
+                raw_meta = meta.read_bytes()
+                content = body.read_bytes()
+                os.utime(meta)
+            except OSError:
+                return None
+            if meta.stem in self._recency:
+                self._recency.move_to_end(meta.stem)
+        try:
+            entry = CachedResponse.model_validate_json(raw_meta)
+        except ValueError:
+            return None
+        entry.content = content
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:  # noqa: WPS125
+        """Store a response, evicting the least recently used when full.
+
+        :param key: The cache key
+        :type key: str
+        :param entry: The response to store
+        :type entry: CachedResponse
+        """
+        meta, body = self._paths(key)
+        with self._lock:
+            self._write(body, entry.content)
+            self._write(meta, entry.model_dump_json(exclude={"content"}).encode())
+            self._recency[meta.stem] = None
+            self._recency.move_to_end(meta.stem)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove the response stored under key.
+
+        :param key: The cache key
+        :type key: str
+        """
+        meta, body = self._paths(key)
+        with self._lock:
+            self._recency.pop(meta.stem, None)
+            meta.unlink(missing_ok=True)
+            body.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all the stored responses."""
+        with self._lock:
+            for meta in self.directory.glob("*.json"):
+                meta.unlink(missing_ok=True)
+                meta.with_suffix(".body").unlink(missing_ok=True)
+            self._recency.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        return len(self._recency)
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return (
+            self.directory / "{0}.json".format(digest),
+            self.directory / "{0}.body".format(digest),
+        )
+
+    def _write(self, path: Path, content: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp, path)
+
+    def _evict(self) -> None:
+        """Remove the least recently used responses past maxsize, the lock is held."""
+        while len(self._recency) > self.maxsize:
+            digest, _ = self._recency.popitem(last=False)
+            (self.directory / "{0}.json".format(digest)).unlink(missing_ok=True)
+            (self.directory / "{0}.body".format(digest)).unlink(missing_ok=True)
+
+
+class ResponseCache:
+    """HTTP caching policy over a storage backend.
+
+    :param backend: Storage of the responses, defaults to a MemoryCache
+    :type backend: Optional[CacheBackend], optional
+    :param default_ttl: Time to live in seconds of responses without caching
+        headers, defaults to None to store them only when they can be revalidated
+    :type default_ttl: Optional[float], optional
+    :param vary: Request headers included in the cache key,
+        defaults to ("Accept", "Authorization")
+    :type vary: Iterable[str], optional
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        default_ttl: Optional[float] = None,
+        vary: Iterable[str] = ("Accept", "Authorization"),
+    ) -> None:
+        """Construct a ResponseCache object."""
+        self.backend = MemoryCache() if backend is None else backend
+        self.default_ttl = default_ttl
+        self.vary = tuple(vary)
+
+    def key(self, method: str, url: str, headers: Mapping[str, str]) -> str:
+        """Return the cache key of a request.
+
+        :param method: Request method
+        :type method: str
+        :param url: Prepared URL
+        :type url: str
+        :param headers: Request headers
+        :type headers: Mapping[str, str]
+        :return: The cache key
+        :rtype: str
+        """
+        varying = "\n".join(headers.get(name, "") for name in self.vary)
+        return "\n".join((method.upper(), url, varying))
+
+    def lookup(
+        self,
+        key: str,
+        headers: Mapping[str, str],
+    ) -> Optional[CachedResponse]:
+        """Return the response cached for a request.
+
+        :param key: The cache key
+        :type key: str
+        :param headers: Request headers
+        :type headers: Mapping[str, str]
+        :return: The cached response, fresh or stale, if any
+        :rtype: Optional[CachedResponse]
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        for name, valor in entry.vary.items():
+            if headers.get(name, "") != valor:
+                return None
+        return entry
+
+    @classmethod
+    def conditional_headers(cls, entry: CachedResponse) -> Dict[str, str]:
+        """Return the headers revalidating a stale response.
+
+        :param entry: The stale response
+        :type entry: CachedResponse
+        :return: If-None-Match and If-Modified-Since headers
+        :rtype: Dict[str, str]
+        """
+        conditional: Dict[str, str] = {}
+        if entry.etag is not None:
+            conditional["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            conditional["If-Modified-Since"] = entry.last_modified
+        return conditional
+
+    def store(  # noqa: WPS211
+        self,
+        key: str,
+        url: str,
+        status_code: int,
+        reason: str,
+        response_headers: Mapping[str, str],
+        content: bytes,
+        request_headers: Mapping[str, str],
+        ttl: Optional[float] = None,
+    ) -> Optional[CachedResponse]:
+        """Store a response if its headers allow it.
+
+        :param key: The cache key
+        :type key: str
+        :param url: Prepared URL
+        :type url: str
+        :param status_code: HTTP status code
+        :type status_code: int
+        :param reason: HTTP reason phrase
+        :type reason: str
+        :param response_headers: Response headers, lower cased
+        :type response_headers: Mapping[str, str]
+        :param content: Response body
+        :type content: bytes
+        :param request_headers: Request headers
+        :type request_headers: Mapping[str, str]
+        :param ttl: Time to live overriding the caching headers, defaults to None
+        :type ttl: Optional[float], optional
+        :return: The stored response if any
+        :rtype: Optional[CachedResponse]
+        """
+        lifetime = self.lifetime(response_headers, ttl)
+        vary = self._vary(response_headers, request_headers)
+        if lifetime is None or vary is None:
+            return None
+        entry = CachedResponse(
+            status_code=status_code,
+            reason=reason,
+            url=url,
+            headers=_decoded_headers(response_headers),
+            content=content,
+            expires_at=time.time() + lifetime,
+            vary=vary,
+        )
+        self.backend.set(key, entry)
+        return entry
+
+    def refresh(
+        self,
+        key: str,
+        entry: CachedResponse,
+        response_headers: Mapping[str, str],
+        ttl: Optional[float] = None,
+    ) -> CachedResponse:
+        """Refresh a stale response after a 304 Not Modified.
+
+        :param key: The cache key
+        :type key: str
+        :param entry: The stale response
+        :type entry: CachedResponse
+        :param response_headers: Headers of the 304 response, lower cased
+        :type response_headers: Mapping[str, str]
+        :param ttl: Time to live overriding the caching headers, defaults to None
+        :type ttl: Optional[float], optional
+        :return: The refreshed response
+        :rtype: CachedResponse
+        """
+        headers = dict(entry.headers)
+        headers.update(response_headers)
+        headers = _decoded_headers(headers)
+        lifetime = self.lifetime(headers, ttl) or 0
+        entry = entry.model_copy(
+            update={"headers": headers, "expires_at": time.time() + lifetime},
+        )
+        self.backend.set(key, entry)
+        return entry
+
+    def lifetime(
+        self,
+        headers: Mapping[str, str],
+        ttl: Optional[float] = None,
+    ) -> Optional[float]:
+        """Return how long a response stays fresh.
+
+        :param headers: Response headers, lower cased
+        :type headers: Mapping[str, str]
+        :param ttl: Time to live overriding the caching headers, defaults to None
+        :type ttl: Optional[float], optional
+        :return: Seconds the response is fresh, None if it must not be stored
+        :rtype: Optional[float]
+        """
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if ttl is not None:
+            return ttl
+        if "no-cache" in cache_control:
+            return 0
+        max_age = _MAX_AGE.search(cache_control)
+        if max_age:
+            age = headers.get("age", "0")
+            return max(float(max_age[1]) - (float(age) if age.isdigit() else 0), 0)
+        if "expires" in headers:
+            return self._expires(headers)
+        if self.default_ttl is not None:
+            return self.default_ttl
+        if _ETAG in headers or _LAST_MODIFIED in headers:
+            return 0
+        return None
+
+    @classmethod
+    def _expires(cls, headers: Mapping[str, str]) -> float:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+            date = headers.get("date")
+            now = time.time() if date is None else parsedate_to_datetime(date)
+        except (TypeError, ValueError):
+            return 0
+        if not isinstance(now, float):
+            now = now.timestamp()
+        return max(expires - now, 0)
+
+    @classmethod
+    def _vary(
+        cls,
+        response_headers: Mapping[str, str],
+        request_headers: Mapping[str, str],
+    ) -> Optional[Dict[str, str]]:
+        vary = response_headers.get("vary")
+        if vary is None:
+            return {}
+        if vary.strip() == "*":
+            return None
+        names = (name.strip() for name in vary.split(","))
+        return {name: request_headers.get(name, "") for name in names if name}
@@ -0,0 +1,154 @@
+"""
+Coalesce module for the package api_client of rest-api-client-framework library.
+
+Identical requests made concurrently are coalesced into a single flight: the
+first caller sends the request, the others wait for it and share its outcome.
+
+Classes:
+    SingleFlight
+    AsyncSingleFlight
+
+Functions:
+    flight_key
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Mapping, Tuple, TypeVar, cast
+
+ResultT = TypeVar("ResultT")
+
+FlightKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def flight_key(method: str, url: str, headers: Mapping[str, str]) -> FlightKey:
+    """Return the key identifying a request in flight.
+
+    :param method: HTTP method
+    :type method: str
+    :param url: Prepared url
+    :type url: str
+    :param headers: Request headers
+    :type headers: Mapping[str, str]
+    :return: The key
+    :rtype: FlightKey
+    """
+    heads = tuple(sorted((name.lower(), value) for name, value in headers.items()))
+    return method.upper(), url, heads
+
+
+class SingleFlight:
+    """Coalesce identical calls made concurrently from several threads."""
+
+    def __init__(self) -> None:
+        """Construct a SingleFlight object."""
+        self._lock = threading.Lock()
+        self._calls: Dict[FlightKey, "Future[object]"] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight.
+
+        :return: Number of calls in flight
+        :rtype: int
+        """
+        return len(self._calls)
+
+    def do(self, key: FlightKey, func: Callable[[], ResultT]) -> ResultT:
+        """Call func unless a call with the same key is in flight.
+
+        Callers arriving while the call runs wait for it and receive the same
+        result, or the same exception is raised in every one of them.
+
+        :param key: Key of the call
+        :type key: FlightKey
+        :param func: The call
+        :type func: Callable[[], ResultT]
+        :return: The result of the call
+        :rtype: ResultT
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = Future()
+                self._calls[key] = call
+        if not leader:
+            return cast(ResultT, call.result())
+        try:
+            outcome = func()
+        except BaseException as ex:
+            call.set_exception(ex)
+            raise
+        else:
+            call.set_result(outcome)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+        return outcome
+
+
+class _LeaderCancelledError(Exception):
+    """The task leading a call was cancelled before the call completed."""
+
+
+class AsyncSingleFlight:
+    """Coalesce identical calls made concurrently from several tasks."""
+
+    def __init__(self) -> None:
+        """Construct an AsyncSingleFlight object."""
+        self._calls: Dict[Tuple[int, FlightKey], "asyncio.Future[object]"] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight.
+
+        :return: Number of calls in flight
+        :rtype: int
+        """
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: FlightKey,
+        func: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Await func unless a call with the same key is in flight.
+
+        Calls are coalesced per event loop. Cancelling a waiter does not cancel
+        the call. When the leader is cancelled the waiters start the call over,
+        the first of them leading it.
+
+        :param key: Key of the call
+        :type key: FlightKey
+        :param func: The call
+        :type func: Callable[[], Awaitable[ResultT]]
+        :return: The result of the call
+        :rtype: ResultT
+        """
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        call = self._calls.get(slot)
+        while call is not None:
+            try:
+                shared = await asyncio.shield(call)
+            except _LeaderCancelledError:
+                call = self._calls.get(slot)
+            else:
+                return cast(ResultT, shared)
+        call = loop.create_future()
+        self._calls[slot] = call
+        try:
+            outcome = await func()
+        except asyncio.CancelledError:
+            call.set_exception(_LeaderCancelledError())
+            call.exception()  # only waiters retrieve it, do not log it
+            raise
+        except BaseException as ex:
+            call.set_exception(ex)
+            call.exception()  # the leader raises it, do not log it as unretrieved
+            raise
+        else:
+            call.set_result(outcome)
+        finally:
+            self._calls.pop(slot, None)
+        return outcome
@@ -0,0 +1,241 @@
+"""
+Codec module for the package api_client of rest-api-client-framework library.
+
+JSON is encoded to and decoded from bytes by a codec. The fastest installed
+library is used by default: orjson, then msgspec, then the standard library.
+
+Variables:
+    HAS_ORJSON
+    HAS_MSGSPEC
+
+Classes:
+    JsonCodec
+    StdlibCodec
+    OrjsonCodec
+    MsgspecCodec
+
+Functions:
+    model_adapter
+    available_codecs
+    get_codec
+    default_codec
+    set_default_codec
+"""
+
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, Union
+
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    HAS_MSGSPEC = False
+else:
+    HAS_MSGSPEC = True
+
+
+class JsonCodec(ABC):
+    """Base class of the JSON codecs."""
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:  # type: ignore[explicit-any]
+        """Encode an object to JSON bytes.
+
+        :param obj: The object to encode
+        :type obj: Any
+        :return: JSON document
+        :rtype: bytes
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:  # type: ignore[explicit-any]
+        """Decode a JSON document.
+
+        :param data: JSON document
+        :type data: Union[bytes, str]
+        :raises ValueError: If data is not a valid JSON document
+        :return: The decoded object
+        :rtype: Any
+        """
+
+
+class StdlibCodec(JsonCodec):
+    """JSON codec using the standard library json module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:  # type: ignore[explicit-any]
+        """Encode an object to compact JSON bytes.
+
+        :param obj: The object to encode
+        :type obj: Any
+        :return: JSON document
+        :rtype: bytes
+        """
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # type: ignore[explicit-any]
+        """Decode a JSON document.
+
+        :param data: JSON document
+        :type data: Union[bytes, str]
+        :return: The decoded object
+        :rtype: Any
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:  # type: ignore[explicit-any]
+        """Encode an object to JSON bytes.
+
+        :param obj: The object to encode
+        :type obj: Any
+        :return: JSON document
+        :rtype: bytes
+        """
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # type: ignore[explicit-any]
+        """Decode a JSON document.
+
+        :param data: JSON document
+        :type data: Union[bytes, str]
+        :return: The decoded object
+        :rtype: Any
+        """
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec using msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Construct a MsgspecCodec object reusing one encoder and decoder."""
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:  # type: ignore[explicit-any]
+        """Encode an object to JSON bytes.
+
+        :param obj: The object to encode
+        :type obj: Any
+        :return: JSON document
+        :rtype: bytes
+        """
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:  # type: ignore[explicit-any]
+        """Decode a JSON document.
+
+        :param data: JSON document
+        :type data: Union[bytes, str]
+        :raises ValueError: If data is not a valid JSON document
+        :return: The decoded object
+        :rtype: Any
+        """
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as ex:
+            raise ValueError(str(ex)) from ex
+
+
+_CODEC_CLASSES: Dict[str, Type[JsonCodec]] = {StdlibCodec.name: StdlibCodec}
+if HAS_MSGSPEC:
+    _CODEC_CLASSES[MsgspecCodec.name] = MsgspecCodec
+if HAS_ORJSON:
+    _CODEC_CLASSES[OrjsonCodec.name] = OrjsonCodec
+
+_PREFERENCE = (OrjsonCodec.name, MsgspecCodec.name, StdlibCodec.name)
+
+_codecs: Dict[str, JsonCodec] = {}
+_default: Optional[JsonCodec] = None
+
+
+@lru_cache(maxsize=None)
+def model_adapter(model: type) -> TypeAdapter[Any]:  # type: ignore[explicit-any]
+    """Return the cached validator of a response model.
+
+    The adapter validates JSON bytes directly into the model in pydantic-core,
+    without an intermediate decoded object.
+
+    :param model: The model type
+    :type model: type
+    :return: The type adapter
+    :rtype: TypeAdapter[Any]
+    """
+    return TypeAdapter(model)
+
+
+def available_codecs() -> List[str]:
+    """Return the names of the installed codecs, fastest first.
+
+    :return: Codec names
+    :rtype: List[str]
+    """
+    return [name for name in _PREFERENCE if name in _CODEC_CLASSES]
+
+
+def get_codec(codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """Return a codec.
+
+    :param codec: Codec name or instance, defaults to None for the default codec
+    :type codec: Optional[Union[str, JsonCodec]], optional
+    :raises ValueError: If the named codec is not installed
+    :return: The codec
+    :rtype: JsonCodec
+    """
+    if codec is None:
+        return default_codec()
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec not in _CODEC_CLASSES:
+        raise ValueError(
+            "JSON codec {0} is not available, choose one of {1}.".format(
+                codec,
+                ", ".join(available_codecs()),
+            ),
+        )
+    if codec not in _codecs:
+        _codecs[codec] = _CODEC_CLASSES[codec]()
+    return _codecs[codec]
+
+
+def default_codec() -> JsonCodec:
+    """Return the default codec, the fastest installed unless set otherwise.
+
+    :return: The default codec
+    :rtype: JsonCodec
+    """
+    global _default  # noqa: WPS420
+    if _default is None:
+        _default = get_codec(available_codecs()[0])  # noqa: WPS442
+    return _default
+
+
+def set_default_codec(codec: Union[str, JsonCodec]) -> None:
+    """Set the codec used when none is given.
+
+    :param codec: Codec name or instance
+    :type codec: Union[str, JsonCodec]
+    """
+    global _default  # noqa: WPS420
+    _default = get_codec(codec)  # noqa: WPS442
@@ -0,0 +1,161 @@
+"""
+Compression module for the package api_client of rest-api-client-framework library.
+
+Response bodies are decoded by the transports, which support brotli and zstd
+when their libraries are installed: the encodings advertised to the servers
+follow what urllib3, for the requests session, and httpx can decode.
+Request bodies are compressed chunk by chunk, so only one compressed chunk is
+held in memory next to the serialized body.
+
+Variables:
+    HAS_BROTLI
+    HAS_ZSTD
+    ACCEPT_ENCODING
+    ASYNC_ACCEPT_ENCODING
+    REQUEST_ENCODINGS
+
+Functions:
+    compress_chunks
+    acompress_chunks
+"""
+
+import asyncio
+import zlib
+from importlib.util import find_spec
+from typing import AsyncIterator, Iterable, Iterator, Protocol, Union
+
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+
+# Only the transports decode brotli, its presence is all that matters here.
+# httpx decodes zstd with zstandard, urllib3 with backports.zstd.
+HAS_BROTLI = any(find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    HAS_ZSTD = False
+else:
+    HAS_ZSTD = True
+
+CHUNK_SIZE = 64 * 1024
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+ACCEPT_ENCODING = ", ".join(URLLIB3_ACCEPT_ENCODING.split(","))
+ASYNC_ACCEPT_ENCODING = ", ".join(
+    encoding
+    for encoding, available in (
+        ("gzip", True),
+        ("deflate", True),
+        ("br", HAS_BROTLI),
+        ("zstd", HAS_ZSTD),
+    )
+    if available
+)
+REQUEST_ENCODINGS = frozenset(("gzip", "zstd") if HAS_ZSTD else ("gzip",))
+
+MISSING_ZSTD_MSG = (
+    "zstd compression needs zstandard, "
+    "install it with: pip install 'rest-api-client-framework[compression]'"
+)
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+Chunks = Union[bytes, Iterable[Union[bytes, memoryview]]]
+
+
+class _Compressor(Protocol):
+    """Incremental compressor."""
+
+    def compress(self, data: Union[bytes, memoryview]) -> bytes:
+        """Compress a chunk."""
+
+    def flush(self) -> bytes:
+        """Return the end of the compressed stream."""
+
+
+def _compressor(encoding: str) -> _Compressor:
+    """Create an incremental compressor.
+
+    :param encoding: Content encoding, gzip or zstd
+    :type encoding: str
+    :raises ImportError: If zstd is asked and zstandard is not installed
+    :raises ValueError: If the encoding is not supported
+    :return: The compressor
+    :rtype: _Compressor
+    """
+    if encoding == "gzip":
+        return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+    if encoding == "zstd":
+        if not HAS_ZSTD:  # pragma: no cover
+            raise ImportError(MISSING_ZSTD_MSG)
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    raise ValueError("Unsupported request content encoding '{0}'.".format(encoding))
+
+
+def compress_chunks(
+    body: Chunks,
+    encoding: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Compress a body chunk by chunk.
+
+    Bytes are read through memoryview slices and are not copied.
+
+    :param body: The body to compress, bytes or an iterable of chunks
+    :type body: Chunks
+    :param encoding: Content encoding, gzip or zstd
+    :type encoding: str
+    :param chunk_size: Size of the uncompressed chunks, defaults to 64 KiB
+    :type chunk_size: int, optional
+    :yield: Compressed chunks
+    :rtype: Iterator[bytes]
+    """
+    compressor = _compressor(encoding)
+    for chunk in _slices(body, chunk_size) if isinstance(body, bytes) else body:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def acompress_chunks(
+    body: Chunks,
+    encoding: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Compress a body chunk by chunk for the asynchronous client.
+
+    The body is read and compressed in a worker thread, so the event loop is
+    not blocked.
+
+    :param body: The body to compress, bytes or an iterable of chunks
+    :type body: Chunks
+    :param encoding: Content encoding, gzip or zstd
+    :type encoding: str
+    :param chunk_size: Size of the uncompressed chunks, defaults to 64 KiB
+    :type chunk_size: int, optional
+    :yield: Compressed chunks
+    :rtype: AsyncIterator[bytes]
+    """
+    chunks = compress_chunks(body, encoding, chunk_size)
+    while True:  # noqa: WPS457
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _slices(body: bytes, chunk_size: int) -> Iterator[memoryview]:
+    """Slice bytes without copy.
+
+    :param body: The bytes
+    :type body: bytes
+    :param chunk_size: Size of the slices
+    :type chunk_size: int
+    :yield: The slices
+    :rtype: Iterator[memoryview]
+    """
+    view = memoryview(body)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
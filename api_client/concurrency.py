@@ -0,0 +1,107 @@
+"""
+Concurrency module for the package api_client of rest-api-client-framework library.
+
+Functions:
+    bounded_map
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Iterable, Iterator, Set, TypeVar, Union
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+OutcomeT = TypeVar("OutcomeT")
+
+
+def bounded_map(
+    func: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    max_workers: int,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> Iterator[Union[ResultT, Exception]]:
+    """Map func over items on a thread pool keeping a bounded number in flight.
+
+    At most ``2 * max_workers`` items are taken from the iterable before their
+    results are consumed, so arbitrarily long iterables run in constant memory.
+
+    :param func: Function applied to each item
+    :type func: Callable[[ItemT], ResultT]
+    :param items: Items to process, consumed lazily
+    :type items: Iterable[ItemT]
+    :param max_workers: Number of worker threads
+    :type max_workers: int
+    :param ordered: Yield results in input order, otherwise in completion order,
+        defaults to True
+    :type ordered: bool, optional
+    :param return_exceptions: Yield exceptions instead of raising them,
+        defaults to False
+    :type return_exceptions: bool, optional
+    :raises ValueError: If max_workers is less than 1
+    :yield: The result of each call
+    :rtype: Iterator[Union[ResultT, Exception]]
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    window = max_workers * 2
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        if ordered:
+            yield from _ordered(executor, func, items, window, return_exceptions)
+        else:
+            yield from _unordered(executor, func, items, window, return_exceptions)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _ordered(
+    executor: ThreadPoolExecutor,
+    func: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    window: int,
+    return_exceptions: bool,
+) -> Iterator[Union[ResultT, Exception]]:
+    pending: Deque[Future[ResultT]] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            outcome = _outcome(pending.popleft(), return_exceptions)
+            yield outcome
+    while pending:
+        outcome = _outcome(pending.popleft(), return_exceptions)
+        yield outcome
+
+
+def _unordered(
+    executor: ThreadPoolExecutor,
+    func: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    window: int,
+    return_exceptions: bool,
+) -> Iterator[Union[ResultT, Exception]]:
+    pending: Set[Future[ResultT]] = set()
+    for item in items:
+        pending.add(executor.submit(func, item))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = _outcome(future, return_exceptions)
+                yield outcome
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            outcome = _outcome(future, return_exceptions)
+            yield outcome
+
+
+def _outcome(
+    future: "Future[OutcomeT]",
+    return_exceptions: bool,
+) -> Union[OutcomeT, Exception]:
+    if not return_exceptions:
+        return future.result()
+    try:
+        return future.result()
+    except Exception as ex:
+        return ex
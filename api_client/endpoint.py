@@ -8,18 +8,26 @@ Variables:
 Classes:
     HTTPMethod
     Endpoint
+    EndpointTemplate
 """
 
+import logging
 import re
 from enum import Enum
+from string import Formatter
 from types import MappingProxyType
-from typing import List, Optional, Tuple, Union
+from typing import Any, FrozenSet, List, Mapping, Optional, Tuple, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 
+from api_client.codec import model_adapter
+from api_client.compression import REQUEST_ENCODINGS
 from api_client.exception import MissingArgumentError, MissingMethodNameError
-from api_client.logger import logger
+from api_client.logger import logger, redact_url
+from api_client.pagination import Pagination
 from api_client.payload import IntStrBool
+from api_client.ratelimit import TokenBucket
+from api_client.retry import RetryPolicy
 
 SUPPORTED_REQUEST_METHODS = frozenset(("get", "post", "put", "patch", "delete"))
 REQUEST_METHOD_ALIASES = MappingProxyType({"create": "post", "update": "put"})
@@ -71,14 +79,57 @@ class Endpoint(BaseModel):  # type: ignore[explicit-any]
     :vartype name: BaseModel
     :ivar query_parameters: List of query parameters
     :vartype name: List[str]
+    :ivar stream: Stream response bodies instead of reading them eagerly
+    :vartype stream: bool
+    :ivar cache_ttl: Cache time to live overriding the response headers
+    :vartype cache_ttl: Optional[float]
+    :ivar retry: Retry policy overriding the one of the RestRequest
+    :vartype retry: Optional[RetryPolicy]
+    :ivar rate_limit: Rate limiter of the endpoint, applied with the one of the
+        RestRequest
+    :vartype rate_limit: Optional[TokenBucket]
+    :ivar compress: Content encoding of the request bodies, gzip or zstd,
+        defaults to None to send them uncompressed
+    :vartype compress: Optional[str]
+    :ivar compress_min_size: Smallest body compressed, in bytes
+    :vartype compress_min_size: int
+    :ivar pagination: Pagination of the results, its query parameters are
+        allowed along with query_parameters
+    :vartype pagination: Optional[Pagination]
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     name: str
     path: str
     request_method: Optional[HTTPMethod] = None
     model: Optional[type] = None
     query_parameters: Optional[List[str]] = None
     timeout: ReqTimeOut = (6.1, 20)
+    stream: bool = False
+    cache_ttl: Optional[float] = None
+    retry: Optional[RetryPolicy] = None
+    rate_limit: Optional[TokenBucket] = None
+    compress: Optional[str] = None
+    compress_min_size: int = 1024
+    pagination: Optional[Pagination] = None
+
+    @field_validator("compress")
+    @classmethod
+    def _check_compress(cls, compress: Optional[str]) -> Optional[str]:
+        """Check the request content encoding is supported.
+
+        :param compress: Content encoding
+        :type compress: Optional[str]
+        :raises ValueError: If the encoding is not supported
+        :return: The content encoding
+        :rtype: Optional[str]
+        """
+        if compress is not None and compress not in REQUEST_ENCODINGS:
+            raise ValueError(
+                "compress must be one of {0}".format(sorted(REQUEST_ENCODINGS)),
+            )
+        return compress
 
     def prepare(self, url_root: str, **kwargs: IntStrBool) -> Tuple[str, HTTPMethod]:
         """Prepare the endpoint url.
@@ -95,9 +146,57 @@ class Endpoint(BaseModel):  # type: ignore[explicit-any]
         path = self._prepare_path(**kwargs)
         # url = "{0}/{1}{2}".format(url_root.rstrip("/"), path.strip("/"), query)
         url = multi_urljoin(url_root, path, query)
-        logger.debug("url: {0}".format(url))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("url: %s", redact_url(url))
         return url, self.request_method
 
+    def compile(self, url_root: str) -> "EndpointTemplate":
+        """Compile the endpoint into a reusable url template.
+
+        All the path constant work of :meth:`prepare` is done once here, the
+        template then builds urls in a single pass without regular expressions.
+
+        :param url_root: The api endpoint root path
+        :type url_root: str
+        :return: The compiled template
+        :rtype: EndpointTemplate
+        """
+        request_method = self.request_method or self._method_from_name()
+        root = url_root.strip("/")
+        segments: List[str] = []
+        slots: List[Tuple[str, str]] = []
+        if self._path_parameters() is None:
+            segments.append(self.path)
+        else:
+            segments.append("")
+            for literal, field, spec, conversion in Formatter().parse(self.path):
+                segments[-1] = "{0}{1}".format(segments[-1], literal)
+                if field is not None:
+                    if conversion:
+                        raise ValueError(
+                            "Conversion !{0} unsupported in path {1}.".format(
+                                conversion,
+                                self.path,
+                            ),
+                        )
+                    slots.append((field, spec or ""))
+                    segments.append("")
+        if not slots:
+            root = multi_urljoin(root, segments[0])
+        parameters = list(self.query_parameters or ())
+        if self.pagination is not None:
+            parameters.extend(self.pagination.parameters)
+        query_keys = frozenset(parameters) if parameters else None
+        return EndpointTemplate(
+            endpoint=self,
+            method=request_method,
+            root=root,
+            segments=tuple(segments),
+            slots=tuple(slots),
+            query_keys=query_keys,
+            adapter=None if self.model is None else model_adapter(self.model),
+        )
+
     def _method_from_name(self) -> HTTPMethod:
         """Extract request_method type from the instance name.
 
@@ -175,3 +274,80 @@ class Endpoint(BaseModel):  # type: ignore[explicit-any]
         for parameter in variables:
             path_parameters.append(re.sub("{|}", "", str(parameter)))
         return path_parameters
+
+
+class EndpointTemplate(BaseModel):  # type: ignore[explicit-any]
+    """
+    Immutable url template of an Endpoint compiled for an api root.
+
+    :ivar endpoint: The compiled endpoint
+    :vartype endpoint: Endpoint
+    :ivar method: The resolved request method
+    :vartype method: HTTPMethod
+    :ivar root: The api root, joined with the path when it has no parameters
+    :vartype root: str
+    :ivar segments: Literal path segments surrounding the parameter slots
+    :vartype segments: Tuple[str, ...]
+    :ivar slots: Path parameter names and format specs
+    :vartype slots: Tuple[Tuple[str, str], ...]
+    :ivar query_keys: Allowed query parameters
+    :vartype query_keys: Optional[FrozenSet[str]]
+    :ivar adapter: Validator of the endpoint response model
+    :vartype adapter: Optional[TypeAdapter[Any]]
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    endpoint: Endpoint
+    method: HTTPMethod
+    root: str
+    segments: Tuple[str, ...]
+    slots: Tuple[Tuple[str, str], ...]
+    query_keys: Optional[FrozenSet[str]] = None
+    adapter: Optional[TypeAdapter[Any]] = None  # type: ignore[explicit-any]
+
+    def build(self, **kwargs: IntStrBool) -> str:
+        """Build the url of a call.
+
+        :raises MissingArgumentError: If a path variable is not specified in kwargs
+        :return: Prepared URL
+        :rtype: str
+        """
+        url = self.root
+        if self.slots:
+            parts = [self.segments[0]]
+            for (slot, spec), segment in zip(self.slots, self.segments[1:]):
+                try:
+                    parts.append(format(kwargs[slot], spec))
+                except KeyError:
+                    raise MissingArgumentError(repr(slot))
+                parts.append(segment)
+            path = "".join(parts).strip("/")
+            if path:
+                url = "/".join((url, path))
+        if self.query_keys is not None:
+            url = "?".join((url, self._query(kwargs)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("url: %s", redact_url(url))
+        return url
+
+    def _query(self, kwargs: Mapping[str, IntStrBool]) -> str:
+        """Join the allowed query parameters of a call.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :return: Prepared query without the leading question mark
+        :rtype: str
+        """
+        query_keys = self.query_keys or frozenset()
+        valors = []
+        for key, valor in kwargs.items():
+            if key in query_keys:
+                # since bool is an instance of int, we test it before int
+                if valor is True:
+                    valors.append("=".join((key, "true")))
+                elif valor is False:
+                    valors.append("=".join((key, "false")))
+                else:
+                    valors.append("=".join((key, str(valor))))
+        return "&".join(valors)
@@ -5,6 +5,7 @@ Classes:
     PathParamSubError
     MissingMethodNameError
     ApiClientError
+    CircuitOpenError
 """
 
 from http import HTTPStatus
@@ -117,3 +118,29 @@ class ApiClientError(Exception):
         if status == HTTPStatus.UNAUTHORIZED:
             return "{0} (Check your api token)".format(status.description)
         return status.description
+
+
+class CircuitOpenError(ApiClientError):
+    """Request refused without being sent because the circuit is open.
+
+    :param host: The host of the open circuit
+    :type host: str
+    :param retry_after: Seconds until a trial request is let through
+    :type retry_after: float
+    :param half_open: The circuit is half open with its trial requests in
+        flight, defaults to False
+    :type half_open: bool, optional
+    """
+
+    def __init__(self, host: str, retry_after: float, half_open: bool = False) -> None:
+        """Construct a CircuitOpenError object."""
+        if half_open:
+            reason = (
+                "Circuit half open for {0}, trial in flight, retry in at most {1:.1f}s"
+            )
+        else:
+            reason = "Circuit open for {0}, retry in {1:.1f}s"
+        super().__init__(status=0, reason=reason.format(host, retry_after))
+        self.host = host
+        self.retry_after = retry_after
+        self.half_open = half_open
@@ -0,0 +1,233 @@
+"""
+Hooks module for the package api_client of rest-api-client-framework library.
+
+Hooks registered on a RestRequest receive a RequestTiming record of each call.
+No record is built and no clock is read while no hook is registered.
+
+Classes:
+    RequestTiming
+    Hooks
+"""
+
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from api_client.exception import ApiClientError
+from api_client.logger import logger
+from api_client.response import RestResponse
+
+_TRACE_SPANS = (
+    ("connect_tcp", "connect"),
+    ("start_tls", "tls"),
+)
+
+
+class RequestTiming(BaseModel):  # type: ignore[explicit-any]
+    """
+    Timing record of an endpoint call, durations are in seconds.
+
+    :ivar endpoint: Endpoint name
+    :vartype endpoint: str
+    :ivar method: Request method
+    :vartype method: str
+    :ivar url: Prepared url
+    :vartype url: str
+    :ivar attempts: Number of attempts sent
+    :vartype attempts: int
+    :ivar status_code: Final response status, None on transport error
+    :vartype status_code: Optional[int]
+    :ivar started: time.perf_counter() at the start of the call
+    :vartype started: float
+    :ivar prepare_url: Endpoint lookup and url building
+    :vartype prepare_url: Optional[float]
+    :ivar prepare_headers: Header preparation
+    :vartype prepare_headers: Optional[float]
+    :ivar connect: TCP connection, name resolution included, when a new
+        connection is opened by the asynchronous client
+    :vartype connect: Optional[float]
+    :ivar tls: TLS handshake, when a new connection is opened by the
+        asynchronous client
+    :vartype tls: Optional[float]
+    :ivar ttfb: From sending the last attempt to its response headers
+    :vartype ttfb: Optional[float]
+    :ivar download: Reading the body, None when it is streamed
+    :vartype download: Optional[float]
+    :ivar decode: Decoding the body, set when data() or parsed() first decodes it
+    :vartype decode: Optional[float]
+    :ivar total: Whole call, body download included unless streamed
+    :vartype total: Optional[float]
+    """
+
+    endpoint: str
+    method: str = ""
+    url: str = ""
+    attempts: int = 0
+    status_code: Optional[int] = None
+    started: float = Field(default_factory=time.perf_counter)
+    prepare_url: Optional[float] = None
+    prepare_headers: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    decode: Optional[float] = None
+    total: Optional[float] = None
+
+    def record_transfer(
+        self,
+        sent: float,
+        ttfb: Optional[float],
+        stream: bool = False,
+    ) -> None:
+        """Record the transfer of an attempt.
+
+        :param sent: time.perf_counter() when the attempt was sent
+        :type sent: float
+        :param ttfb: Time to the response headers, None when unknown
+        :type ttfb: Optional[float]
+        :param stream: The body was left on the network, defaults to False
+        :type stream: bool, optional
+        """
+        elapsed = time.perf_counter() - sent
+        self.ttfb = ttfb
+        if stream or ttfb is None:
+            self.download = None
+        else:
+            self.download = max(0, elapsed - ttfb)
+
+    def record_flight(self, leader: "RequestTiming") -> None:
+        """Record the transfer of a coalesced call from the call that sent it.
+
+        :param leader: Timing record of the call that sent the request
+        :type leader: RequestTiming
+        """
+        self.attempts = leader.attempts
+        self.connect = leader.connect
+        self.tls = leader.tls
+        self.ttfb = leader.ttfb
+        self.download = leader.download
+
+    def finish(self, status_code: Optional[int]) -> None:
+        """Record the end of the call.
+
+        :param status_code: Final response status, None on transport error
+        :type status_code: Optional[int]
+        """
+        self.status_code = status_code
+        self.total = time.perf_counter() - self.started
+
+    def tracer(self) -> Callable[[str, Dict[str, object]], Awaitable[None]]:
+        """Return an httpx trace extension recording the transfer timings.
+
+        :return: The trace callback
+        :rtype: Callable[[str, Dict[str, object]], Awaitable[None]]
+        """
+        marks: Dict[str, float] = {}
+
+        async def trace(event: str, info: Dict[str, object]) -> None:  # noqa: WPS430
+            now = time.perf_counter()
+            for span, field in _TRACE_SPANS:
+                if event.endswith("{0}.started".format(span)):
+                    marks[span] = now
+                elif event.endswith("{0}.complete".format(span)) and span in marks:
+                    setattr(self, field, now - marks[span])
+            if event.endswith("send_request_headers.started"):
+                marks["sent"] = now
+            elif event.endswith("receive_response_headers.complete"):
+                marks["headers"] = now
+                self.ttfb = now - marks.get("sent", now)
+            elif event.endswith("receive_response_body.complete"):
+                self.download = now - marks.get("headers", now)
+
+        return trace
+
+
+StartHook = Callable[[RequestTiming], None]
+ResponseHook = Callable[[RequestTiming, RestResponse], None]
+ErrorHook = Callable[[RequestTiming, ApiClientError], None]
+RetryHook = Callable[[RequestTiming, ApiClientError, float], None]
+
+
+class Hooks:
+    """Callbacks of the events of a RestRequest.
+
+    A failing callback is logged and does not fail the call.
+    """
+
+    def __init__(self) -> None:
+        """Construct a Hooks object."""
+        self.request_start: List[StartHook] = []
+        self.response: List[ResponseHook] = []
+        self.error: List[ErrorHook] = []
+        self.retry: List[RetryHook] = []
+
+    def __bool__(self) -> bool:
+        """Check whether any callback is registered.
+
+        :return: True when a callback is registered
+        :rtype: bool
+        """
+        return bool(self.request_start or self.response or self.error or self.retry)
+
+    def emit_request_start(self, timing: RequestTiming) -> None:
+        """Call the request start callbacks.
+
+        :param timing: The timing record
+        :type timing: RequestTiming
+        """
+        for hook in self.request_start:
+            try:
+                hook(timing)
+            except Exception:
+                logger.exception("request start hook failed")
+
+    def emit_response(self, timing: RequestTiming, response: RestResponse) -> None:
+        """Call the response callbacks.
+
+        :param timing: The timing record
+        :type timing: RequestTiming
+        :param response: The response
+        :type response: RestResponse
+        """
+        for hook in self.response:
+            try:
+                hook(timing, response)
+            except Exception:
+                logger.exception("response hook failed")
+
+    def emit_error(self, timing: RequestTiming, error: ApiClientError) -> None:
+        """Call the error callbacks.
+
+        :param timing: The timing record
+        :type timing: RequestTiming
+        :param error: The error raised by the call
+        :type error: ApiClientError
+        """
+        for hook in self.error:
+            try:
+                hook(timing, error)
+            except Exception:
+                logger.exception("error hook failed")
+
+    def emit_retry(
+        self,
+        timing: RequestTiming,
+        error: ApiClientError,
+        delay: float,
+    ) -> None:
+        """Call the retry callbacks.
+
+        :param timing: The timing record
+        :type timing: RequestTiming
+        :param error: The failure retried
+        :type error: ApiClientError
+        :param delay: Delay before the retry
+        :type delay: float
+        """
+        for hook in self.retry:
+            try:
+                hook(timing, error, delay)
+            except Exception:
+                logger.exception("retry hook failed")
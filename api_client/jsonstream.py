@@ -0,0 +1,208 @@
+"""
+Jsonstream module for the package api_client of rest-api-client-framework library.
+
+A top-level JSON array is split into the raw bytes of its elements as the body
+arrives, so each element can be decoded or validated on its own. Only the
+element being received is buffered, the whole document never is.
+
+Classes:
+    ArrayScanner
+
+Functions:
+    iter_array_items
+"""
+
+import re
+from typing import Iterable, Iterator, List
+
+# Each match skips scalars and whole strings up to the next structural
+# character, a lone quote opens a string that continues in the next chunk.
+_STRUCTURE = re.compile(
+    rb'[^\[\]{}",]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^\[\]{}",]*)*[\[\]{}",]',
+)
+_STRING_END = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+_ARRAY_START = ord("[")
+_BACKSLASH = ord("\\")
+_COMMA = ord(",")
+_OPENERS = frozenset(b"[{")
+_CLOSERS = frozenset(b"]}")
+
+NOT_AN_ARRAY_MSG = "JSON document is not an array."
+
+
+class ArrayScanner:
+    """Split a JSON array fed in chunks into the raw bytes of its elements.
+
+    Element boundaries are found by tracking the nesting depth and the strings,
+    the elements themselves are left to a JSON decoder.
+    """
+
+    def __init__(self) -> None:
+        """Construct an ArrayScanner object."""
+        self._buffer = b""
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._done = False
+        self._separated = False
+
+    @property
+    def done(self) -> bool:
+        """Return True once the end of the array was read."""
+        return self._done
+
+    def feed(self, chunk: bytes) -> List[bytes]:  # noqa: WPS231
+        """Feed a chunk of the document.
+
+        :param chunk: The next bytes of the document
+        :type chunk: bytes
+        :raises ValueError: If the document is not an array or an element is
+            missing
+        :return: The elements completed by the chunk
+        :rtype: List[bytes]
+        """
+        if self._done:
+            _check_trailing(chunk)
+            return []
+        buffer = self._buffer + chunk
+        elements: List[bytes] = []
+        pos = self._pos
+        if self._in_string:
+            pos = self._string_end(buffer, pos)
+        if not self._started and not self._in_string:
+            pos = self._begin(buffer, pos)
+        depth = self._depth
+        start = self._start
+        if self._started and not self._in_string:
+            for found in _STRUCTURE.finditer(buffer, pos):
+                pos = found.end()
+                char = buffer[pos - 1]
+                if char == _COMMA:
+                    if depth == 1:
+                        elements.append(_element(buffer, start, pos - 1, True))
+                        self._separated = True
+                        start = pos
+                elif char in _OPENERS:
+                    depth += 1
+                elif char in _CLOSERS:
+                    depth -= 1
+                    if not depth:
+                        element = _element(buffer, start, pos - 1, self._separated)
+                        if element:
+                            elements.append(element)
+                        _check_trailing(buffer[pos:])
+                        self._done = True
+                        self._buffer = b""
+                        return elements
+                else:
+                    self._in_string = True
+                    pos = self._string_end(buffer, pos)
+                    break
+            else:
+                pos = len(buffer)
+        self._depth = depth
+        self._buffer = buffer[start:]
+        self._pos = pos - start
+        self._start = 0
+        return elements
+
+    def close(self) -> None:
+        """Check the whole array was read.
+
+        :raises ValueError: If the document ended before the end of the array
+        """
+        if not self._done:
+            raise ValueError("JSON array is incomplete.")
+
+    def _begin(self, buffer: bytes, pos: int) -> int:
+        """Enter the array at its opening bracket.
+
+        :param buffer: The buffered document
+        :type buffer: bytes
+        :param pos: Position to look for the bracket from
+        :type pos: int
+        :raises ValueError: If the document does not start with an array
+        :return: Position after the bracket, the end of the buffer while only
+            whitespace was read
+        :rtype: int
+        """
+        for index in range(pos, len(buffer)):
+            char = buffer[index]
+            if char == _ARRAY_START:
+                self._started = True
+                self._depth = 1
+                self._start = index + 1
+                return index + 1
+            if char not in _WHITESPACE:
+                raise ValueError(NOT_AN_ARRAY_MSG)
+        return len(buffer)
+
+    def _string_end(self, buffer: bytes, pos: int) -> int:
+        """Skip the rest of a string split between chunks.
+
+        :param buffer: The buffered document
+        :type buffer: bytes
+        :param pos: Position inside the string
+        :type pos: int
+        :return: Position after the closing quote, past the end of the buffer
+            while the string goes on
+        :rtype: int
+        """
+        found = _STRING_END.search(buffer, pos)
+        while found is not None and buffer[found.start()] == _BACKSLASH:
+            pos = found.start() + 2
+            found = _STRING_END.search(buffer, pos)
+        if found is None:
+            return max(pos, len(buffer))
+        self._in_string = False
+        return found.end()
+
+
+def _element(buffer: bytes, start: int, end: int, required: bool) -> bytes:
+    """Return an element of the array.
+
+    :param buffer: The buffered document
+    :type buffer: bytes
+    :param start: Position of the element
+    :type start: int
+    :param end: Position after the element
+    :type end: int
+    :param required: Raise when the element is empty
+    :type required: bool
+    :raises ValueError: If a required element is empty
+    :return: The raw bytes of the element, empty for an empty array
+    :rtype: bytes
+    """
+    element = buffer[start:end].strip(_WHITESPACE)
+    if required and not element:
+        raise ValueError("JSON array element expected.")
+    return element
+
+
+def _check_trailing(data: bytes) -> None:
+    """Check nothing but whitespace follows the array.
+
+    :param data: Bytes read after the array
+    :type data: bytes
+    :raises ValueError: If data follows the array
+    """
+    if data.strip(_WHITESPACE):
+        raise ValueError("Extra data after the JSON array.")
+
+
+def iter_array_items(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the raw bytes of the elements of a JSON array read in chunks.
+
+    :param chunks: Chunks of the document
+    :type chunks: Iterable[bytes]
+    :raises ValueError: If the document is not a complete array
+    :yield: The raw bytes of each element
+    :rtype: Iterator[bytes]
+    """
+    scanner = ArrayScanner()
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    scanner.close()
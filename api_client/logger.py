@@ -1,37 +1,233 @@
 """
 logger module for the package api_client of rest-api-client-framework library.
 
+The library logs to the ``api_client`` logger, which only has a NullHandler:
+the application decides where the records go. Its level can be preset with the
+REST_API_CLIENT_FRAMEWORK_LOG_LEVEL environment variable.
+
 Variables:
+    LOGGER_NAME
+    REDACTED_PARAMS
     logger
+
+Classes:
+    RequestLogger
+
+Functions:
+    redact_url
 """
 
 import logging
 import os
+import random
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+if TYPE_CHECKING:
+    from api_client.exception import ApiClientError
+    from api_client.hooks import RequestTiming
+    from api_client.request import RestRequest
+    from api_client.response import RestResponse
+
+LOGGER_NAME = "api_client"
+
+_LEVEL_ENV = "REST_API_CLIENT_FRAMEWORK_LOG_LEVEL"
+_MS_FIELDS = ("prepare_url", "prepare_headers", "connect", "tls", "ttfb", "download")
+
+REDACTED_PARAMS = frozenset(
+    (
+        "access_token",
+        "api_key",
+        "apikey",
+        "key",
+        "password",
+        "secret",
+        "token",
+    ),
+)
+_REDACTED = "***"
+
+LogValue = Union[str, int, float]
 
 
 def _create_library_logger() -> logging.Logger:
-    library = "rest-api-client-framework"
-    log_name = "{0}-{1}".format(library, __name__)
-    env_level = os.getenv("REST_API_CLIENT_FRAMEWORK_LOG_LEVEL", "WARNING").upper()
-    if env_level == "DEBUG":
-        level = logging.DEBUG
-    elif env_level == "INFO":
-        level = logging.INFO
-    else:
-        level = logging.WARNING
-    logging.basicConfig(level=level)
-    package_logger = logging.getLogger(log_name)
-    # print("created log: {0}".format(log_name))
-    package_logger.debug("created log: {0}".format(log_name))
-    # package_logger.addHandler(logging.NullHandler())
-    return package_logger
-
-
-def _get_logger() -> logging.Logger:
-    _create_library_logger()
-    if not logging.getLogger().hasHandlers():
-        return _create_library_logger()
-    return logging.getLogger()
-
-
-logger = _get_logger()
+    library_logger = logging.getLogger(LOGGER_NAME)
+    library_logger.addHandler(logging.NullHandler())
+    env_level = os.getenv(_LEVEL_ENV, "").upper()
+    if env_level in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}:
+        library_logger.setLevel(env_level)
+    return library_logger
+
+
+logger = _create_library_logger()
+
+
+class RequestLogger:
+    """Structured key=value logging of the calls of RestRequest objects.
+
+    Successful calls are sampled, failures and retries are always logged. The
+    fields are also attached to each record as ``record.api_client`` for
+    structured formatters. Nothing is formatted while the level is disabled.
+
+    :param level: Level of the response records, defaults to logging.INFO
+    :type level: int, optional
+    :param sample_rate: Fraction of the successful calls logged, defaults to 1
+    :type sample_rate: float, optional
+    :param log: Logger of the records, defaults to the ``api_client.requests``
+        logger
+    :type log: Optional[logging.Logger], optional
+    :param redact: Query parameters whose values are masked in the logged url,
+        case insensitive, defaults to REDACTED_PARAMS
+    :type redact: Iterable[str], optional
+    """
+
+    def __init__(
+        self,
+        level: int = logging.INFO,
+        sample_rate: float = 1,
+        log: Optional[logging.Logger] = None,
+        redact: Iterable[str] = REDACTED_PARAMS,
+    ) -> None:
+        """Construct a RequestLogger object."""
+        self.level = level
+        self.sample_rate = sample_rate
+        self.log = log or logger.getChild("requests")
+        self.redact: FrozenSet[str] = frozenset(name.lower() for name in redact)
+
+    def instrument(self, request: "RestRequest") -> None:
+        """Log the calls of a RestRequest through its hooks.
+
+        :param request: The client to log
+        :type request: RestRequest
+        """
+        request.on_response(self.log_response)
+        request.on_error(self.log_error)
+        request.on_retry(self.log_retry)
+
+    def log_response(self, timing: "RequestTiming", response: "RestResponse") -> None:
+        """Log a successful call when it is sampled.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param response: The response
+        :type response: RestResponse
+        """
+        if not self.log.isEnabledFor(self.level):
+            return
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        self._emit(self.level, "response", timing, status=response.status_code)
+
+    def log_error(self, timing: "RequestTiming", error: "ApiClientError") -> None:
+        """Log a failed call.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param error: The error raised by the call
+        :type error: ApiClientError
+        """
+        if self.log.isEnabledFor(logging.WARNING):
+            self._emit(
+                logging.WARNING,
+                "error",
+                timing,
+                status=error.status,
+                reason=error.reason.splitlines()[0] if error.reason else "",
+            )
+
+    def log_retry(
+        self,
+        timing: "RequestTiming",
+        error: "ApiClientError",
+        delay: float,
+    ) -> None:
+        """Log a retry.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param error: The failure retried
+        :type error: ApiClientError
+        :param delay: Delay before the retry
+        :type delay: float
+        """
+        if self.log.isEnabledFor(logging.INFO):
+            self._emit(
+                logging.INFO,
+                "retry",
+                timing,
+                status=error.status,
+                delay_ms=round(delay * 1e3, 3),
+            )
+
+    def _emit(
+        self,
+        level: int,
+        event: str,
+        timing: "RequestTiming",
+        **extra: LogValue,
+    ) -> None:
+        """Log a record of a call.
+
+        :param level: Level of the record
+        :type level: int
+        :param event: Event name
+        :type event: str
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        """
+        fields: Dict[str, LogValue] = {
+            "event": event,
+            "endpoint": timing.endpoint,
+            "method": timing.method,
+            "url": redact_url(timing.url, self.redact),
+            "attempts": timing.attempts,
+        }
+        fields.update(extra)
+        for name in _MS_FIELDS:
+            duration = getattr(timing, name)
+            if duration is not None:
+                fields["{0}_ms".format(name)] = round(duration * 1e3, 3)
+        if timing.total is not None:
+            fields["total_ms"] = round(timing.total * 1e3, 3)
+        message = " ".join(
+            "{0}={1}".format(key, _quote(valor)) for key, valor in fields.items()
+        )
+        self.log.log(level, "%s", message, extra={"api_client": fields})
+
+
+def redact_url(url: str, redact: FrozenSet[str] = REDACTED_PARAMS) -> str:
+    """Mask the values of the secret query parameters of an url.
+
+    :param url: The url
+    :type url: str
+    :param redact: Lowercase names of the secret parameters, defaults to
+        REDACTED_PARAMS
+    :type redact: FrozenSet[str], optional
+    :return: The url with the secret values masked
+    :rtype: str
+    """
+    parts = urlsplit(url)
+    if not parts.query or not redact:
+        return url
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not any(name.lower() in redact for name, _ in query):
+        return url
+    query = [
+        (name, _REDACTED if name.lower() in redact else valor)
+        for name, valor in query
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query, safe="*")))
+
+
+def _quote(valor: LogValue) -> str:
+    """Render a value, quoting strings holding spaces or quotes.
+
+    :param valor: The value
+    :type valor: LogValue
+    :return: The rendered value
+    :rtype: str
+    """
+    text = str(valor)
+    if isinstance(valor, str) and (not text or " " in text or '"' in text):
+        return '"{0}"'.format(text.replace('"', '\\"'))
+    return text
@@ -0,0 +1,460 @@
+"""
+Metrics module for the package api_client of rest-api-client-framework library.
+
+Counters and latency histograms of the calls made by RestRequest objects,
+labelled by endpoint, method, status class and host. They are exposed in the
+Prometheus text format and, when the ``opentelemetry-api`` package is
+installed, can be mirrored to OpenTelemetry instruments.
+
+Each thread records into its own shard so recording never contends with other
+threads. Shards are merged when the metrics are collected, the shard of a
+thread that ended is folded into a retired total so short lived worker threads
+do not accumulate shards.
+
+Variables:
+    HAS_OPENTELEMETRY
+    DEFAULT_BUCKETS
+
+Classes:
+    ClientMetrics
+"""
+
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from api_client.exception import ApiClientError
+from api_client.hooks import RequestTiming
+from api_client.response import RestResponse
+
+if TYPE_CHECKING:
+    from api_client.request import RestRequest
+
+try:
+    import opentelemetry.metrics as otel_metrics
+except ImportError:  # pragma: no cover
+    HAS_OPENTELEMETRY = False
+else:
+    HAS_OPENTELEMETRY = True
+
+MISSING_OPENTELEMETRY_MSG = (
+    "OpenTelemetry metrics need opentelemetry-api, "
+    "install it with: pip install opentelemetry-api"
+)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_REQUESTS = "api_client_requests_total"
+_RETRIES = "api_client_retries_total"
+_DURATION = "api_client_request_duration_seconds"
+_LABELS = ("endpoint", "method", "status_class", "host")
+_RETRY_LABELS = ("endpoint", "method", "host")
+
+Labels = Tuple[str, ...]
+
+
+class _Histogram:
+    """Bucket counts, sum and count of observations."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+    def merge(self, other: "_Histogram") -> None:
+        for index, bucket in enumerate(other.counts):
+            self.counts[index] += bucket
+        self.total += other.total
+        self.count += other.count
+
+
+class _Shard:
+    """Metrics recorded by one thread."""
+
+    __slots__ = ("lock", "requests", "retries", "durations")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests: Dict[Labels, int] = {}
+        self.retries: Dict[Labels, int] = {}
+        self.durations: Dict[Labels, _Histogram] = {}
+
+    def merge(self, other: "_Shard") -> None:
+        for labels, count in other.requests.items():
+            self.requests[labels] = self.requests.get(labels, 0) + count
+        for labels, count in other.retries.items():
+            self.retries[labels] = self.retries.get(labels, 0) + count
+        for labels, histogram in other.durations.items():
+            if labels not in self.durations:
+                self.durations[labels] = _Histogram(len(histogram.counts))
+            self.durations[labels].merge(histogram)
+
+    def clear(self) -> None:
+        self.requests.clear()
+        self.retries.clear()
+        self.durations.clear()
+
+
+class ClientMetrics:
+    """Request counters and latency histograms of RestRequest objects.
+
+    Attach it with ``RestRequest(..., metrics=ClientMetrics())`` or
+    :meth:`instrument`, one object can serve several clients.
+
+    :param buckets: Upper bounds of the latency histogram buckets in seconds,
+        defaults to DEFAULT_BUCKETS
+    :type buckets: Sequence[float], optional
+    :param opentelemetry: Also record into OpenTelemetry instruments of the
+        global meter provider, defaults to False
+    :type opentelemetry: bool, optional
+    :raises ImportError: If opentelemetry is requested but not installed
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        opentelemetry: bool = False,
+    ) -> None:
+        """Construct a ClientMetrics object."""
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: Dict[threading.Thread, _Shard] = {}
+        self._retired = _Shard()
+        self._lock = threading.Lock()
+        self._otel_requests: Optional["otel_metrics.Counter"] = None
+        self._otel_duration: Optional["otel_metrics.Histogram"] = None
+        if opentelemetry:
+            self._create_instruments()
+
+    def instrument(self, request: "RestRequest") -> None:
+        """Record the calls of a RestRequest through its hooks.
+
+        :param request: The client to instrument
+        :type request: RestRequest
+        """
+        request.on_response(self.record_response)
+        request.on_error(self.record_error)
+        request.on_retry(self.record_retry)
+
+    def record_response(self, timing: RequestTiming, response: RestResponse) -> None:
+        """Record a successful call.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param response: The response
+        :type response: RestResponse
+        """
+        self.observe(timing, response.status_code)
+
+    def record_error(self, timing: RequestTiming, error: ApiClientError) -> None:
+        """Record a failed call.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param error: The error raised by the call
+        :type error: ApiClientError
+        """
+        self.observe(timing, error.status)
+
+    def record_retry(
+        self,
+        timing: RequestTiming,
+        error: ApiClientError,
+        delay: float,
+    ) -> None:
+        """Record a retry.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param error: The failure retried
+        :type error: ApiClientError
+        :param delay: Delay before the retry
+        :type delay: float
+        """
+        labels = (timing.endpoint, timing.method, _host(timing.url))
+        shard = self._shard()
+        with shard.lock:
+            shard.retries[labels] = shard.retries.get(labels, 0) + 1
+
+    def observe(self, timing: RequestTiming, status: int) -> None:
+        """Record a call.
+
+        :param timing: The timing record of the call
+        :type timing: RequestTiming
+        :param status: Response status, 0 for a transport error
+        :type status: int
+        """
+        labels = (
+            timing.endpoint,
+            timing.method,
+            _status_class(status),
+            _host(timing.url),
+        )
+        duration = timing.total or 0.0
+        index = bisect_left(self.buckets, duration)
+        shard = self._shard()
+        with shard.lock:
+            shard.requests[labels] = shard.requests.get(labels, 0) + 1
+            histogram = shard.durations.get(labels)
+            if histogram is None:
+                histogram = _Histogram(len(self.buckets) + 1)
+                shard.durations[labels] = histogram
+            histogram.counts[index] += 1
+            histogram.total += duration
+            histogram.count += 1
+        if self._otel_requests is not None and self._otel_duration is not None:
+            attributes = dict(zip(_LABELS, labels))
+            self._otel_requests.add(1, attributes)
+            self._otel_duration.record(duration, attributes)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return the request count, error rate and latency quantiles per endpoint.
+
+        Quantiles are estimated from the histogram buckets by linear
+        interpolation, as Prometheus histogram_quantile does.
+
+        :return: requests, errors, error_rate, p50 and p99 per endpoint name
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        requests, _, durations = self._collect()
+        merged: Dict[str, _Histogram] = {}
+        errors: Dict[str, int] = {}
+        for labels, histogram in durations.items():
+            endpoint = labels[0]
+            if endpoint not in merged:
+                merged[endpoint] = _Histogram(len(self.buckets) + 1)
+                errors[endpoint] = 0
+            merged[endpoint].merge(histogram)
+            if labels[2] in {"5xx", "4xx", "error"}:
+                errors[endpoint] += requests[labels]
+        return {
+            endpoint: {
+                "requests": histogram.count,
+                "errors": errors[endpoint],
+                "error_rate": errors[endpoint] / histogram.count,
+                "p50": self._quantile(histogram, 0.5),
+                "p99": self._quantile(histogram, 0.99),
+            }
+            for endpoint, histogram in merged.items()
+        }
+
+    def prometheus_text(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        :return: The exposition
+        :rtype: str
+        """
+        requests, retries, durations = self._collect()
+        lines = [
+            "# HELP {0} Calls made by RestRequest.".format(_REQUESTS),
+            "# TYPE {0} counter".format(_REQUESTS),
+        ]
+        for labels, count in sorted(requests.items()):
+            lines.append(_sample(_REQUESTS, _LABELS, labels, count))
+        lines.append("# HELP {0} Retries made by RestRequest.".format(_RETRIES))
+        lines.append("# TYPE {0} counter".format(_RETRIES))
+        for labels, count in sorted(retries.items()):
+            lines.append(_sample(_RETRIES, _RETRY_LABELS, labels, count))
+        lines.append("# HELP {0} Duration of the calls.".format(_DURATION))
+        lines.append("# TYPE {0} histogram".format(_DURATION))
+        for labels, histogram in sorted(durations.items()):
+            lines.extend(self._histogram_samples(labels, histogram))
+        return "{0}\n".format("\n".join(lines))
+
+    def reset(self) -> None:
+        """Forget all the recorded metrics."""
+        with self._lock:
+            shards = [self._retired, *self._shards.values()]
+        for shard in shards:
+            with shard.lock:
+                shard.clear()
+
+    def _shard(self) -> _Shard:
+        """Return the shard of the current thread, creating it on first use.
+
+        :return: The shard
+        :rtype: _Shard
+        """
+        shard: Optional[_Shard] = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            self._local.shard = shard
+            with self._lock:
+                self._retire_shards()
+                self._shards[threading.current_thread()] = shard
+        return shard
+
+    def _retire_shards(self) -> None:
+        """Fold the shards of the threads that ended into the retired total.
+
+        Called with the lock held.
+        """
+        for thread, shard in list(self._shards.items()):
+            if not thread.is_alive():
+                del self._shards[thread]
+                with self._retired.lock, shard.lock:
+                    self._retired.merge(shard)
+
+    def _collect(
+        self,
+    ) -> Tuple[Dict[Labels, int], Dict[Labels, int], Dict[Labels, _Histogram]]:
+        """Merge the shards.
+
+        :return: Request counts, retry counts and histograms by labels
+        :rtype: Tuple[Dict[Labels, int], Dict[Labels, int], Dict[Labels, _Histogram]]
+        """
+        total = _Shard()
+        with self._lock:
+            self._retire_shards()
+            shards = [self._retired, *self._shards.values()]
+        for shard in shards:
+            with shard.lock:
+                total.merge(shard)
+        return total.requests, total.retries, total.durations
+
+    def _histogram_samples(self, labels: Labels, histogram: _Histogram) -> List[str]:
+        """Render the samples of a histogram.
+
+        :param labels: Label values
+        :type labels: Labels
+        :param histogram: The histogram
+        :type histogram: _Histogram
+        :return: Bucket, sum and count samples
+        :rtype: List[str]
+        """
+        samples = []
+        cumulative = 0
+        bounds = [_number(bound) for bound in self.buckets]
+        bounds.append("+Inf")
+        for bound, count in zip(bounds, histogram.counts):
+            cumulative += count
+            samples.append(
+                _sample(
+                    "{0}_bucket".format(_DURATION),
+                    _LABELS + ("le",),
+                    labels + (bound,),
+                    cumulative,
+                ),
+            )
+        samples.append(
+            _sample("{0}_sum".format(_DURATION), _LABELS, labels, histogram.total),
+        )
+        samples.append(
+            _sample("{0}_count".format(_DURATION), _LABELS, labels, histogram.count),
+        )
+        return samples
+
+    def _quantile(self, histogram: _Histogram, quantile: float) -> float:
+        """Estimate a quantile from a histogram.
+
+        :param histogram: The histogram
+        :type histogram: _Histogram
+        :param quantile: The quantile, between 0 and 1
+        :type quantile: float
+        :return: The estimated value, the largest bound when it falls in +Inf
+        :rtype: float
+        """
+        rank = quantile * histogram.count
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, histogram.counts):
+            if count and cumulative + count >= rank:
+                return lower + (bound - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        return float(self.buckets[-1])
+
+    def _create_instruments(self) -> None:
+        """Create the OpenTelemetry instruments.
+
+        :raises ImportError: If opentelemetry is not installed
+        """
+        if not HAS_OPENTELEMETRY:  # pragma: no cover
+            raise ImportError(MISSING_OPENTELEMETRY_MSG)
+        meter = otel_metrics.get_meter("api_client")
+        self._otel_requests = meter.create_counter(
+            "api_client.requests",
+            description="Calls made by RestRequest.",
+        )
+        self._otel_duration = meter.create_histogram(
+            "api_client.request.duration",
+            unit="s",
+            description="Duration of the calls.",
+        )
+
+
+def _status_class(status: int) -> str:
+    """Return the class of a status.
+
+    :param status: Response status, 0 for a transport error
+    :type status: int
+    :return: 2xx, 3xx, 4xx, 5xx or error
+    :rtype: str
+    """
+    if not status:
+        return "error"
+    return "{0}xx".format(status // 100)
+
+
+def _host(url: str) -> str:
+    """Return the host of a url.
+
+    :param url: The url
+    :type url: str
+    :return: Host and port
+    :rtype: str
+    """
+    return urlsplit(url).netloc
+
+
+def _number(number: float) -> str:
+    """Render a number as Prometheus does.
+
+    :param number: The number
+    :type number: float
+    :return: The rendered number
+    :rtype: str
+    """
+    return repr(float(number))
+
+
+def _sample(
+    name: str,
+    names: Sequence[str],
+    labels: Sequence[str],
+    number: float,
+) -> str:
+    """Render a sample.
+
+    :param name: Metric name
+    :type name: str
+    :param names: Label names
+    :type names: Sequence[str]
+    :param labels: Label values
+    :type labels: Sequence[str]
+    :param number: Sample value
+    :type number: float
+    :return: The sample line
+    :rtype: str
+    """
+    pairs = ",".join(
+        '{0}="{1}"'.format(label, _escape(valor))
+        for label, valor in zip(names, labels)
+    )
+    if isinstance(number, int):
+        return "{0}{{{1}}} {2}".format(name, pairs, number)
+    return "{0}{{{1}}} {2}".format(name, pairs, _number(number))
+
+
+def _escape(valor: str) -> str:
+    """Escape a label value.
+
+    :param valor: The value
+    :type valor: str
+    :return: The escaped value
+    :rtype: str
+    """
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,589 @@
+"""
+Pagination module for the package api_client of rest-api-client-framework library.
+
+An Endpoint declares how its results are paginated and RestRequest.paginate
+yields the items of all the pages lazily. Pages addressed by number or offset
+can be prefetched concurrently while the items of the current one are consumed.
+
+Classes:
+    Pagination
+    PagePagination
+    OffsetPagination
+    CursorPagination
+    LinkPagination
+
+Functions:
+    iterate_pages
+    aiterate_pages
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urljoin
+
+from pydantic import BaseModel, ConfigDict, Field
+from requests.utils import parse_header_links
+
+from api_client.payload import IntStrBool
+from api_client.response import RestResponse
+
+PageKwargs = Dict[str, IntStrBool]
+PageRequest = Union[PageKwargs, str]
+Fetch = Callable[[PageRequest], RestResponse]
+AsyncFetch = Callable[[PageRequest], Awaitable[RestResponse]]
+
+_LINK_KEY = "link"
+
+
+def _lookup(document: Any, path: Optional[str]) -> Any:  # type: ignore[explicit-any]
+    """Return the value at a dotted path of a JSON document.
+
+    :param document: The decoded document
+    :type document: Any
+    :param path: Dotted keys, None for the document itself
+    :type path: Optional[str]
+    :return: The value, None when a key is missing
+    :rtype: Any
+    """
+    if path is None:
+        return document
+    for key in path.split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+class Pagination(BaseModel, ABC):  # type: ignore[explicit-any]
+    """
+    Base class of the pagination strategies.
+
+    :ivar items: Dotted path of the items in the JSON document of a page,
+        None when the document is the list of items
+    :vartype items: Optional[str]
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    items: Optional[str] = None
+
+    @property
+    def parameters(self) -> Tuple[str, ...]:
+        """Return the query parameters set by the strategy.
+
+        :return: The parameter names
+        :rtype: Tuple[str, ...]
+        """
+        return ()
+
+    @property
+    def prefetch(self) -> int:
+        """Return the number of pages fetched ahead by default.
+
+        :return: Zero for the strategies needing a page to find the next one
+        :rtype: int
+        """
+        return 0
+
+    def extract(  # type: ignore[explicit-any]
+        self,
+        response: RestResponse,
+    ) -> List[Any]:
+        """Return the items of a page.
+
+        :param response: The page
+        :type response: RestResponse
+        :raises ValueError: If the page holds no list of items
+        :return: The items
+        :rtype: List[Any]
+        """
+        found = _lookup(response.data(), self.items)
+        if found is None:
+            return []
+        if not isinstance(found, list):
+            raise ValueError(
+                "Page items at {0!r} are not a list.".format(self.items or "."),
+            )
+        return found
+
+    def page(
+        self,
+        kwargs: Mapping[str, IntStrBool],
+        index: int,
+    ) -> Optional[PageKwargs]:
+        """Return the keyword arguments of a page from its index.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :param index: Index of the page, starting at 0
+        :type index: int
+        :return: The keyword arguments, None when the pages are only found one
+            after the other
+        :rtype: Optional[PageKwargs]
+        """
+        return None
+
+    @abstractmethod
+    def first(self, kwargs: Mapping[str, IntStrBool]) -> PageRequest:
+        """Return the request of the first page.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :return: Keyword arguments or url of the first page
+        :rtype: PageRequest
+        """
+
+    @abstractmethod
+    def next_page(  # type: ignore[explicit-any]
+        self,
+        request: PageRequest,
+        response: RestResponse,
+        items: List[Any],
+    ) -> Optional[PageRequest]:
+        """Return the request of the page following a page.
+
+        :param request: The request of the page
+        :type request: PageRequest
+        :param response: The page
+        :type response: RestResponse
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: Keyword arguments or url of the next page, None after the last
+        :rtype: Optional[PageRequest]
+        """
+
+    def is_last(self, items: List[Any]) -> bool:  # type: ignore[explicit-any]
+        """Check whether a page addressed by index is the last one.
+
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: True when the page is short or empty
+        :rtype: bool
+        """
+        return not items
+
+
+class _IndexedPagination(Pagination):  # type: ignore[explicit-any]
+    """Pagination addressing the pages by index, so they can be prefetched."""
+
+    prefetch_pages: int = Field(default=0, ge=0)
+
+    @property
+    def prefetch(self) -> int:
+        """Return the number of pages fetched ahead by default.
+
+        :return: The prefetch_pages setting
+        :rtype: int
+        """
+        return self.prefetch_pages
+
+    def first(self, kwargs: Mapping[str, IntStrBool]) -> PageRequest:
+        """Return the request of the first page.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :return: Keyword arguments of the first page
+        :rtype: PageRequest
+        """
+        return self._indexed(kwargs, 0)
+
+    def page(
+        self,
+        kwargs: Mapping[str, IntStrBool],
+        index: int,
+    ) -> Optional[PageKwargs]:
+        """Return the keyword arguments of a page from its index.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :param index: Index of the page, starting at 0
+        :type index: int
+        :return: The keyword arguments
+        :rtype: Optional[PageKwargs]
+        """
+        return self._indexed(kwargs, index)
+
+    def next_page(  # type: ignore[explicit-any]
+        self,
+        request: PageRequest,
+        response: RestResponse,
+        items: List[Any],
+    ) -> Optional[PageRequest]:
+        """Return the request of the page following a page.
+
+        :param request: The request of the page
+        :type request: PageRequest
+        :param response: The page
+        :type response: RestResponse
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: Keyword arguments of the next page, None after the last
+        :rtype: Optional[PageRequest]
+        """
+        if self.is_last(items) or not isinstance(request, dict):
+            return None
+        return self._indexed(request, self._index(request) + 1)
+
+    @abstractmethod
+    def _indexed(self, kwargs: Mapping[str, IntStrBool], index: int) -> PageKwargs:
+        """Return the keyword arguments of a page from its index."""
+
+    @abstractmethod
+    def _index(self, kwargs: Mapping[str, IntStrBool]) -> int:
+        """Return the index of the page of keyword arguments."""
+
+
+class PagePagination(_IndexedPagination):  # type: ignore[explicit-any]
+    """
+    Pages addressed by number, ``?page=1&per_page=100``.
+
+    :ivar page_param: Query parameter of the page number
+    :vartype page_param: str
+    :ivar size_param: Query parameter of the page size, None to let the api
+        choose it
+    :vartype size_param: Optional[str]
+    :ivar page_size: Number of items per page, a shorter page is the last one;
+        without it the pages end with an empty one
+    :vartype page_size: Optional[int]
+    :ivar start: Number of the first page
+    :vartype start: int
+    :ivar prefetch_pages: Pages fetched ahead concurrently
+    :vartype prefetch_pages: int
+    """
+
+    page_param: str = "page"
+    size_param: Optional[str] = "per_page"
+    page_size: Optional[int] = Field(default=None, ge=1)
+    start: int = 1
+
+    @property
+    def parameters(self) -> Tuple[str, ...]:
+        """Return the query parameters set by the strategy.
+
+        :return: The page and page size parameters
+        :rtype: Tuple[str, ...]
+        """
+        if self.size_param is None:
+            return (self.page_param,)
+        return (self.page_param, self.size_param)
+
+    def is_last(self, items: List[Any]) -> bool:  # type: ignore[explicit-any]
+        """Check whether a page is the last one.
+
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: True when the page is short or empty
+        :rtype: bool
+        """
+        if self.page_size is None:
+            return not items
+        return len(items) < self.page_size
+
+    def _indexed(self, kwargs: Mapping[str, IntStrBool], index: int) -> PageKwargs:
+        page = dict(kwargs)
+        page[self.page_param] = self.start + index
+        if self.size_param is not None and self.page_size is not None:
+            page[self.size_param] = self.page_size
+        return page
+
+    def _index(self, kwargs: Mapping[str, IntStrBool]) -> int:
+        return int(kwargs[self.page_param]) - self.start
+
+
+class OffsetPagination(_IndexedPagination):  # type: ignore[explicit-any]
+    """
+    Pages addressed by item offset, ``?offset=200&limit=100``.
+
+    :ivar offset_param: Query parameter of the offset
+    :vartype offset_param: str
+    :ivar limit_param: Query parameter of the page size
+    :vartype limit_param: str
+    :ivar limit: Number of items per page, a shorter page is the last one
+    :vartype limit: int
+    :ivar start: Offset of the first page
+    :vartype start: int
+    :ivar prefetch_pages: Pages fetched ahead concurrently
+    :vartype prefetch_pages: int
+    """
+
+    offset_param: str = "offset"
+    limit_param: str = "limit"
+    limit: int = Field(default=100, ge=1)
+    start: int = 0
+
+    @property
+    def parameters(self) -> Tuple[str, ...]:
+        """Return the query parameters set by the strategy.
+
+        :return: The offset and limit parameters
+        :rtype: Tuple[str, ...]
+        """
+        return (self.offset_param, self.limit_param)
+
+    def is_last(self, items: List[Any]) -> bool:  # type: ignore[explicit-any]
+        """Check whether a page is the last one.
+
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: True when the page is short
+        :rtype: bool
+        """
+        return len(items) < self.limit
+
+    def _indexed(self, kwargs: Mapping[str, IntStrBool], index: int) -> PageKwargs:
+        page = dict(kwargs)
+        page[self.offset_param] = self.start + index * self.limit
+        page[self.limit_param] = self.limit
+        return page
+
+    def _index(self, kwargs: Mapping[str, IntStrBool]) -> int:
+        return (int(kwargs[self.offset_param]) - self.start) // self.limit
+
+
+class CursorPagination(Pagination):  # type: ignore[explicit-any]
+    """
+    Pages chained by an opaque cursor returned with each page.
+
+    :ivar cursor_param: Query parameter of the cursor
+    :vartype cursor_param: str
+    :ivar next_cursor: Dotted path of the next cursor in the JSON document, the
+        pages end when it is missing or empty
+    :vartype next_cursor: str
+    """
+
+    cursor_param: str = "cursor"
+    next_cursor: str = "next_cursor"
+
+    @property
+    def parameters(self) -> Tuple[str, ...]:
+        """Return the query parameters set by the strategy.
+
+        :return: The cursor parameter
+        :rtype: Tuple[str, ...]
+        """
+        return (self.cursor_param,)
+
+    def first(self, kwargs: Mapping[str, IntStrBool]) -> PageRequest:
+        """Return the request of the first page.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :return: Keyword arguments of the first page
+        :rtype: PageRequest
+        """
+        return dict(kwargs)
+
+    def next_page(  # type: ignore[explicit-any]
+        self,
+        request: PageRequest,
+        response: RestResponse,
+        items: List[Any],
+    ) -> Optional[PageRequest]:
+        """Return the request of the page following a page.
+
+        :param request: The request of the page
+        :type request: PageRequest
+        :param response: The page
+        :type response: RestResponse
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: Keyword arguments of the next page, None after the last
+        :rtype: Optional[PageRequest]
+        """
+        cursor = _lookup(response.data(), self.next_cursor)
+        if cursor in {None, ""} or not isinstance(request, dict):
+            return None
+        page = dict(request)
+        page[self.cursor_param] = str(cursor)
+        return page
+
+
+class LinkPagination(Pagination):  # type: ignore[explicit-any]
+    """Pages chained by the ``Link: <url>; rel="next"`` response header."""
+
+    def first(self, kwargs: Mapping[str, IntStrBool]) -> PageRequest:
+        """Return the request of the first page.
+
+        :param kwargs: The keyword arguments of the call
+        :type kwargs: Mapping[str, IntStrBool]
+        :return: Keyword arguments of the first page
+        :rtype: PageRequest
+        """
+        return dict(kwargs)
+
+    def next_page(  # type: ignore[explicit-any]
+        self,
+        request: PageRequest,
+        response: RestResponse,
+        items: List[Any],
+    ) -> Optional[PageRequest]:
+        """Return the request of the page following a page.
+
+        :param request: The request of the page
+        :type request: PageRequest
+        :param response: The page
+        :type response: RestResponse
+        :param items: The items of the page
+        :type items: List[Any]
+        :return: Absolute url of the next page, None after the last
+        :rtype: Optional[PageRequest]
+        """
+        header = response.header(_LINK_KEY)
+        if not header:
+            return None
+        for link in parse_header_links(header):
+            if "next" in link.get("rel", "").split():
+                return urljoin(str(response.response.url), link["url"])
+        return None
+
+
+def iterate_pages(  # type: ignore[explicit-any]
+    pagination: Pagination,
+    fetch: Fetch,
+    kwargs: Mapping[str, IntStrBool],
+    prefetch: int = 0,
+) -> Iterator[Any]:
+    """Yield the items of the pages of a call.
+
+    :param pagination: The pagination strategy
+    :type pagination: Pagination
+    :param fetch: Fetch a page from its keyword arguments or url
+    :type fetch: Fetch
+    :param kwargs: The keyword arguments of the call
+    :type kwargs: Mapping[str, IntStrBool]
+    :param prefetch: Pages fetched ahead on a thread pool, defaults to 0
+    :type prefetch: int, optional
+    :yield: The items
+    :rtype: Iterator[Any]
+    """
+    if prefetch:
+        yield from _prefetched(pagination, fetch, kwargs, prefetch)
+        return
+    request: Optional[PageRequest] = pagination.first(kwargs)
+    while request is not None:
+        response = fetch(request)
+        items = pagination.extract(response)
+        request = pagination.next_page(request, response, items)
+        yield from items
+
+
+async def aiterate_pages(  # type: ignore[explicit-any]
+    pagination: Pagination,
+    fetch: AsyncFetch,
+    kwargs: Mapping[str, IntStrBool],
+    prefetch: int = 0,
+) -> AsyncIterator[Any]:
+    """Yield the items of the pages of a call without blocking.
+
+    :param pagination: The pagination strategy
+    :type pagination: Pagination
+    :param fetch: Fetch a page from its keyword arguments or url
+    :type fetch: AsyncFetch
+    :param kwargs: The keyword arguments of the call
+    :type kwargs: Mapping[str, IntStrBool]
+    :param prefetch: Pages fetched ahead by concurrent tasks, defaults to 0
+    :type prefetch: int, optional
+    :yield: The items
+    :rtype: AsyncIterator[Any]
+    """
+    if prefetch:
+        async for item in _aprefetched(pagination, fetch, kwargs, prefetch):
+            yield item
+        return
+    request: Optional[PageRequest] = pagination.first(kwargs)
+    while request is not None:
+        response = await fetch(request)
+        items = pagination.extract(response)
+        request = pagination.next_page(request, response, items)
+        for item in items:
+            yield item
+
+
+def _page_requests(
+    pagination: Pagination,
+    kwargs: Mapping[str, IntStrBool],
+) -> Iterator[PageKwargs]:
+    """Yield the keyword arguments of the pages addressed by index.
+
+    :param pagination: The pagination strategy
+    :type pagination: Pagination
+    :param kwargs: The keyword arguments of the call
+    :type kwargs: Mapping[str, IntStrBool]
+    :raises ValueError: If the pages cannot be addressed by index
+    :yield: The keyword arguments of each page
+    :rtype: Iterator[PageKwargs]
+    """
+    index = 0
+    page = pagination.page(kwargs, index)
+    if page is None:
+        raise ValueError(
+            "{0} pages cannot be prefetched.".format(type(pagination).__name__),
+        )
+    while page is not None:
+        yield page
+        index += 1
+        page = pagination.page(kwargs, index)
+
+
+def _prefetched(  # type: ignore[explicit-any]
+    pagination: Pagination,
+    fetch: Fetch,
+    kwargs: Mapping[str, IntStrBool],
+    prefetch: int,
+) -> Iterator[Any]:
+    page_requests = _page_requests(pagination, kwargs)
+    executor = ThreadPoolExecutor(max_workers=prefetch + 1)
+    pending: Deque[Future[RestResponse]] = deque(
+        executor.submit(fetch, next(page_requests)) for _ in range(prefetch + 1)
+    )
+    try:
+        last = False
+        while not last:
+            items = pagination.extract(pending.popleft().result())
+            last = pagination.is_last(items)
+            if not last:
+                pending.append(executor.submit(fetch, next(page_requests)))
+            yield from items
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def _aprefetched(  # type: ignore[explicit-any]
+    pagination: Pagination,
+    fetch: AsyncFetch,
+    kwargs: Mapping[str, IntStrBool],
+    prefetch: int,
+) -> AsyncIterator[Any]:
+    page_requests = _page_requests(pagination, kwargs)
+    pending: Deque["asyncio.Future[RestResponse]"] = deque(
+        asyncio.ensure_future(fetch(next(page_requests))) for _ in range(prefetch + 1)
+    )
+    try:
+        last = False
+        while not last:
+            items = pagination.extract(await pending.popleft())
+            last = pagination.is_last(items)
+            if not last:
+                pending.append(asyncio.ensure_future(fetch(next(page_requests))))
+            for item in items:
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
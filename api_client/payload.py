@@ -1,17 +1,80 @@
 """
 Module payload for the package api_client of rest-api-client-framework library.
 
+Besides JSON documents, text and bytes, a payload can stream its body from a
+file path, an open binary file, a memoryview or mmap, or an iterator of bytes,
+so large uploads are never held in memory.
+
 Classes:
     Payload
+    SizedChunks
 """
 
+import asyncio
+import io
 import json
-from typing import Dict, Optional, Union
+import mimetypes
+import mmap
+import os
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    cast,
+)
 
 from pydantic import BaseModel
 
+from api_client.codec import JsonCodec, get_codec
+
 IntStrBool = Union[int, str, bool]
-Body = Union[str, bytes, Dict[str, IntStrBool], BaseModel]
+Stream = Union[Path, BinaryIO, memoryview, mmap.mmap, Iterable[bytes]]
+Body = Union[str, bytes, Dict[str, IntStrBool], BaseModel, Stream]
+Chunk = Union[bytes, memoryview]
+Progress = Callable[[int, Optional[int]], None]
+
+CHUNK_SIZE = 64 * 1024
+OCTET_STREAM = "application/octet-stream"
+
+
+class SizedChunks:
+    """Chunks of a body of known length.
+
+    The length lets the transports send a Content-Length instead of using a
+    chunked transfer encoding.
+
+    :param chunks: The chunks
+    :type chunks: Iterator[Chunk]
+    :param length: Total length of the chunks in bytes
+    :type length: int
+    """
+
+    def __init__(self, chunks: Iterator[Chunk], length: int) -> None:
+        """Construct a SizedChunks object."""
+        self._chunks = chunks
+        self._length = length
+
+    def __iter__(self) -> Iterator[Chunk]:
+        """Iterate over the chunks.
+
+        :return: The chunks
+        :rtype: Iterator[Chunk]
+        """
+        return self._chunks
+
+    def __len__(self) -> int:
+        """Return the total length of the chunks.
+
+        :return: Length in bytes
+        :rtype: int
+        """
+        return self._length
 
 
 class Payload:
@@ -19,15 +82,31 @@ class Payload:
 
     :param body: Data to send to an API endpoint
     :type body: Body
+    :param content_type: Content type of the body, defaults to None to guess it
+    :type content_type: Optional[str], optional
+    :param progress: Called with the bytes sent and the total, when known,
+        after each chunk of a streamed body, defaults to None
+    :type progress: Optional[Progress], optional
+    :param chunk_size: Size of the chunks of a streamed body, defaults to 64 KiB
+    :type chunk_size: int, optional
     """
 
     _body: Optional[Body]
     _content_type: Optional[str]
 
-    def __init__(self, body: Optional[Body] = None, content_type: Optional[str] = None):
+    def __init__(
+        self,
+        body: Optional[Body] = None,
+        content_type: Optional[str] = None,
+        progress: Optional[Progress] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
         """Construct payload object."""
         self._body = body
         self._content_type = content_type
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self._start: Optional[int] = None
 
     @property
     def content_type(self) -> Optional[str]:
@@ -44,8 +123,97 @@ class Payload:
             return "application/json"
         if isinstance(self._body, str):
             return "text/plain"
+        if isinstance(self._body, Path):
+            return mimetypes.guess_type(self._body.name)[0] or OCTET_STREAM
+        if self.is_stream:
+            return OCTET_STREAM
         return None
 
+    @property
+    def is_stream(self) -> bool:
+        """Return true if the body is streamed.
+
+        :return: True for paths, files, buffers and iterators of bytes
+        :rtype: bool
+        """
+        if self._body is None:
+            return False
+        return not isinstance(self._body, (str, bytes, dict, BaseModel))
+
+    @property
+    def is_replayable(self) -> bool:
+        """Return true if the body can be sent again, on retry.
+
+        :return: False for iterators and unseekable files
+        :rtype: bool
+        """
+        body = self._body
+        if isinstance(body, (memoryview, mmap.mmap, Path)) or not self.is_stream:
+            return True
+        seekable = getattr(body, "seekable", None)
+        return seekable is not None and bool(seekable())
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Return the length of a streamed body.
+
+        :return: Length in bytes, None when unknown until it is read
+        :rtype: Optional[int]
+        """
+        body = self._body
+        if isinstance(body, Path):
+            return body.stat().st_size
+        if isinstance(body, (memoryview, mmap.mmap)):
+            return memoryview(body).nbytes
+        if self.is_stream and self.is_replayable:
+            stream = cast(BinaryIO, body)
+            start = self._start_position(stream)
+            end = stream.seek(0, os.SEEK_END)
+            stream.seek(start)
+            return end - start
+        return None
+
+    def chunks(self) -> Iterable[Chunk]:
+        """Return the chunks of a streamed body.
+
+        Each call starts over, from the file position of the first call for
+        open files. Buffers are sliced without copy, files are read chunk by
+        chunk. The chunks come with their length when it is known.
+
+        :raises ValueError: If payload is not streamed
+        :return: The chunks
+        :rtype: Iterable[Chunk]
+        """
+        if not self.is_stream:
+            raise ValueError(
+                "Payload type {0} cannot be streamed.".format(type(self._body)),
+            )
+        length = self.content_length
+        chunks = self._report(self._read_chunks(), length)
+        if length is None:
+            return chunks
+        return SizedChunks(chunks, length)
+
+    async def achunks(self) -> AsyncIterator[Chunk]:
+        """Return the chunks of a streamed body for the asynchronous client.
+
+        Files and iterators are read in a worker thread, so the event loop is
+        not blocked, the progress callback is called from that thread.
+
+        :yield: The chunks
+        :rtype: AsyncIterator[Chunk]
+        """
+        chunks = iter(self.chunks())
+        if isinstance(self._body, (memoryview, mmap.mmap)):
+            for chunk in chunks:
+                yield chunk
+            return
+        while True:  # noqa: WPS457
+            read: Optional[Chunk] = await asyncio.to_thread(next, chunks, None)
+            if read is None:
+                return
+            yield read
+
     @property
     def is_bytes(self) -> bool:
         """Return true if payload type is bytes.
@@ -85,9 +253,29 @@ class Payload:
                     type(self._body),
                 ),
             )
-        # return "{}"
         return ""
 
+    def to_json_bytes(self, codec: Optional[JsonCodec] = None) -> bytes:
+        """Return payload as JSON bytes.
+
+        :param codec: JSON codec, defaults to None for the default codec
+        :type codec: Optional[JsonCodec], optional
+        :raises ValueError: If payload is bytes type
+        :return: JSON document
+        :rtype: bytes
+        """
+        if self._body is not None:
+            if isinstance(self._body, BaseModel):
+                return self._body.__pydantic_serializer__.to_json(self._body)
+            elif isinstance(self._body, dict):
+                return get_codec(codec).dumps(self._body)
+            raise ValueError(
+                "Payload type {0} cannot be expressed as json.".format(
+                    type(self._body),
+                ),
+            )
+        return b""
+
     def to_bytes(self) -> Optional[bytes]:
         """Return payload as bytes.
 
@@ -121,3 +309,63 @@ class Payload:
                 ),
             )
         return None
+
+    def _read_chunks(self) -> Iterator[Chunk]:
+        """Read a streamed body chunk by chunk.
+
+        :yield: The chunks
+        :rtype: Iterator[Chunk]
+        """
+        body = self._body
+        size = self.chunk_size
+        if isinstance(body, (memoryview, mmap.mmap)):
+            view = memoryview(body).cast("B")
+            for start in range(0, len(view), size):
+                yield view[start : start + size]
+        elif isinstance(body, Path):
+            with body.open("rb") as source:
+                yield from iter(lambda: source.read(size), b"")
+        elif isinstance(body, io.IOBase) or hasattr(body, "read"):
+            stream = cast(BinaryIO, body)
+            if self.is_replayable:
+                stream.seek(self._start_position(stream))
+            yield from iter(lambda: stream.read(size), b"")
+        else:
+            yield from cast(Iterable[bytes], body)
+
+    def _report(
+        self,
+        chunks: Iterator[Chunk],
+        length: Optional[int],
+    ) -> Iterator[Chunk]:
+        """Report the progress of the chunks consumed.
+
+        :param chunks: The chunks
+        :type chunks: Iterator[Chunk]
+        :param length: Total length, None when unknown
+        :type length: Optional[int]
+        :yield: The chunks
+        :rtype: Iterator[Chunk]
+        """
+        progress = self.progress
+        if progress is None:
+            yield from chunks
+            return
+        sent = 0
+        for chunk in chunks:
+            yield chunk
+            sent += len(chunk)
+            progress(sent, length)
+
+    def _start_position(self, stream: BinaryIO) -> int:
+        """Return the position an open file is read from.
+
+        :param stream: The file
+        :type stream: BinaryIO
+        :return: The position of the file at the first call
+        :rtype: int
+        """
+        if self._start is None:
+            self._start = stream.tell()
+        return self._start
+
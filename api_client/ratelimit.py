@@ -0,0 +1,135 @@
+"""
+Ratelimit module for the package api_client of rest-api-client-framework library.
+
+Classes:
+    TokenBucket
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by threads and asyncio tasks.
+
+    Callers reserve tokens under a short lock and then sleep outside of it, so
+    a waiting thread never blocks the others and tasks never block the loop.
+    When adaptive, the rate is halved on throttled responses, at most once per
+    second so a burst of them counts once, and recovers additively on each
+    successful response, up to the configured rate.
+
+    :param rate: Tokens added per second
+    :type rate: float
+    :param capacity: Maximum burst of tokens, defaults to rate
+    :type capacity: Optional[float], optional
+    :param adaptive: Adapt the rate from throttled responses, defaults to True
+    :type adaptive: bool, optional
+    :param min_rate: Lowest adapted rate, defaults to rate / 100
+    :type min_rate: Optional[float], optional
+    :param decrease: Factor applied to the rate on throttling, defaults to 0.5
+    :type decrease: float, optional
+    :param increase: Fraction of the configured rate recovered per success,
+        defaults to 0.05
+    :type increase: float, optional
+    :raises ValueError: If rate is not positive
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        adaptive: bool = True,
+        min_rate: Optional[float] = None,
+        decrease: float = 0.5,
+        increase: float = 0.05,
+    ) -> None:
+        """Construct a TokenBucket object."""
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.max_rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self.adaptive = adaptive
+        self.min_rate = rate / 100 if min_rate is None else min_rate
+        self.decrease = decrease
+        self.increase = increase
+        self._rate = rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._throttled = self._updated - 1
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the current rate.
+
+        :return: Tokens added per second
+        :rtype: float
+        """
+        return self._rate
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens, going into debt when the bucket is short of them.
+
+        :param tokens: Number of tokens, defaults to 1
+        :type tokens: float, optional
+        :return: Seconds to wait before the tokens are available
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self._rate
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until tokens are available.
+
+        :param tokens: Number of tokens, defaults to 1
+        :type tokens: float, optional
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: float = 1) -> None:
+        """Wait without blocking the event loop until tokens are available.
+
+        :param tokens: Number of tokens, defaults to 1
+        :type tokens: float, optional
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a throttled response.
+
+        :param retry_after: Seconds the server asked to wait, defaults to None
+        :type retry_after: Optional[float], optional
+        """
+        with self._lock:
+            self._refill()
+            if self.adaptive and self._updated - self._throttled >= 1:
+                self._throttled = self._updated
+                self._rate = max(self.min_rate, self._rate * self.decrease)
+            if retry_after:
+                self._tokens = min(self._tokens, -retry_after * self._rate)
+
+    def on_success(self) -> None:
+        """Speed back up after a successful response."""
+        if not self.adaptive or self._rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill()
+            recovered = self._rate + self.max_rate * self.increase
+            self._rate = min(self.max_rate, recovered)
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update, the lock is held."""
+        now = time.monotonic()
+        accrued = (now - self._updated) * self._rate
+        self._tokens = min(self.capacity, self._tokens + accrued)
+        self._updated = now
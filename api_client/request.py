@@ -7,25 +7,133 @@ Classes:
     RestRequest
 """
 
+import asyncio
+import logging
+import os
+import time
+from collections import ChainMap
 from enum import Enum
+from functools import partial
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional, Union
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    overload,
+)
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 
+from api_client.breaker import CircuitBreaker, CircuitState
+from api_client.cache import CachedResponse, ResponseCache
+from api_client.coalesce import AsyncSingleFlight, SingleFlight, flight_key
+from api_client.codec import JsonCodec, get_codec
+from api_client.compression import (
+    ACCEPT_ENCODING,
+    ASYNC_ACCEPT_ENCODING,
+    Chunks,
+    acompress_chunks,
+    compress_chunks,
+)
+from api_client.concurrency import bounded_map
 from api_client.constants import VERSION
-from api_client.endpoint import Endpoint, HTTPMethod, ReqTimeOut
-from api_client.exception import ApiClientError
+from api_client.endpoint import Endpoint, EndpointTemplate, HTTPMethod
+from api_client.exception import ApiClientError, CircuitOpenError
+from api_client.hooks import (
+    ErrorHook,
+    Hooks,
+    RequestTiming,
+    ResponseHook,
+    RetryHook,
+    StartHook,
+)
+from api_client.logger import RequestLogger, logger
+from api_client.metrics import ClientMetrics
+from api_client.pagination import (
+    PageRequest,
+    Pagination,
+    aiterate_pages,
+    iterate_pages,
+)
 from api_client.payload import IntStrBool, Payload
-from api_client.response import RestResponse
+from api_client.ratelimit import TokenBucket
+from api_client.response import DEFAULT_CHUNK_SIZE, RestResponse
+from api_client.retry import RetryMetrics, RetryPolicy, parse_retry_after
+from api_client.transport import async_timeout, create_async_client
+
+if TYPE_CHECKING:
+    import httpx
 
 # from urllib.parse import urljoin
 
 
 _CONTENT_TYPE_KEY = "Content-Type"
+_AUTHORIZATION_KEY = "Authorization"
+_CONTENT_ENCODING_KEY = "Content-Encoding"
+_CONTENT_LENGTH_KEY = "Content-Length"
+_ACCEPT_ENCODING_KEY = "Accept-Encoding"
+_RANGE_KEY = "Range"
+_CONTENT_RANGE_KEY = "content-range"
 
 Headers = CaseInsensitiveDict[str]
+RequestBody = Optional[Union[str, bytes, Payload]]
+
+
+def _range_start(response: RestResponse, offset: int) -> bool:
+    """Check a response continues a partial download.
+
+    :param response: The response to a Range request
+    :type response: RestResponse
+    :param offset: Size of the partial file
+    :type offset: int
+    :raises ApiClientError: If the response holds another range
+    :return: True when the body is to be appended to the partial file
+    :rtype: bool
+    """
+    if not offset or response.status_code != HTTPStatus.PARTIAL_CONTENT:
+        return False
+    content_range = response.header(_CONTENT_RANGE_KEY, "")
+    if content_range and content_range.startswith("bytes {0}-".format(offset)):
+        return True
+    raise ApiClientError(
+        status=response.status_code,
+        reason="Unexpected Content-Range: {0}".format(content_range),
+        response=response,
+    )
+
+
+def _range_complete(error: ApiClientError, offset: int) -> bool:
+    """Check a Range request failed because the partial file is complete.
+
+    :param error: The failure of a Range request
+    :type error: ApiClientError
+    :param offset: Size of the partial file
+    :type offset: int
+    :return: True when the server rejected the range as starting at the end
+    :rtype: bool
+    """
+    if error.status != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+        return False
+    if error.response is None:
+        return False
+    content_range = error.response.header(_CONTENT_RANGE_KEY)
+    return content_range == "bytes */{0}".format(offset)
 
 
 class ExecutionMode(Enum):
@@ -50,28 +158,308 @@ class RestRequest:  # noqa: WPS214
     :type user_agent: Optional[str]
     :param api_key: api authorization
     :type api_key: Optional[str], default to None
+    :param pool_connections: number of host connection pools to cache,
+        defaults to requests.adapters.DEFAULT_POOLSIZE
+    :type pool_connections: int, optional
+    :param pool_maxsize: maximum number of connections kept per pool,
+        defaults to requests.adapters.DEFAULT_POOLSIZE
+    :type pool_maxsize: int, optional
+    :param pool_block: block when no free connection is available instead of
+        opening a throwaway one, defaults to False
+    :type pool_block: bool, optional
+    :param async_max_connections: maximum number of concurrent connections of
+        the asynchronous client, defaults to 100
+    :type async_max_connections: int, optional
+    :param async_max_keepalive_connections: maximum number of idle connections
+        the asynchronous client keeps alive, defaults to 20
+    :type async_max_keepalive_connections: int, optional
+    :param codec: JSON codec name or instance, defaults to None for the global
+        default codec
+    :type codec: Optional[Union[str, JsonCodec]], optional
+    :param cache: Cache of GET responses, defaults to None for no caching
+    :type cache: Optional[ResponseCache], optional
+    :param coalesce: Send identical concurrent GET requests once and share the
+        response, or the error, between their callers, defaults to False
+    :type coalesce: bool, optional
+    :param retry: Retry policy of the endpoints without their own, defaults to
+        None for no retries
+    :type retry: Optional[RetryPolicy], optional
+    :param rate_limit: Rate limiter of all the requests to the api root,
+        defaults to None for no limit
+    :type rate_limit: Optional[TokenBucket], optional
+    :param circuit_breaker: Circuit breaker of the api root host, defaults to
+        None for no breaker
+    :type circuit_breaker: Optional[CircuitBreaker], optional
+    :param metrics: Metrics recording the calls, defaults to None
+    :type metrics: Optional[ClientMetrics], optional
+    :param request_logger: Structured logging of the calls, defaults to None
+    :type request_logger: Optional[RequestLogger], optional
+
+    The object owns a :class:`requests.Session` so connections are kept alive
+    across calls. Release it with :meth:`close` or use the object as a context
+    manager. The asynchronous client behind :meth:`acall_endpoint` is released
+    with :meth:`aclose` or ``async with``.
+
+    Callbacks registered with :meth:`on_request_start`, :meth:`on_response`,
+    :meth:`on_error` and :meth:`on_retry` receive a
+    :class:`~api_client.hooks.RequestTiming` record of each call.
     """
 
     _endpoints: Dict[str, Endpoint]
+    _templates: Dict[str, EndpointTemplate]
+    _session: requests.Session
+    _async_client: Optional["httpx.AsyncClient"]
+    _async_loop: Optional[asyncio.AbstractEventLoop]
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         api_root: str,
         endpoints: Union[Endpoint, List[Endpoint]],
         user_agent: str = "rest-api-client-framework",
         api_key: Optional[str] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        async_max_connections: int = 100,
+        async_max_keepalive_connections: int = 20,
+        codec: Optional[Union[str, JsonCodec]] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[ClientMetrics] = None,
+        request_logger: Optional[RequestLogger] = None,
     ) -> None:
         """Construct a RestRequest object."""
+        self._api_root = api_root
         self._endpoints = {}
+        self._templates = {}
         if isinstance(endpoints, Endpoint):
             self._register_endpoint(endpoints)
         else:
             self._register_endpoints(endpoints)
-        self.api_root = api_root
-        self.user_agent = user_agent
-        self.api_key = api_key
+        self._user_agent = user_agent
+        self._api_key = api_key
+        self._version = VERSION
+        self._pool_maxsize = pool_maxsize
+        self._session = self._create_session(
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+        )
+        self._async_client = None
+        self._async_loop = None
+        self._async_max_connections = async_max_connections
+        self._async_max_keepalive_connections = async_max_keepalive_connections
+        self._update_default_headers()
+        self._codec = None if codec is None else get_codec(codec)
+        self.cache = cache
+        self._flight = SingleFlight() if coalesce else None
+        self._aflight = AsyncSingleFlight() if coalesce else None
+        self.retry = retry
+        self.retry_metrics = RetryMetrics()
+        self.rate_limit = rate_limit
+        self.circuit_breaker = circuit_breaker
+        self.hooks = Hooks()
+        if metrics is not None:
+            metrics.instrument(self)
+        if request_logger is not None:
+            request_logger.instrument(self)
+
+    def __enter__(self) -> "RestRequest":
+        """Enter the runtime context.
+
+        :return: This RestRequest object
+        :rtype: RestRequest
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exit the runtime context closing the session."""
+        self.close()
+
+    @property
+    def api_root(self) -> str:
+        """Return the server api root.
+
+        :return: The api root
+        :rtype: str
+        """
+        return self._api_root
+
+    @api_root.setter
+    def api_root(self, api_root: str) -> None:
+        """Set the server api root, the endpoint templates are compiled again.
+
+        :param api_root: The api root
+        :type api_root: str
+        """
+        self._api_root = api_root
+        self._templates = {}
+
+    @property
+    def user_agent(self) -> str:
+        """Return the client user agent.
+
+        :return: The user agent
+        :rtype: str
+        """
+        return self._user_agent
+
+    @user_agent.setter
+    def user_agent(self, user_agent: str) -> None:
+        """Set the client user agent updating the default headers.
+
+        :param user_agent: The user agent
+        :type user_agent: str
+        """
+        self._user_agent = user_agent
+        self._update_default_headers()
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """Return the api authorization.
+
+        :return: The api key
+        :rtype: Optional[str]
+        """
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: Optional[str]) -> None:
+        """Set the api authorization updating the default headers.
+
+        :param api_key: The api key
+        :type api_key: Optional[str]
+        """
+        self._api_key = api_key
+        self._update_default_headers()
+
+    @property
+    def version(self) -> str:
+        """Return the version sent in the user agent.
+
+        :return: The version
+        :rtype: str
+        """
+        return self._version
+
+    @version.setter
+    def version(self, version: str) -> None:
+        """Set the version sent in the user agent updating the default headers.
+
+        :param version: The version
+        :type version: str
+        """
+        self._version = version
+        self._update_default_headers()
+
+    @property
+    def default_headers(self) -> Mapping[str, str]:
+        """Return the headers sent with every request unless overridden.
+
+        :return: Authorization, User-Agent and Accept-Encoding headers
+        :rtype: Mapping[str, str]
+        """
+        return self._default_headers
+
+    @property
+    def codec(self) -> JsonCodec:
+        """Return the JSON codec of the requests.
+
+        :return: The codec given at construction or the global default codec
+        :rtype: JsonCodec
+        """
+        return get_codec(self._codec)
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the pooled session used for requests.
+
+        :return: The session
+        :rtype: requests.Session
+        """
+        return self._session
+
+    def close(self) -> None:
+        """Close the session and release pooled connections."""
+        self._session.close()
+
+    async def __aenter__(self) -> "RestRequest":
+        """Enter the asynchronous runtime context.
+
+        :return: This RestRequest object
+        :rtype: RestRequest
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exit the asynchronous runtime context closing the asynchronous client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the asynchronous client, the session is left open."""
+        if self._async_client is not None:
+            if self._async_loop is asyncio.get_running_loop():
+                await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
 
-        self.version = VERSION
+    def on_request_start(self, hook: StartHook) -> StartHook:
+        """Register a callback called once the request is prepared.
+
+        :param hook: Callback receiving the timing record
+        :type hook: StartHook
+        :return: The callback, so the method can decorate it
+        :rtype: StartHook
+        """
+        self.hooks.request_start.append(hook)
+        return hook
+
+    def on_response(self, hook: ResponseHook) -> ResponseHook:
+        """Register a callback called with each successful response.
+
+        :param hook: Callback receiving the timing record and the response
+        :type hook: ResponseHook
+        :return: The callback, so the method can decorate it
+        :rtype: ResponseHook
+        """
+        self.hooks.response.append(hook)
+        return hook
+
+    def on_error(self, hook: ErrorHook) -> ErrorHook:
+        """Register a callback called when a call raises ApiClientError.
+
+        :param hook: Callback receiving the timing record and the error
+        :type hook: ErrorHook
+        :return: The callback, so the method can decorate it
+        :rtype: ErrorHook
+        """
+        self.hooks.error.append(hook)
+        return hook
+
+    def on_retry(self, hook: RetryHook) -> RetryHook:
+        """Register a callback called before each retry.
+
+        :param hook: Callback receiving the timing record, the failure retried
+            and the delay before the retry
+        :type hook: RetryHook
+        :return: The callback, so the method can decorate it
+        :rtype: RetryHook
+        """
+        self.hooks.retry.append(hook)
+        return hook
 
     def call_endpoint(
         self,
@@ -79,6 +467,7 @@ class RestRequest:  # noqa: WPS214
         payload: Optional[Payload] = None,
         headers: Optional[Headers] = None,
         mode: ExecutionMode = ExecutionMode.SYNC,
+        stream: Optional[bool] = None,
         **kwargs: IntStrBool,
     ) -> RestResponse:
         """Call endpoint.
@@ -91,22 +480,511 @@ class RestRequest:  # noqa: WPS214
         :type headers: Optional[Headers], optional
         :param mode: Sync or async, defaults to ExecutionMode.SYNC
         :type mode: ExecutionMode, optional
+        :param stream: Stream the response body, defaults to Endpoint.stream
+        :type stream: Optional[bool], optional
+        :raises EndpointNotFoundError: If endpoint not found
+        :raises NotImplementedError: If mode is async, use acall_endpoint instead
+        :return: The RestResponse object
+        :rtype: RestResponse
+        """
+        if mode == ExecutionMode.ASYNC:
+            raise NotImplementedError(
+                "Async requests are made with: await acall_endpoint(...)",
+            )
+        return self._call_endpoint(name, payload, headers, stream, kwargs)
+
+    @overload
+    def call_many(
+        self,
+        name: str,
+        kwargs_list: Iterable[Mapping[str, IntStrBool]],
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: Literal[False] = False,
+    ) -> Iterator[RestResponse]: ...  # noqa: WPS428
+
+    @overload
+    def call_many(
+        self,
+        name: str,
+        kwargs_list: Iterable[Mapping[str, IntStrBool]],
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: Literal[True] = ...,  # noqa: WPS428
+    ) -> Iterator[Union[RestResponse, Exception]]: ...  # noqa: WPS428
+
+    def call_many(
+        self,
+        name: str,
+        kwargs_list: Iterable[Mapping[str, IntStrBool]],
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> Iterator[Union[RestResponse, Exception]]:
+        """Call an endpoint once per set of keyword arguments concurrently.
+
+        Calls run on a thread pool sharing the pooled session. The iterable is
+        consumed lazily and only ``2 * max_workers`` calls are in flight at once.
+
+        :param name: Endpoint name
+        :type name: str
+        :param kwargs_list: Keyword arguments for each call
+        :type kwargs_list: Iterable[Mapping[str, IntStrBool]]
+        :param payload: Payload sent with every call, defaults to None
+        :type payload: Optional[Payload], optional
+        :param headers: Headers sent with every call, defaults to None
+        :type headers: Optional[Headers], optional
+        :param max_workers: Number of worker threads, defaults to pool_maxsize
+        :type max_workers: Optional[int], optional
+        :param ordered: Yield responses in input order, otherwise in completion
+            order, defaults to True
+        :type ordered: bool, optional
+        :param return_exceptions: Yield exceptions instead of raising them,
+            defaults to False
+        :type return_exceptions: bool, optional
+        :return: Iterator over the responses
+        :rtype: Iterator[Union[RestResponse, Exception]]
+        """
+
+        def call(kwargs: Mapping[str, IntStrBool]) -> RestResponse:
+            return self._call_endpoint(name, payload, headers, None, kwargs)
+
+        return bounded_map(
+            call,
+            kwargs_list,
+            max_workers or self._pool_maxsize,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
+    def paginate(  # type: ignore[explicit-any]
+        self,
+        name: str,
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        prefetch: Optional[int] = None,
+        **kwargs: IntStrBool,
+    ) -> Iterator[Any]:
+        """Yield the items of all the pages of an endpoint.
+
+        The pages are fetched lazily following the pagination of the endpoint,
+        page and offset pages can be fetched ahead on a thread pool while the
+        items of the current one are consumed.
+
+        :param name: Endpoint name
+        :type name: str
+        :param payload: Payload sent with every page, defaults to None
+        :type payload: Optional[Payload], optional
+        :param headers: Headers sent with every page, defaults to None
+        :type headers: Optional[Headers], optional
+        :param prefetch: Pages fetched ahead, defaults to the prefetch_pages of
+            the pagination
+        :type prefetch: Optional[int], optional
+        :raises EndpointNotFoundError: If endpoint not found
+        :raises ValueError: If the endpoint has no pagination or a next page
+            link leaves the host of the api root
+        :return: Iterator over the items
+        :rtype: Iterator[Any]
+        """
+        pagination = self._pagination(name)
+
+        def fetch(request: PageRequest) -> RestResponse:
+            if isinstance(request, str):
+                self._check_page_url(request)
+                return self._call_endpoint(name, payload, headers, False, {}, request)
+            return self._call_endpoint(name, payload, headers, False, request)
+
+        if prefetch is None:
+            prefetch = pagination.prefetch
+        return iterate_pages(pagination, fetch, kwargs, prefetch)
+
+    def download_to(  # noqa: WPS211
+        self,
+        name: str,
+        path: Union[str, Path],
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        resume: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: IntStrBool,
+    ) -> str:
+        """Download the body of an endpoint call to a file.
+
+        The body is streamed to ``<path>.part``, which is renamed to path once
+        complete. With resume, a partial file left by a failed download is
+        completed with a Range request. A server ignoring the range sends the
+        whole body, which replaces the partial file. The body is requested
+        without content coding, so that the size of the partial file is an
+        offset in the representation the range addresses.
+
+        :param name: Endpoint name
+        :type name: str
+        :param path: File path
+        :type path: Union[str, Path]
+        :param payload: Payload to send, defaults to None
+        :type payload: Optional[Payload], optional
+        :param headers: Headers to send, defaults to None
+        :type headers: Optional[Headers], optional
+        :param resume: Complete a partial file, defaults to False
+        :type resume: bool, optional
+        :param chunk_size: Size of the read buffer, defaults to 65536
+        :type chunk_size: int, optional
+        :raises ApiClientError: If the call fails or the server answers with
+            another range
+        :return: The file path
+        :rtype: str
+        """
+        target = Path(path)
+        part = target.with_name("{0}.part".format(target.name))
+        offset = part.stat().st_size if resume and part.exists() else 0
+        heads = Headers() if headers is None else headers.copy()
+        heads[_ACCEPT_ENCODING_KEY] = "identity"
+        if offset:
+            heads[_RANGE_KEY] = "bytes={0}-".format(offset)
+        try:
+            response = self._call_endpoint(name, payload, heads, True, kwargs)
+        except ApiClientError as ex:
+            if not offset or not _range_complete(ex, offset):
+                raise
+            if ex.response is not None:
+                ex.response.close()
+        else:
+            with response:
+                append = _range_start(response, offset)
+                with open(part, "ab" if append else "wb") as output:
+                    response.write_to(output, chunk_size)
+        os.replace(part, target)
+        return str(target)
+
+    async def acall_endpoint(
+        self,
+        name: str,
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        **kwargs: IntStrBool,
+    ) -> RestResponse:
+        """Call endpoint without blocking the event loop.
+
+        The request is sent through a pooled asynchronous client that is created
+        on first use, it requires the optional httpx dependency.
+
+        :param name: Endpoint name
+        :type name: str
+        :param payload: Payload to send, defaults to None
+        :type payload: Optional[Payload], optional
+        :param headers: Headers to send, defaults to None
+        :type headers: Optional[Headers], optional
         :raises EndpointNotFoundError: If endpoint not found
-        :raises NotImplementedError: If mode is async
         :return: The RestResponse object
         :rtype: RestResponse
         """
+        return await self._acall_endpoint(name, payload, headers, kwargs)
+
+    def apaginate(  # type: ignore[explicit-any]
+        self,
+        name: str,
+        payload: Optional[Payload] = None,
+        headers: Optional[Headers] = None,
+        prefetch: Optional[int] = None,
+        **kwargs: IntStrBool,
+    ) -> AsyncIterator[Any]:
+        """Yield the items of all the pages of an endpoint without blocking.
+
+        :param name: Endpoint name
+        :type name: str
+        :param payload: Payload sent with every page, defaults to None
+        :type payload: Optional[Payload], optional
+        :param headers: Headers sent with every page, defaults to None
+        :type headers: Optional[Headers], optional
+        :param prefetch: Pages fetched ahead by concurrent tasks, defaults to
+            the prefetch_pages of the pagination
+        :type prefetch: Optional[int], optional
+        :raises EndpointNotFoundError: If endpoint not found
+        :raises ValueError: If the endpoint has no pagination or a next page
+            link leaves the host of the api root
+        :return: Asynchronous iterator over the items
+        :rtype: AsyncIterator[Any]
+        """
+        pagination = self._pagination(name)
+
+        async def fetch(request: PageRequest) -> RestResponse:
+            if isinstance(request, str):
+                self._check_page_url(request)
+                return await self._acall_endpoint(name, payload, headers, {}, request)
+            return await self._acall_endpoint(name, payload, headers, request)
+
+        if prefetch is None:
+            prefetch = pagination.prefetch
+        return aiterate_pages(pagination, fetch, kwargs, prefetch)
+
+    async def _acall_endpoint(
+        self,
+        name: str,
+        payload: Optional[Payload],
+        headers: Optional[Headers],
+        kwargs: Mapping[str, IntStrBool],
+        url: Optional[str] = None,
+    ) -> RestResponse:
+        """Call endpoint asynchronously.
+
+        :param name: Endpoint name
+        :type name: str
+        :param payload: Payload to send
+        :type payload: Optional[Payload]
+        :param headers: Headers to send
+        :type headers: Optional[Headers]
+        :param kwargs: Path and query parameters
+        :type kwargs: Mapping[str, IntStrBool]
+        :param url: Absolute url overriding the endpoint one, defaults to None
+        :type url: Optional[str], optional
+        :return: The RestResponse object
+        :rtype: RestResponse
+        """
+        timing = RequestTiming(endpoint=name) if self.hooks else None
+        template, url, heads, payload = self._prepare_call(
+            name,
+            payload,
+            headers,
+            timing,
+            kwargs,
+            url,
+        )
+        if timing is None:
+            return await self._asend_request(template, url, heads, payload)
+        self.hooks.emit_request_start(timing)
+        try:
+            response = await self._asend_request(
+                template,
+                url,
+                heads,
+                payload,
+                timing,
+            )
+        except ApiClientError as ex:
+            self._call_failed(timing, ex)
+            raise
+        return self._call_succeeded(timing, response)
+
+    def _call_endpoint(
+        self,
+        name: str,
+        payload: Optional[Payload],
+        headers: Optional[Headers],
+        stream: Optional[bool],
+        kwargs: Mapping[str, IntStrBool],
+        url: Optional[str] = None,
+    ) -> RestResponse:
+        """Call endpoint synchronously.
+
+        :param name: Endpoint name
+        :type name: str
+        :param payload: Payload to send
+        :type payload: Optional[Payload]
+        :param headers: Headers to send
+        :type headers: Optional[Headers]
+        :param stream: Stream the response body, None for Endpoint.stream
+        :type stream: Optional[bool]
+        :param kwargs: Path and query parameters
+        :type kwargs: Mapping[str, IntStrBool]
+        :param url: Absolute url overriding the endpoint one, defaults to None
+        :type url: Optional[str], optional
+        :return: The RestResponse object
+        :rtype: RestResponse
+        """
+        timing = RequestTiming(endpoint=name) if self.hooks else None
+        template, url, heads, payload = self._prepare_call(
+            name,
+            payload,
+            headers,
+            timing,
+            kwargs,
+            url,
+        )
+        if stream is None:
+            stream = template.endpoint.stream
+        if timing is None:
+            return self._send_request(template, url, heads, payload, stream)
+        self.hooks.emit_request_start(timing)
+        try:
+            response = self._send_request(
+                template,
+                url,
+                heads,
+                payload,
+                stream,
+                timing,
+            )
+        except ApiClientError as ex:
+            self._call_failed(timing, ex)
+            raise
+        return self._call_succeeded(timing, response)
+
+    def _call_succeeded(
+        self,
+        timing: RequestTiming,
+        response: RestResponse,
+    ) -> RestResponse:
+        """Complete the timing record of a call and emit on_response.
+
+        :param timing: The timing record
+        :type timing: RequestTiming
+        :param response: The response
+        :type response: RestResponse
+        :return: The response
+        :rtype: RestResponse
+        """
+        timing.finish(response.status_code)
+        response.timing = timing
+        self.hooks.emit_response(timing, response)
+        return response
+
+    def _call_failed(self, timing: RequestTiming, error: ApiClientError) -> None:
+        """Complete the timing record of a call and emit on_error.
+
+        :param timing: The timing record
+        :type timing: RequestTiming
+        :param error: The error raised by the call
+        :type error: ApiClientError
+        """
+        timing.finish(error.status or None)
+        self.hooks.emit_error(timing, error)
+
+    def _pagination(self, name: str) -> Pagination:
+        """Return the pagination of an endpoint.
+
+        :param name: Endpoint name
+        :type name: str
+        :raises EndpointNotFoundError: If endpoint not found
+        :raises ValueError: If the endpoint has no pagination
+        :return: The pagination
+        :rtype: Pagination
+        """
         endpoint: Optional[Endpoint] = self._endpoints.get(name, None)
         if endpoint is None:
             raise EndpointNotFoundError("Endpoint '{0}' not found.".format(name))
-        url, method = endpoint.prepare(self.api_root, **kwargs)
+        if endpoint.pagination is None:
+            raise ValueError("Endpoint '{0}' is not paginated.".format(name))
+        return endpoint.pagination
+
+    def _template(self, name: str) -> EndpointTemplate:
+        """Return the url template of an endpoint, compiling it on first use.
+
+        :param name: Endpoint name
+        :type name: str
+        :raises EndpointNotFoundError: If endpoint not found
+        :raises MissingMethodNameError: If the endpoint has no method and none
+            can be found from its name
+        :return: The template
+        :rtype: EndpointTemplate
+        """
+        template: Optional[EndpointTemplate] = self._templates.get(name, None)
+        if template is None:
+            endpoint: Optional[Endpoint] = self._endpoints.get(name, None)
+            if endpoint is None:
+                raise EndpointNotFoundError("Endpoint '{0}' not found.".format(name))
+            template = endpoint.compile(self._api_root)
+            self._templates[name] = template
+        return template
+
+    def _check_page_url(self, url: str) -> None:
+        """Check a next page link stays on the scheme and host of the api root.
+
+        The default headers carry the credentials of the api, they are never
+        sent to another origin.
+
+        :param url: Absolute url of the page
+        :type url: str
+        :raises ValueError: If the url is on another scheme or host
+        """
+        root = urlsplit(self._api_root)
+        target = urlsplit(url)
+        if (target.scheme.lower(), target.netloc.lower()) != (
+            root.scheme.lower(),
+            root.netloc.lower(),
+        ):
+            raise ValueError(
+                "Next page {0} is not on the api root {1}.".format(
+                    url,
+                    self._api_root,
+                ),
+            )
+
+    def _prepare_call(
+        self,
+        name: str,
+        payload: Optional[Payload],
+        headers: Optional[Headers],
+        timing: Optional[RequestTiming],
+        kwargs: Mapping[str, IntStrBool],
+        url: Optional[str] = None,
+    ) -> Tuple[EndpointTemplate, str, Headers, Payload]:
+        """Prepare the url and headers of an endpoint call.
+
+        :param name: Endpoint name
+        :type name: str
+        :param payload: Payload to send
+        :type payload: Optional[Payload]
+        :param headers: Headers to send
+        :type headers: Optional[Headers]
+        :param timing: Timing record of the call
+        :type timing: Optional[RequestTiming]
+        :param kwargs: Path and query parameters
+        :type kwargs: Mapping[str, IntStrBool]
+        :param url: Absolute url overriding the endpoint one, defaults to None
+        :type url: Optional[str], optional
+        :raises EndpointNotFoundError: If endpoint not found
+        :return: Endpoint template, URL, headers and payload of the call
+        :rtype: Tuple[EndpointTemplate, str, Headers, Payload]
+        """
+        template = self._template(name)
+        if url is None:
+            url = template.build(**kwargs)
+        prepared = time.perf_counter() if timing is not None else 0
+        if timing is not None:
+            timing.method = template.method.name
+            timing.url = url
+            timing.prepare_url = prepared - timing.started
 
         if payload is None:
             payload = Payload()
         heads = self._prepare_headers(payload, headers)
-        if mode == ExecutionMode.SYNC:
-            return self._send_request(url, method, heads, endpoint.timeout, payload)
-        raise NotImplementedError("Async request is not implemented yet!")
+        if timing is not None:
+            timing.prepare_headers = time.perf_counter() - prepared
+        return template, url, heads, payload
+
+    @classmethod
+    def _create_session(
+        cls,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+    ) -> requests.Session:
+        """Create a session with a configured connection pool adapter.
+
+        :param pool_connections: Number of host connection pools to cache
+        :type pool_connections: int
+        :param pool_maxsize: Maximum number of connections kept per pool
+        :type pool_maxsize: int
+        :param pool_block: Block when no free connection is available
+        :type pool_block: bool
+        :return: The session
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def _register_endpoints(self, endpoints: List[Endpoint]) -> None:
         """Register Endpoints.
@@ -118,7 +996,7 @@ class RestRequest:  # noqa: WPS214
             self._register_endpoint(ep)
 
     def _register_endpoint(self, endpoint: Endpoint) -> None:
-        """Register Endpoint.
+        """Register Endpoint, its url template is compiled on the first call.
 
         :param endpoint: Endpoint to register
         :type endpoint: Endpoint
@@ -128,88 +1006,776 @@ class RestRequest:  # noqa: WPS214
             raise KeyError("Endpoint name {0} already exists.".format(endpoint.name))
         self._endpoints[endpoint.name] = endpoint
 
-    def _send_request(  # type: ignore[explicit-any]
+    def _send_request(
         self,
+        template: EndpointTemplate,
         url: str,
-        method: HTTPMethod,
         headers: Headers,
-        timeout: ReqTimeOut,
         payload: Optional[Payload] = None,
-        **kwargs: Any,
+        stream: bool = False,
+        timing: Optional[RequestTiming] = None,
     ) -> RestResponse:
         """Send a request.
 
-        :param method: Request method
-        :type method: str
+        :param template: The endpoint template
+        :type template: EndpointTemplate
         :param url: The url to send the request
         :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object, defaults to None
+        :type payload: Optional[Payload], optional
+        :param stream: Stream the response body, defaults to False
+        :type stream: bool, optional
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
         :return: The request response
         :rtype: RestResponse
         """
-        return self._execute(method, url, timeout, headers, payload, **kwargs)
+        if self._flight is None or stream or template.method != HTTPMethod.GET:
+            return self._fetch(template, url, headers, payload, stream, timing)
+
+        def fetch() -> Tuple[RestResponse, Optional[RequestTiming]]:
+            return self._fetch(template, url, headers, payload, False, timing), timing
 
-    def _execute(  # noqa: C901, WPS238, WPS231
+        response, leader = self._flight.do(
+            flight_key(template.method.name, url, headers),
+            fetch,
+        )
+        if timing is not None and leader is not None and leader is not timing:
+            timing.record_flight(leader)
+        return response.copy()
+
+    def _fetch(
         self,
-        method: HTTPMethod,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        payload: Optional[Payload] = None,
+        stream: bool = False,
+        timing: Optional[RequestTiming] = None,
+    ) -> RestResponse:
+        """Send a request through the cache.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param url: The url to send the request
+        :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object, defaults to None
+        :type payload: Optional[Payload], optional
+        :param stream: Stream the response body, defaults to False
+        :type stream: bool, optional
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
+        :return: The request response
+        :rtype: RestResponse
+        """
+        key, entry, heads = self._cache_begin(template, url, headers, stream)
+        if entry is not None and entry.is_fresh():
+            return self._cached_response(template, entry)
+        response = self._execute(template, url, heads, payload, stream, timing)
+        if key is None:
+            return response
+        return self._cache_finish(template, key, entry, url, heads, response)
+
+    async def _asend_request(
+        self,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        payload: Optional[Payload] = None,
+        timing: Optional[RequestTiming] = None,
+    ) -> RestResponse:
+        """Send a request without blocking the event loop.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param url: The url to send the request
+        :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object, defaults to None
+        :type payload: Optional[Payload], optional
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
+        :return: The request response
+        :rtype: RestResponse
+        """
+        if self._aflight is None or template.method != HTTPMethod.GET:
+            return await self._afetch(template, url, headers, payload, timing)
+
+        async def fetch() -> Tuple[RestResponse, Optional[RequestTiming]]:
+            response = await self._afetch(template, url, headers, payload, timing)
+            return response, timing
+
+        response, leader = await self._aflight.do(
+            flight_key(template.method.name, url, headers),
+            fetch,
+        )
+        if timing is not None and leader is not None and leader is not timing:
+            timing.record_flight(leader)
+        return response.copy()
+
+    async def _afetch(
+        self,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        payload: Optional[Payload] = None,
+        timing: Optional[RequestTiming] = None,
+    ) -> RestResponse:
+        """Send a request through the cache without blocking the event loop.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param url: The url to send the request
+        :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object, defaults to None
+        :type payload: Optional[Payload], optional
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
+        :return: The request response
+        :rtype: RestResponse
+        """
+        key, entry, heads = self._cache_begin(template, url, headers, False)
+        if entry is not None and entry.is_fresh():
+            return self._cached_response(template, entry)
+        response = await self._aexecute(template, url, heads, payload, timing)
+        if key is None:
+            return response
+        return self._cache_finish(template, key, entry, url, heads, response)
+
+    def _cache_begin(
+        self,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        stream: bool,
+    ) -> Tuple[Optional[str], Optional[CachedResponse], Headers]:
+        """Look a request up in the cache.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param url: The url to send the request
+        :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param stream: Stream the response body
+        :type stream: bool
+        :return: The cache key, None when the request is not cacheable, the cached
+            response if any and the headers to send, conditional when it is stale
+        :rtype: Tuple[Optional[str], Optional[CachedResponse], Headers]
+        """
+        if self.cache is None or stream or template.method != HTTPMethod.GET:
+            return None, None, headers
+        key = self.cache.key(
+            template.method.name,
+            url,
+            ChainMap(headers, self._default_headers),
+        )
+        entry = self.cache.lookup(key, headers)
+        if entry is None or entry.is_fresh():
+            return key, entry, headers
+        heads = headers.copy()
+        heads.update(self.cache.conditional_headers(entry))
+        return key, entry, heads
+
+    def _cache_finish(  # noqa: WPS211
+        self,
+        template: EndpointTemplate,
+        key: str,
+        entry: Optional[CachedResponse],
+        url: str,
+        headers: Headers,
+        response: RestResponse,
+    ) -> RestResponse:
+        """Store a response in the cache or serve a revalidated one.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param key: The cache key
+        :type key: str
+        :param entry: The stale cached response if any
+        :type entry: Optional[CachedResponse]
+        :param url: The url of the request
+        :type url: str
+        :param headers: The request headers
+        :type headers: Headers
+        :param response: The network response
+        :type response: RestResponse
+        :return: The response to return to the caller
+        :rtype: RestResponse
+        """
+        cache = self.cache
+        if cache is None:
+            return response
+        ttl = template.endpoint.cache_ttl
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            entry = cache.refresh(key, entry, response.headers, ttl)
+            return self._cached_response(template, entry)
+        if response.status_code == HTTPStatus.OK:
+            cache.store(
+                key,
+                url,
+                response.status_code,
+                response.reason,
+                response.headers,
+                response.content,
+                headers,
+                ttl,
+            )
+        return response
+
+    def _cached_response(
+        self,
+        template: EndpointTemplate,
+        entry: CachedResponse,
+    ) -> RestResponse:
+        """Build a RestResponse from a cached response.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param entry: The cached response
+        :type entry: CachedResponse
+        :return: The response
+        :rtype: RestResponse
+        """
+        return RestResponse(
+            entry.to_response(),
+            codec=self.codec,
+            adapter=template.adapter,
+        )
+
+    def _execute(
+        self,
+        template: EndpointTemplate,
         url: str,
-        timeout: ReqTimeOut,
         headers: Headers,
         payload: Optional[Payload],
+        stream: bool = False,
+        timing: Optional[RequestTiming] = None,
     ) -> RestResponse:
-        if payload is None:
-            payload = Payload({})
+        """Send a request, retrying it as the retry policy allows.
 
-        # run request
-        try:
-            if method == HTTPMethod.GET:
-                req = requests.request(
-                    method.name,
-                    url,
-                    timeout=timeout,
-                    headers=headers,
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param url: The url to send the request
+        :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object
+        :type payload: Optional[Payload]
+        :param stream: Stream the response body, defaults to False
+        :type stream: bool, optional
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
+        :return: The request response
+        :rtype: RestResponse
+        """
+        body, encoding = self._compress_body(
+            template.endpoint,
+            headers,
+            self._encode_body(template.method, headers, payload),
+        )
+        policy = self._retry_policy(template, payload)
+        transmit = partial(
+            self._transmit,
+            template,
+            url,
+            headers,
+            body,
+            stream,
+            timing,
+            encoding,
+        )
+        if policy is None:
+            return transmit()
+        started = time.monotonic()
+        attempt = 1
+        while True:  # noqa: WPS457
+            try:
+                return transmit()
+            except ApiClientError as ex:
+                delay = self._retry_delay(
+                    policy,
+                    template,
+                    attempt,
+                    started,
+                    ex,
+                    timing,
+                )
+                if delay is None:
+                    raise
+                if ex.response is not None:
+                    ex.response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def _aexecute(
+        self,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        payload: Optional[Payload],
+        timing: Optional[RequestTiming] = None,
+    ) -> RestResponse:
+        """Send a request without blocking, retrying it as the policy allows.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param url: The url to send the request
+        :type url: str
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object
+        :type payload: Optional[Payload]
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
+        :return: The request response
+        :rtype: RestResponse
+        """
+        body, encoding = self._compress_body(
+            template.endpoint,
+            headers,
+            self._encode_body(template.method, headers, payload),
+        )
+        policy = self._retry_policy(template, payload)
+        transmit = partial(
+            self._atransmit,
+            template,
+            url,
+            headers,
+            body,
+            timing,
+            encoding,
+        )
+        if policy is None:
+            return await transmit()
+        started = time.monotonic()
+        attempt = 1
+        while True:  # noqa: WPS457
+            try:
+                return await transmit()
+            except ApiClientError as ex:
+                delay = self._retry_delay(
+                    policy,
+                    template,
+                    attempt,
+                    started,
+                    ex,
+                    timing,
                 )
-            else:
-                if "json" in headers[_CONTENT_TYPE_KEY]:
-                    req = requests.request(
-                        method.name,
-                        url,
-                        json=payload.to_json(),
-                        timeout=timeout,
-                        headers=headers,
-                    )
-                elif payload.is_text:
-                    req = requests.request(
-                        method.name,
-                        url,
-                        data=payload.to_text(),
-                        timeout=timeout,
-                        headers=headers,
-                    )
-                elif payload.is_bytes:
-                    req = requests.request(
-                        method.name,
-                        url,
-                        data=payload.to_bytes(),
-                        timeout=timeout,
-                        headers=headers,
-                    )
-                else:
-                    # Cannot generate the request from given parameters
-                    msg = """Cannot prepare a request message for provided
-                             arguments. Please check that your arguments match
-                             declared content type."""
-                    raise ApiClientError(status=0, reason=msg)
+                if delay is None:
+                    raise
+                if ex.response is not None:
+                    await ex.response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
+    def _retry_policy(
+        self,
+        template: EndpointTemplate,
+        payload: Optional[Payload],
+    ) -> Optional[RetryPolicy]:
+        """Return the retry policy of a call.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param payload: The Payload object
+        :type payload: Optional[Payload]
+        :return: The policy of the endpoint or of the client, None when there
+            is none or the body cannot be sent again
+        :rtype: Optional[RetryPolicy]
+        """
+        if payload is not None and not payload.is_replayable:
+            return None
+        return template.endpoint.retry or self.retry
+
+    def _retry_delay(  # noqa: WPS211
+        self,
+        policy: RetryPolicy,
+        template: EndpointTemplate,
+        attempt: int,
+        started: float,
+        error: ApiClientError,
+        timing: Optional[RequestTiming] = None,
+    ) -> Optional[float]:
+        """Return the delay before retrying a failed attempt.
+
+        :param policy: The retry policy
+        :type policy: RetryPolicy
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :param attempt: Number of the failed attempt, starting at 1
+        :type attempt: int
+        :param started: time.monotonic() of the first attempt
+        :type started: float
+        :param error: The failure
+        :type error: ApiClientError
+        :param timing: Timing record of the call, defaults to None
+        :type timing: Optional[RequestTiming], optional
+        :return: Delay in seconds, None to give up
+        :rtype: Optional[float]
+        """
+        name = template.endpoint.name
+        delay = policy.next_delay(template.method.name, attempt, started, error)
+        if delay is None:
+            if attempt > 1:
+                self.retry_metrics.record_exhausted(name)
+            return None
+        self.retry_metrics.record_retry(name, error, delay)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "retry %s attempt %d in %.3fs: %s",
+                name,
+                attempt + 1,
+                delay,
+                error.status,
+            )
+        if timing is not None:
+            self.hooks.emit_retry(timing, error, delay)
+        return delay
+
+    def _transmit(
+        self,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        body: RequestBody,
+        stream: bool = False,
+        timing: Optional[RequestTiming] = None,
+        encoding: Optional[str] = None,
+    ) -> RestResponse:
+        self._breaker_allow(url)
+        limiters = self._limiters(template)
+        wait = self._reserve(limiters)
+        if wait > 0:
+            time.sleep(wait)
+        sent = time.perf_counter() if timing is not None else 0
+        if timing is not None:
+            timing.attempts += 1
+        try:
+            req = self._session.request(
+                template.method.name,
+                url,
+                data=self._request_data(body, encoding),
+                timeout=template.endpoint.timeout,
+                headers=headers,
+                stream=stream,
+            )
+        except Exception as ex:
+            self._breaker_record(None)
+            raise self._transport_error(ex)
+
+        if timing is not None:
+            timing.record_transfer(sent, req.elapsed.total_seconds(), stream)
+
+        response = RestResponse(
+            req,
+            stream=stream,
+            codec=self.codec,
+            adapter=template.adapter,
+        )
+
+        self._throttle_feedback(limiters, response)
+        self._breaker_record(response)
+        try:
+            self._check_response(response)
+        except ApiClientError:
+            if stream:
+                response.release()
+            raise
+
+        return response
+
+    async def _atransmit(
+        self,
+        template: EndpointTemplate,
+        url: str,
+        headers: Headers,
+        body: RequestBody,
+        timing: Optional[RequestTiming] = None,
+        encoding: Optional[str] = None,
+    ) -> RestResponse:
+        self._breaker_allow(url)
+        limiters = self._limiters(template)
+        wait = self._reserve(limiters)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        client = self._get_async_client()
+        extensions = None
+        if timing is not None:
+            timing.attempts += 1
+            extensions = {"trace": timing.tracer()}
+        try:
+            req = await client.request(
+                template.method.name,
+                url,
+                content=self._request_content(body, encoding),
+                timeout=async_timeout(template.endpoint.timeout),
+                headers=headers,
+                extensions=extensions,
+            )
         except Exception as ex:
-            msg = "{0}\n{1}".format(type(ex).__name__, str(ex))
-            raise ApiClientError(status=0, reason=msg)
+            self._breaker_record(None)
+            raise self._transport_error(ex)
 
-        response = RestResponse(req)
+        response = RestResponse(req, codec=self.codec, adapter=template.adapter)
 
+        self._throttle_feedback(limiters, response)
+        self._breaker_record(response)
         self._check_response(response)
 
         return response
 
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the asynchronous client of the running event loop.
+
+        The pooled connections of an httpx client belong to the event loop
+        that opened them: the client is created on first use and replaced when
+        the calls move to another loop, e.g. a second ``asyncio.run``.
+
+        :return: The asynchronous client
+        :rtype: httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = create_async_client(
+                self._async_max_connections,
+                self._async_max_keepalive_connections,
+                self._async_default_headers(),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def _breaker_allow(self, url: str) -> None:
+        """Fail fast when the circuit breaker is open.
+
+        :param url: The url of the request
+        :type url: str
+        :raises CircuitOpenError: If the circuit is open
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(
+                urlsplit(url).netloc,
+                breaker.retry_after(),
+                breaker.state == CircuitState.HALF_OPEN,
+            )
+
+    def _breaker_record(self, response: Optional[RestResponse]) -> None:
+        """Report the outcome of a request to the circuit breaker.
+
+        Transport errors and server errors are failures, any other response
+        shows the host is up.
+
+        :param response: The response, None on transport error
+        :type response: Optional[RestResponse]
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return
+        if response is None or response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    @classmethod
+    def _reserve(cls, limiters: List[TokenBucket]) -> float:
+        """Reserve a token on every rate limiter of a call.
+
+        The waits overlap, the call waits for the slowest limiter only.
+
+        :param limiters: The rate limiters
+        :type limiters: List[TokenBucket]
+        :return: Seconds to wait before sending the call
+        :rtype: float
+        """
+        return max((limiter.reserve() for limiter in limiters), default=0)
+
+    def _limiters(self, template: EndpointTemplate) -> List[TokenBucket]:
+        """Return the rate limiters of a request.
+
+        :param template: The endpoint template
+        :type template: EndpointTemplate
+        :return: The limiters of the api root and of the endpoint
+        :rtype: List[TokenBucket]
+        """
+        limiters = []
+        if self.rate_limit is not None:
+            limiters.append(self.rate_limit)
+        if template.endpoint.rate_limit is not None:
+            limiters.append(template.endpoint.rate_limit)
+        return limiters
+
+    @classmethod
+    def _throttle_feedback(
+        cls,
+        limiters: List[TokenBucket],
+        response: RestResponse,
+    ) -> None:
+        """Adapt the rate limiters to a response.
+
+        :param limiters: The limiters of the request
+        :type limiters: List[TokenBucket]
+        :param response: The response
+        :type response: RestResponse
+        """
+        if not limiters:
+            return
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            for limiter in limiters:
+                limiter.on_throttle(retry_after)
+        elif response.status_code < HTTPStatus.BAD_REQUEST:
+            for limiter in limiters:
+                limiter.on_success()
+
+    def _encode_body(
+        self,
+        method: HTTPMethod,
+        headers: Headers,
+        payload: Optional[Payload],
+    ) -> RequestBody:
+        """Encode the payload for the declared content type.
+
+        JSON payloads are serialized once, straight to bytes. Streamed payloads
+        are returned as is, their chunks are read while each attempt is sent.
+
+        :param method: Request method
+        :type method: HTTPMethod
+        :param headers: Prepared request headers
+        :type headers: Headers
+        :param payload: The Payload object
+        :type payload: Optional[Payload]
+        :raises ApiClientError: If payload does not match the content type
+        :return: The request body
+        :rtype: RequestBody
+        """
+        if method == HTTPMethod.GET:
+            return None
+        if payload is None:
+            payload = Payload({})
+        if payload.is_stream:
+            return payload
+        if "json" in headers[_CONTENT_TYPE_KEY]:
+            return payload.to_json_bytes(self.codec)
+        elif payload.is_text:
+            return payload.to_text()
+        elif payload.is_bytes:
+            return payload.to_bytes()
+        # Cannot generate the request from given parameters
+        msg = """Cannot prepare a request message for provided
+                 arguments. Please check that your arguments match
+                 declared content type."""
+        raise ApiClientError(status=0, reason=msg)
+
+    @classmethod
+    def _compress_body(
+        cls,
+        endpoint: Endpoint,
+        headers: Headers,
+        body: RequestBody,
+    ) -> Tuple[RequestBody, Optional[str]]:
+        """Choose the content encoding of a request body.
+
+        Bodies of endpoints declaring a compression are compressed from the
+        configured size, unless the caller already encoded them. The
+        compression itself happens chunk by chunk while each attempt is sent.
+        Streamed bodies of unknown length are always compressed, those sent
+        uncompressed declare their length when it is known.
+
+        :param endpoint: The endpoint
+        :type endpoint: Endpoint
+        :param headers: Prepared request headers, updated with Content-Encoding
+        :type headers: Headers
+        :param body: The encoded body
+        :type body: RequestBody
+        :return: The body, as bytes when compressed, and its content encoding
+        :rtype: Tuple[RequestBody, Optional[str]]
+        """
+        encoding = endpoint.compress
+        if _CONTENT_ENCODING_KEY in headers:
+            encoding = None
+        if isinstance(body, Payload):
+            length = body.content_length
+            if length is not None and length < endpoint.compress_min_size:
+                encoding = None
+            if encoding is None and length is not None:
+                headers[_CONTENT_LENGTH_KEY] = str(length)
+        elif encoding is None or body is None:
+            return body, None
+        else:
+            if isinstance(body, str):
+                body = body.encode()
+            if len(body) < endpoint.compress_min_size:
+                return body, None
+        if encoding is not None:
+            headers[_CONTENT_ENCODING_KEY] = encoding
+        return body, encoding
+
+    @classmethod
+    def _request_data(
+        cls,
+        body: RequestBody,
+        encoding: Optional[str],
+    ) -> Optional[Union[str, bytes, Iterable[bytes]]]:
+        """Return the data of an attempt for the requests session.
+
+        Memoryview chunks are written to the socket as they are, without copy.
+
+        :param body: The request body
+        :type body: RequestBody
+        :param encoding: Content encoding to compress it with, None to send it
+            as is
+        :type encoding: Optional[str]
+        :return: The body or an iterator of its chunks
+        :rtype: Optional[Union[str, bytes, Iterable[bytes]]]
+        """
+        chunks = body.chunks() if isinstance(body, Payload) else body
+        if encoding is None:
+            return cast(Optional[Union[str, bytes, Iterable[bytes]]], chunks)
+        return compress_chunks(cast(Chunks, chunks), encoding)
+
+    @classmethod
+    def _request_content(
+        cls,
+        body: RequestBody,
+        encoding: Optional[str],
+    ) -> Optional[Union[str, bytes, AsyncIterator[bytes]]]:
+        """Return the content of an attempt for the asynchronous client.
+
+        :param body: The request body
+        :type body: RequestBody
+        :param encoding: Content encoding to compress it with, None to send it
+            as is
+        :type encoding: Optional[str]
+        :return: The body or an asynchronous iterator of its chunks
+        :rtype: Optional[Union[str, bytes, AsyncIterator[bytes]]]
+        """
+        if encoding is not None:
+            chunks = body.chunks() if isinstance(body, Payload) else body
+            return acompress_chunks(cast(Chunks, chunks), encoding)
+        if isinstance(body, Payload):
+            return cast(AsyncIterator[bytes], body.achunks())
+        return body
+
+    @classmethod
+    def _transport_error(cls, ex: Exception) -> ApiClientError:
+        """Wrap a transport exception.
+
+        :param ex: The exception raised by the transport
+        :type ex: Exception
+        :return: The wrapping exception
+        :rtype: ApiClientError
+        """
+        msg = "{0}\n{1}".format(type(ex).__name__, str(ex))
+        return ApiClientError(status=0, reason=msg)
+
     # def info(self) -> RestResponse:
     #     """Get info about account.
 
@@ -252,6 +1818,37 @@ class RestRequest:  # noqa: WPS214
                 )
             headers[key] = header
 
+    def _update_default_headers(self) -> None:
+        """Compute the default headers and set them on the clients.
+
+        The session and the asynchronous client merge them into each request,
+        so per-call headers only hold the content type and the overrides.
+        """
+        defaults = Headers(
+            {
+                "User-Agent": "{0} {1}".format(self._user_agent, self._version),
+                _ACCEPT_ENCODING_KEY: ACCEPT_ENCODING,
+            },
+        )
+        if self._api_key:
+            defaults[_AUTHORIZATION_KEY] = "Bearer {0}".format(self._api_key)
+        self._default_headers = defaults
+        self._session.headers.pop(_AUTHORIZATION_KEY, None)
+        self._session.headers.update(defaults)
+        if self._async_client is not None:
+            self._async_client.headers.pop(_AUTHORIZATION_KEY, None)
+            self._async_client.headers.update(self._async_default_headers())
+
+    def _async_default_headers(self) -> Headers:
+        """Return the default headers of the asynchronous client.
+
+        :return: The default headers, advertising the encodings httpx decodes
+        :rtype: Headers
+        """
+        defaults = self._default_headers.copy()
+        defaults[_ACCEPT_ENCODING_KEY] = ASYNC_ACCEPT_ENCODING
+        return defaults
+
     def _prepare_headers(
         self,
         payload: Payload,
@@ -259,6 +1856,9 @@ class RestRequest:  # noqa: WPS214
     ) -> Headers:
         """Prepare headers.
 
+        The default headers are set on the clients, only the content type is
+        added to the request headers.
+
         :param payload: The Payload object
         :type payload: Payload
         :param headers: Request headers, defaults to None
@@ -266,23 +1866,13 @@ class RestRequest:  # noqa: WPS214
         :return: Prepared request headers
         :rtype: Headers
         """
-        heads: Headers
         if headers is None:
-            initial_headers: Dict[str, str] = {}
-            heads = Headers(initial_headers)
-        else:
-            heads = headers.copy()
-        if self.api_key:
-            self._add_key_if_missing(
-                heads,
-                "Authorization",
-                "Bearer {0}".format(self.api_key),
-            )
+            content_type = payload.content_type
+            if content_type is None:
+                raise ValueError(
+                    "header '{0}' cannot be None.".format(_CONTENT_TYPE_KEY),
+                )
+            return Headers({_CONTENT_TYPE_KEY: content_type})
+        heads = headers.copy()
         self._add_key_if_missing(heads, _CONTENT_TYPE_KEY, payload.content_type)
-        self._add_key_if_missing(
-            heads,
-            "User-Agent",
-            "{0} {1}".format(self.user_agent, self.version),
-        )
-        self._add_key_if_missing(heads, "Accept-Encoding", "gzip")
         return heads
@@ -2,19 +2,44 @@
 Response module for the package api_client of rest-api-client-framework library.
 
 Classes:
+    ServerSentEvent
     RestResponse
 """
 
+import copy
 import io
-import json
+import os
+import secrets
+import time
 from pathlib import Path
-from types import MappingProxyType
-from typing import Any, Dict, Optional
+from types import MappingProxyType, TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from requests import Response
 
+from api_client.codec import JsonCodec, get_codec, model_adapter
+from api_client.jsonstream import iter_array_items
+
+if TYPE_CHECKING:
+    import httpx
+
+    from api_client.hooks import RequestTiming
+
 _JSON = "json"
 
+DEFAULT_CHUNK_SIZE = 65536
+
 CONTENT_EXT_MAP = MappingProxyType(
     {
         _JSON: _JSON,
@@ -25,30 +50,108 @@ CONTENT_EXT_MAP = MappingProxyType(
     },
 )
 
+TransportResponse = Union[Response, "httpx.Response"]
+
+_SSE_MESSAGE = "message"
+
+
+class ServerSentEvent(BaseModel):  # type: ignore[explicit-any]
+    """
+    An event of a ``text/event-stream`` response.
+
+    :ivar event: Event type
+    :vartype event: str
+    :ivar data: Data lines of the event joined by newlines
+    :vartype data: str
+    :ivar event_id: Last event id sent by the server
+    :vartype event_id: Optional[str]
+    :ivar retry: Reconnection time asked by the server, in milliseconds
+    :vartype retry: Optional[int]
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    event: str = _SSE_MESSAGE
+    data: str = ""
+    event_id: Optional[str] = None
+    retry: Optional[int] = None
+
+    def decode(  # type: ignore[explicit-any]
+        self,
+        codec: Optional[JsonCodec] = None,
+    ) -> Any:
+        """Decode the data of the event as JSON.
+
+        :param codec: JSON codec, defaults to the default codec
+        :type codec: Optional[JsonCodec], optional
+        :raises ValueError: If the data is not a JSON document
+        :return: The decoded data
+        :rtype: Any
+        """
+        return get_codec(codec).loads(self.data)
+
+    def parsed(self, model: type) -> Any:  # type: ignore[explicit-any]
+        """Validate the data of the event into a model.
+
+        :param model: The model
+        :type model: type
+        :raises pydantic.ValidationError: If the data does not match the model
+        :return: The validated data
+        :rtype: Any
+        """
+        return model_adapter(model).validate_json(self.data)
+
 
 class RestResponse(io.IOBase):
     """This is a class to handle request responses.
 
-    :param response: request.Response object
-    :type response: request.Response
+    :param response: request.Response or httpx.Response object
+    :type response: TransportResponse
+    :param stream: leave the body on the network until it is read, defaults to
+        False
+    :type stream: bool, optional
+    :param codec: JSON codec decoding the body, defaults to the default codec
+    :type codec: Optional[JsonCodec], optional
+    :param adapter: Validator of the endpoint response model, defaults to None
+    :type adapter: Optional[TypeAdapter[Any]], optional
+
+    A streamed response reads nothing until the caller asks for it through
+    :meth:`iter_bytes`, :meth:`iter_lines`, :meth:`read` or :meth:`data`. Close
+    it, or use it as a context manager, to release the connection when the body
+    is not read to the end.
     """
 
     _headers: Dict[str, str]
     _status_code: int
+    _reader: Optional[io.BytesIO]
 
-    def __init__(self, resp: Response) -> None:
+    def __init__(  # type: ignore[explicit-any]
+        self,
+        resp: TransportResponse,
+        stream: bool = False,
+        codec: Optional[JsonCodec] = None,
+        adapter: Optional[TypeAdapter[Any]] = None,
+    ) -> None:
         """Construct a RestResponse object."""
         self.response = resp
         self._status_code = resp.status_code
-        self.reason = resp.reason
+        if isinstance(resp, Response):
+            self.reason = resp.reason
+        else:
+            self.reason = resp.reason_phrase
         self._headers = {}
         for kk, vv in resp.headers.items():
             self._headers[str(kk).lower()] = str(vv)
 
-        try:
-            self._data = json.loads(resp.content.decode("utf-8"))
-        except ValueError:
-            self._data = resp.content
+        self._stream = stream
+        self._loaded = not stream or not isinstance(resp, Response)
+        self._streamed = False
+        self._decoded = False
+        self._reader = None
+        self._codec = codec
+        self._adapter = adapter
+        self._parsed = False
+        self.timing: Optional["RequestTiming"] = None
 
     @property
     def status_code(self) -> int:
@@ -60,6 +163,270 @@ class RestResponse(io.IOBase):
         """Returns a dictionary of the response headers."""
         return self._headers
 
+    @property
+    def content(self) -> bytes:
+        """Return the raw response body, reading it if it is streamed.
+
+        :raises ValueError: If the body was already consumed as a stream
+        :return: The response body
+        :rtype: bytes
+        """
+        if self._streamed:
+            raise ValueError("Response body was already consumed as a stream.")
+        self._loaded = True
+        return self.response.content
+
+    def readable(self) -> bool:
+        """Return True, a response body can be read."""
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the response body.
+
+        :param size: Number of bytes to read, all when negative, defaults to -1
+        :type size: int, optional
+        :return: The bytes read, empty at the end of the body
+        :rtype: bytes
+        """
+        if self._loaded or not isinstance(self.response, Response):
+            if self._reader is None:
+                self._reader = io.BytesIO(self.content)
+            return self._reader.read(size)
+        self._streamed = True
+        raw = self.response.raw
+        return bytes(raw.read(None if size < 0 else size, decode_content=True))
+
+    def iter_bytes(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the response body in chunks.
+
+        :param chunk_size: Maximum size of a chunk, defaults to 65536
+        :type chunk_size: int, optional
+        :yield: The chunks of the body
+        :rtype: Iterator[bytes]
+        """
+        if self._loaded or not isinstance(self.response, Response):
+            content = self.content
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]
+            return
+        self._streamed = True
+        yield from self.response.iter_content(chunk_size)
+
+    def iter_lines(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the response body line by line.
+
+        Lines are split on newlines, which are removed along with a trailing
+        carriage return. The chunks of a line are joined once, when its end
+        arrives, so long lines are not copied again with every chunk.
+
+        :param chunk_size: Size of the chunks read, defaults to 65536
+        :type chunk_size: int, optional
+        :yield: The lines of the body
+        :rtype: Iterator[bytes]
+        """
+        pending: List[bytes] = []
+        for chunk in self.iter_bytes(chunk_size):
+            if b"\n" not in chunk:
+                pending.append(chunk)
+                continue
+            lines = chunk.split(b"\n")
+            pending.append(lines[0])
+            lines[0] = b"".join(pending)
+            pending = [lines.pop()]
+            for line in lines:
+                yield line.rstrip(b"\r")
+        tail = b"".join(pending)
+        if tail:
+            yield tail.rstrip(b"\r")
+
+    def iter_ndjson(  # type: ignore[explicit-any]
+        self,
+        parsed: bool = False,
+        model: Optional[type] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Iterate over the records of a newline delimited JSON body.
+
+        Each line is decoded as it arrives, a streamed body is never held in
+        memory. Blank lines are skipped.
+
+        :param parsed: Validate the records into the endpoint model, defaults
+            to False
+        :type parsed: bool, optional
+        :param model: Model to validate the records into, defaults to None
+        :type model: Optional[type], optional
+        :param chunk_size: Size of the chunks read, defaults to 65536
+        :type chunk_size: int, optional
+        :raises ValueError: If parsed is set without a response model, or a
+            line is not a JSON document
+        :raises pydantic.ValidationError: If a record does not match the model
+        :yield: The decoded or validated records
+        :rtype: Iterator[Any]
+        """
+        lines = (line for line in self.iter_lines(chunk_size) if line.strip())
+        yield from self._records(lines, parsed, model)
+
+    def iter_array(  # type: ignore[explicit-any]
+        self,
+        parsed: bool = False,
+        model: Optional[type] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Iterate over the elements of a JSON array body.
+
+        The top-level array is split as it arrives and its elements are decoded
+        one by one, only the element being received is held in memory.
+
+        :param parsed: Validate the elements into the endpoint model, defaults
+            to False
+        :type parsed: bool, optional
+        :param model: Model to validate the elements into, defaults to None
+        :type model: Optional[type], optional
+        :param chunk_size: Size of the chunks read, defaults to 65536
+        :type chunk_size: int, optional
+        :raises ValueError: If parsed is set without a response model, or the
+            body is not a JSON array
+        :raises pydantic.ValidationError: If an element does not match the model
+        :yield: The decoded or validated elements
+        :rtype: Iterator[Any]
+        """
+        items = iter_array_items(self.iter_bytes(chunk_size))
+        yield from self._records(items, parsed, model)
+
+    def iter_sse(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ServerSentEvent]:
+        """Iterate over the events of a server-sent events body.
+
+        Events are yielded when their terminating blank line arrives, comments
+        are skipped and an event left incomplete at the end is discarded.
+
+        :param chunk_size: Size of the chunks read, defaults to 65536
+        :type chunk_size: int, optional
+        :yield: The events
+        :rtype: Iterator[ServerSentEvent]
+        """
+        event_id: Optional[str] = None
+        retry: Optional[int] = None
+        event = ""
+        data: List[str] = []
+        for line in self.iter_lines(chunk_size):
+            if not line:
+                if data:
+                    yield ServerSentEvent(
+                        event=event or _SSE_MESSAGE,
+                        data="\n".join(data),
+                        event_id=event_id,
+                        retry=retry,
+                    )
+                event = ""
+                data = []
+                continue
+            name, _, valor = line.decode("utf-8").partition(":")
+            if valor.startswith(" "):
+                valor = valor[1:]
+            if name == "data":
+                data.append(valor)
+            elif name == "event":
+                event = valor
+            elif name == "id":
+                event_id = valor
+            elif name == "retry" and valor.isdigit():
+                retry = int(valor)
+
+    def write_to(
+        self,
+        target: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Write the response body to a binary file.
+
+        A streamed body is read from the network into a reused buffer and
+        written as it arrives, without holding it in memory.
+
+        :param target: The file written to
+        :type target: BinaryIO
+        :param chunk_size: Size of the read buffer, defaults to 65536
+        :type chunk_size: int, optional
+        :return: Number of bytes written
+        :rtype: int
+        """
+        if self._loaded or not isinstance(self.response, Response):
+            content = self.content
+            target.write(content)
+            return len(content)
+        self._streamed = True
+        raw = self.response.raw
+        raw.decode_content = True
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        written = 0
+        count = raw.readinto(buffer)
+        while count:
+            target.write(view[:count])
+            written += count
+            count = raw.readinto(buffer)
+        return written
+
+    def copy(self) -> "RestResponse":
+        """Return a response sharing the body, with its own timing record.
+
+        Coalesced callers receive a copy each, so that recording the timing of
+        one call does not change the response of another.
+
+        :return: The copy
+        :rtype: RestResponse
+        """
+        clone = copy.copy(self)
+        clone.timing = None
+        clone._reader = None  # noqa: WPS437
+        return clone
+
+    def release(self) -> None:
+        """Read the rest of a streamed body and release its connection.
+
+        The connection goes back to the pool, the body stays available to
+        :attr:`content` and :meth:`data`.
+        """
+        if isinstance(self.response, Response) and not self._streamed:
+            self._reader = io.BytesIO(self.content)
+            self.response.close()
+
+    def close(self) -> None:
+        """Close the response releasing its connection.
+
+        The body of an asynchronous call is read before the response is
+        returned, which already released its connection: only :meth:`aclose`
+        closes the httpx response itself.
+        """
+        if not self.closed and isinstance(self.response, Response):
+            self.response.close()
+        super().close()
+
+    async def aclose(self) -> None:
+        """Close the response of an asynchronous call."""
+        if not self.closed and not isinstance(self.response, Response):
+            await self.response.aclose()
+        self.close()
+
+    async def __aenter__(self) -> "RestResponse":
+        """Enter the asynchronous runtime context.
+
+        :return: This RestResponse object
+        :rtype: RestResponse
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exit the asynchronous runtime context closing the response."""
+        await self.aclose()
+
     def is_json(self) -> bool:
         """
         Check that response data is json document.
@@ -71,7 +438,7 @@ class RestResponse(io.IOBase):
         if ct is None:
             return False
 
-        return "application/json" in ct
+        return "application/json" in ct or "+json" in ct
 
     def header(self, name: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -93,14 +460,96 @@ class RestResponse(io.IOBase):
         """
         Return data downloaded from api.
 
+        The body is decoded on the first call and memoized. It is parsed as JSON
+        only when the content type says so, otherwise the raw bytes are returned.
+
         :return:
             return data from api
         """
+        if not self._decoded:
+            self._decode()
         return self._data
 
+    def parsed(  # type: ignore[explicit-any]
+        self,
+        model: Optional[type] = None,
+    ) -> Any:
+        """
+        Return the body validated into the response model.
+
+        The raw JSON bytes are validated by pydantic-core without decoding
+        them to Python objects first. The result for the endpoint model is
+        memoized.
+
+        :param model: Model overriding the endpoint model, defaults to None
+        :type model: Optional[type], optional
+        :raises ValueError: If there is no model to validate into
+        :raises pydantic.ValidationError: If the body does not match the model
+        :return: The validated body
+        :rtype: Any
+        """
+        if model is not None:
+            return model_adapter(model).validate_json(self.content)
+        if self._adapter is None:
+            raise ValueError("No response model to parse the response into.")
+        if not self._parsed:
+            content = self.content
+            started = time.perf_counter() if self.timing is not None else 0
+            self._parsed_data = self._adapter.validate_json(content)
+            self._parsed = True
+            if self.timing is not None:
+                self.timing.decode = time.perf_counter() - started
+        return self._parsed_data
+
+    def _records(  # type: ignore[explicit-any]
+        self,
+        raw_records: Iterator[bytes],
+        parsed: bool,
+        model: Optional[type],
+    ) -> Iterator[Any]:
+        """Decode or validate the raw JSON records of the body.
+
+        :param raw_records: The JSON documents of the records
+        :type raw_records: Iterator[bytes]
+        :param parsed: Validate the records into the endpoint model
+        :type parsed: bool
+        :param model: Model overriding the endpoint model
+        :type model: Optional[type]
+        :raises ValueError: If parsed is set without a response model
+        :yield: The decoded or validated records
+        :rtype: Iterator[Any]
+        """
+        adapter = self._adapter if parsed else None
+        if model is not None:
+            adapter = model_adapter(model)
+        elif parsed and adapter is None:
+            raise ValueError("No response model to parse the response into.")
+        if adapter is None:
+            loads = get_codec(self._codec).loads
+            yield from map(loads, raw_records)
+        else:
+            yield from map(adapter.validate_json, raw_records)
+
+    def _decode(self) -> None:
+        """Decode the response body."""
+        content = self.content
+        self._data = content
+        if self.is_json():
+            started = time.perf_counter() if self.timing is not None else 0
+            try:
+                self._data = get_codec(self._codec).loads(content)
+            except ValueError:
+                self._data = content
+            if self.timing is not None:
+                self.timing.decode = time.perf_counter() - started
+        self._decoded = True
+
     def save(self, path: str) -> str:  # noqa: WPS210
         """Save response data to file.
 
+        The raw body is written to a temporary file next to the target, streamed
+        from the network when the response is, then renamed into place.
+
         If you set file path without extension method will auto detect output file
         extension from mime type.
         Example you take screenshot and want to save to jpg.
@@ -134,12 +583,13 @@ class RestResponse(io.IOBase):
         if add_ext_to_path:
             save_path = "{0}.{1}".format(path, ext)
 
-        if ext == _JSON:
-            with open(save_path, "w") as save_t:
-                json.dump(self._data, save_t)
-        else:
-            with open(save_path, "wb") as save_b:
-                save_b.write(self._data)
-                save_b.close()
+        temp_path = "{0}.{1}.part".format(save_path, secrets.token_hex(4))
+        try:
+            with open(temp_path, "xb") as save_b:
+                self.write_to(save_b)
+            os.replace(temp_path, save_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
 
         return save_path
@@ -0,0 +1,196 @@
+"""
+Retry module for the package api_client of rest-api-client-framework library.
+
+Classes:
+    RetryPolicy
+    RetryMetrics
+
+Functions:
+    parse_retry_after
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from api_client.exception import ApiClientError, CircuitOpenError
+
+RETRY_AFTER_KEY = "retry-after"
+
+
+def parse_retry_after(header: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header.
+
+    :param header: Header value, delay seconds or an HTTP date
+    :type header: Optional[str]
+    :return: Seconds to wait, None when the header is missing or invalid
+    :rtype: Optional[float]
+    """
+    if not header:
+        return None
+    header = header.strip()
+    if header.isdigit():
+        return float(header)
+    try:
+        when = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return None
+    return max(0, when.timestamp() - time.time())
+
+
+class RetryPolicy(BaseModel):  # type: ignore[explicit-any]
+    """
+    Policy deciding whether and when a failed request is sent again.
+
+    :ivar max_attempts: Maximum number of attempts, the first one included
+    :vartype max_attempts: int
+    :ivar backoff_factor: Delay before the first retry, doubled at each retry
+    :vartype backoff_factor: float
+    :ivar max_backoff: Maximum delay between attempts
+    :vartype max_backoff: float
+    :ivar jitter: Draw the delay uniformly between zero and the backoff
+    :vartype jitter: bool
+    :ivar total_timeout: Time budget of all the attempts and delays, in seconds
+    :vartype total_timeout: Optional[float]
+    :ivar retry_statuses: Response statuses retried
+    :vartype retry_statuses: FrozenSet[int]
+    :ivar methods: Request methods retried, the idempotent ones by default
+    :vartype methods: FrozenSet[str]
+    :ivar retry_transport_errors: Retry connection errors and timeouts
+    :vartype retry_transport_errors: bool
+    :ivar respect_retry_after: Wait as long as the Retry-After header asks, up
+        to max_backoff
+    :vartype respect_retry_after: bool
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: int = Field(default=3, ge=1)
+    backoff_factor: float = Field(default=0.5, ge=0)
+    max_backoff: float = Field(default=30, ge=0)
+    jitter: bool = True
+    total_timeout: Optional[float] = None
+    retry_statuses: FrozenSet[int] = frozenset((429, 502, 503, 504))
+    methods: FrozenSet[str] = frozenset(("GET", "PUT", "DELETE"))
+    retry_transport_errors: bool = True
+    respect_retry_after: bool = True
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay after a failed attempt.
+
+        :param attempt: Number of the failed attempt, starting at 1
+        :type attempt: int
+        :return: Delay in seconds
+        :rtype: float
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2.0 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def is_retryable(self, method: str, error: ApiClientError) -> bool:
+        """Check whether a failed request may be sent again.
+
+        :param method: Request method
+        :type method: str
+        :param error: The failure
+        :type error: ApiClientError
+        :return: True when the request may be retried
+        :rtype: bool
+        """
+        if method.upper() not in self.methods or isinstance(error, CircuitOpenError):
+            return False
+        if error.response is None:
+            return self.retry_transport_errors and error.status == 0
+        return error.status in self.retry_statuses
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        started: float,
+        error: ApiClientError,
+    ) -> Optional[float]:
+        """Return the delay before the next attempt.
+
+        :param method: Request method
+        :type method: str
+        :param attempt: Number of the failed attempt, starting at 1
+        :type attempt: int
+        :param started: time.monotonic() of the first attempt
+        :type started: float
+        :param error: The failure
+        :type error: ApiClientError
+        :return: Delay in seconds, None to give up
+        :rtype: Optional[float]
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(method, error):
+            return None
+        delay = None
+        if self.respect_retry_after and error.response is not None:
+            delay = parse_retry_after(error.response.headers.get(RETRY_AFTER_KEY))
+        if delay is None:
+            delay = self.backoff(attempt)
+        else:
+            delay = min(self.max_backoff, delay)
+        if self.total_timeout is not None:
+            if time.monotonic() - started + delay > self.total_timeout:
+                return None
+        return delay
+
+
+class RetryMetrics:
+    """Thread safe counters of the retries made by a RestRequest."""
+
+    def __init__(self) -> None:
+        """Construct a RetryMetrics object."""
+        self._lock = threading.Lock()
+        self._retries: Counter[str] = Counter()
+        self._reasons: Counter[str] = Counter()
+        self._exhausted: Counter[str] = Counter()
+        self._delay = 0.0
+
+    def record_retry(self, endpoint: str, error: ApiClientError, delay: float) -> None:
+        """Count a retry.
+
+        :param endpoint: Endpoint name
+        :type endpoint: str
+        :param error: The failure retried
+        :type error: ApiClientError
+        :param delay: Delay before the retry
+        :type delay: float
+        """
+        reason = str(error.status) if error.status else "transport"
+        with self._lock:
+            self._retries[endpoint] += 1
+            self._reasons[reason] += 1
+            self._delay += delay
+
+    def record_exhausted(self, endpoint: str) -> None:
+        """Count a request failing after at least one retry.
+
+        :param endpoint: Endpoint name
+        :type endpoint: str
+        """
+        with self._lock:
+            self._exhausted[endpoint] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return a copy of the counters.
+
+        :return: Retries and exhausted requests per endpoint, retries per
+            status or transport failure and the total delay slept
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        with self._lock:
+            return {
+                "retries": dict(self._retries),
+                "reasons": dict(self._reasons),
+                "exhausted": dict(self._exhausted),
+                "delay": {"seconds": self._delay},
+            }
@@ -0,0 +1,69 @@
+"""
+Transport module for the package api_client of rest-api-client-framework library.
+
+The asynchronous transport is backed by httpx, an optional dependency installed
+with the ``async`` extra.
+
+Variables:
+    HAS_HTTPX
+
+Functions:
+    create_async_client
+    async_timeout
+"""
+
+from typing import Mapping, Optional
+
+from api_client.endpoint import ReqTimeOut
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    HAS_HTTPX = False
+else:
+    HAS_HTTPX = True
+
+MISSING_HTTPX_MSG = (
+    "Async requests need httpx, "
+    "install it with: pip install 'rest-api-client-framework[async]'"
+)
+
+
+def create_async_client(
+    max_connections: int,
+    max_keepalive_connections: int,
+    headers: Optional[Mapping[str, str]] = None,
+) -> "httpx.AsyncClient":
+    """Create a pooled asynchronous http client.
+
+    :param max_connections: Maximum number of concurrent connections
+    :type max_connections: int
+    :param max_keepalive_connections: Maximum number of idle connections kept alive
+    :type max_keepalive_connections: int
+    :param headers: Headers sent with every request, defaults to None
+    :type headers: Optional[Mapping[str, str]], optional
+    :raises ImportError: If httpx is not installed
+    :return: The asynchronous client
+    :rtype: httpx.AsyncClient
+    """
+    if not HAS_HTTPX:  # pragma: no cover
+        raise ImportError(MISSING_HTTPX_MSG)
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    return httpx.AsyncClient(limits=limits, headers=headers)
+
+
+def async_timeout(timeout: ReqTimeOut) -> "httpx.Timeout":
+    """Convert a requests style timeout to an httpx timeout.
+
+    :param timeout: Timeout in seconds or (connect, read) tuple
+    :type timeout: ReqTimeOut
+    :return: The httpx timeout
+    :rtype: httpx.Timeout
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
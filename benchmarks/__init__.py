@@ -0,0 +1 @@
+"""Package benchmarks of rest-api-client-framework library."""
@@ -0,0 +1,39 @@
+"""
+Module bench_codec for package benchmarks of rest-api-client-framework library.
+
+Compares the installed JSON codecs encoding and decoding representative payloads.
+
+Usage:
+    python -m benchmarks.bench_codec
+"""
+
+import timeit
+
+from api_client.codec import available_codecs, get_codec
+from benchmarks.server import records
+
+PAYLOADS = (("small", 1, 20000), ("medium", 100, 500), ("large", 10000, 5))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print("{0:8} {1:8} {2:>14} {3:>14}".format("codec", "payload", "dumps", "loads"))
+    for name in available_codecs():
+        codec = get_codec(name)
+        for label, count, number in PAYLOADS:
+            document = records(count)
+            encoded = codec.dumps(document)
+            dumps = min(timeit.repeat(lambda: codec.dumps(document), number=number))
+            loads = min(timeit.repeat(lambda: codec.loads(encoded), number=number))
+            print(
+                "{0:8} {1:8} {2:>11.2f} us {3:>11.2f} us".format(
+                    name,
+                    label,
+                    dumps / number * 1e6,
+                    loads / number * 1e6,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
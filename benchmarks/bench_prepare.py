@@ -0,0 +1,47 @@
+"""
+Module bench_prepare for package benchmarks of rest-api-client-framework library.
+
+Compares the per call cost of Endpoint.prepare with a compiled EndpointTemplate.
+
+Usage:
+    python -m benchmarks.bench_prepare
+"""
+
+import timeit
+from typing import Dict
+
+from api_client.endpoint import Endpoint, HTTPMethod
+from api_client.payload import IntStrBool
+
+URL_ROOT = "http://example.com/api/v3/"
+NUMBER = 100000
+
+endpoint = Endpoint(
+    name="get_record",
+    path="/zones/{zone}/records/{record_id}",
+    request_method=HTTPMethod.GET,
+    query_parameters=["token", "type", "enabled"],
+)
+template = endpoint.compile(URL_ROOT)
+kwargs: Dict[str, IntStrBool] = {
+    "zone": "example.com",
+    "record_id": 42,
+    "token": "f7e12af65cd796d6e149a23faa1571b0",
+    "type": "A",
+    "enabled": True,
+}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    before = min(
+        timeit.repeat(lambda: endpoint.prepare(URL_ROOT, **kwargs), number=NUMBER),
+    )
+    after = min(timeit.repeat(lambda: template.build(**kwargs), number=NUMBER))
+    print("Endpoint.prepare:        {0:.3f} us/call".format(before / NUMBER * 1e6))
+    print("EndpointTemplate.build:  {0:.3f} us/call".format(after / NUMBER * 1e6))
+    print("speedup:                 {0:.1f}x".format(before / after))
+
+
+if __name__ == "__main__":
+    main()
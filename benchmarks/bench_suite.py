@@ -0,0 +1,367 @@
+"""
+Module bench_suite for package benchmarks of rest-api-client-framework library.
+
+Measures the request pipeline against a local server: throughput and latency
+percentiles of call_endpoint in sync, threaded and async modes, plus the url
+preparation, payload serialization and response decoding micro benchmarks.
+Results are saved as JSON so versions can be compared.
+
+Usage:
+    python -m benchmarks.bench_suite --output results.json
+    python -m benchmarks.bench_suite --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+from requests import Response
+
+from api_client.constants import VERSION
+from api_client.endpoint import Endpoint, HTTPMethod
+from api_client.payload import Payload
+from api_client.request import RestRequest
+from api_client.response import RestResponse
+from benchmarks.server import LocalServer, records
+
+Result = Dict[str, float]
+Report = Dict[str, object]
+
+URL_ROOT = "http://example.com/api/v3/"
+RECORD_SIZES = (1, 100, 10000)
+
+
+class ZoneRecord(BaseModel):  # type: ignore[explicit-any]
+    """Zone record model."""
+
+    name: str
+    type: str
+    ttl: int
+    value: str
+    disabled: bool
+
+
+class ZoneRecords(BaseModel):  # type: ignore[explicit-any]
+    """Zone records model."""
+
+    records: List[ZoneRecord]
+
+
+def latency_result(latencies: List[float], elapsed: float) -> Result:
+    """Summarize the latencies of a run.
+
+    :param latencies: Latency of each request in seconds
+    :type latencies: List[float]
+    :param elapsed: Wall time of the run in seconds
+    :type elapsed: float
+    :return: Requests per second and latency percentiles in milliseconds
+    :rtype: Result
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": cuts[49] * 1e3,
+        "p90_ms": cuts[89] * 1e3,
+        "p99_ms": cuts[98] * 1e3,
+    }
+
+
+def timed(call: Callable[[], object]) -> float:
+    """Return the latency of a call.
+
+    :param call: The call
+    :type call: Callable[[], object]
+    :return: Latency in seconds
+    :rtype: float
+    """
+    started = time.perf_counter()
+    call()
+    return time.perf_counter() - started
+
+
+def bench_sync(client: RestRequest, path: str, count: int) -> Result:
+    """Call an endpoint sequentially.
+
+    :param client: The client
+    :type client: RestRequest
+    :param path: Endpoint name
+    :type path: str
+    :param count: Number of requests
+    :type count: int
+    :return: The run result
+    :rtype: Result
+    """
+    started = time.perf_counter()
+    latencies = [timed(lambda: client.call_endpoint(path)) for _ in range(count)]
+    return latency_result(latencies, time.perf_counter() - started)
+
+
+def bench_threaded(
+    client: RestRequest,
+    path: str,
+    count: int,
+    concurrency: int,
+) -> Result:
+    """Call an endpoint from a thread pool.
+
+    :param client: The client
+    :type client: RestRequest
+    :param path: Endpoint name
+    :type path: str
+    :param count: Number of requests
+    :type count: int
+    :param concurrency: Number of threads
+    :type concurrency: int
+    :return: The run result
+    :rtype: Result
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(
+            executor.map(
+                lambda _: timed(lambda: client.call_endpoint(path)),
+                range(count),
+            ),
+        )
+    return latency_result(latencies, time.perf_counter() - started)
+
+
+def bench_async(
+    client: RestRequest,
+    path: str,
+    count: int,
+    concurrency: int,
+) -> Result:
+    """Call an endpoint from concurrent tasks.
+
+    :param client: The client
+    :type client: RestRequest
+    :param path: Endpoint name
+    :type path: str
+    :param count: Number of requests
+    :type count: int
+    :param concurrency: Number of requests in flight
+    :type concurrency: int
+    :return: The run result
+    :rtype: Result
+    """
+
+    async def run() -> List[float]:
+        gate = asyncio.Semaphore(concurrency)
+
+        async def call() -> float:
+            async with gate:
+                started = time.perf_counter()
+                await client.acall_endpoint(path)
+                return time.perf_counter() - started
+
+        try:
+            return await asyncio.gather(*(call() for _ in range(count)))
+        finally:
+            await client.aclose()
+
+    started = time.perf_counter()
+    latencies = asyncio.run(run())
+    return latency_result(list(latencies), time.perf_counter() - started)
+
+
+def per_call(call: Callable[[], object], number: int) -> float:
+    """Return the best time of a call in microseconds.
+
+    :param call: The call
+    :type call: Callable[[], object]
+    :param number: Calls per measure
+    :type number: int
+    :return: Microseconds per call
+    :rtype: float
+    """
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def bench_prepare() -> Result:
+    """Measure the url preparation.
+
+    :return: Microseconds per call of Endpoint.prepare and of a compiled template
+    :rtype: Result
+    """
+    endpoint = Endpoint(
+        name="get_record",
+        path="/zones/{zone}/records/{record_id}",
+        request_method=HTTPMethod.GET,
+        query_parameters=["token", "type", "enabled"],
+    )
+    template = endpoint.compile(URL_ROOT)
+    kwargs: Dict[str, Union[str, int, bool]] = {
+        "zone": "example.com",
+        "record_id": 42,
+        "token": "f7e12af65cd796d6e149a23faa1571b0",
+        "type": "A",
+        "enabled": True,
+    }
+    return {
+        "endpoint_prepare_us": per_call(
+            lambda: endpoint.prepare(URL_ROOT, **kwargs),
+            20000,
+        ),
+        "template_build_us": per_call(lambda: template.build(**kwargs), 20000),
+    }
+
+
+def bench_payload() -> Result:
+    """Measure the payload serialization.
+
+    :return: Microseconds per call for a flat dict payload and for model
+        payloads of each size
+    :rtype: Result
+    """
+    result: Result = {
+        "dict_1_us": per_call(Payload(records(1)[0]).to_json_bytes, 20000),
+    }
+    for size in RECORD_SIZES:
+        zone = ZoneRecords.model_validate({"records": records(size)})
+        number = max(5, 20000 // size)
+        result["model_{0}_us".format(size)] = per_call(
+            Payload(zone).to_json_bytes,
+            number,
+        )
+    return result
+
+
+def bench_decode() -> Result:
+    """Measure the response decoding.
+
+    :return: Microseconds per call of data() and parsed() for each size
+    :rtype: Result
+    """
+    result: Result = {}
+    for size in RECORD_SIZES:
+        body = json.dumps(records(size)).encode()
+        number = max(5, 20000 // size)
+        resp = Response()
+        resp.status_code = 200
+        resp.headers["Content-Type"] = "application/json"
+        resp._content = body  # noqa: WPS437
+        result["data_{0}_us".format(size)] = per_call(
+            lambda: RestResponse(resp).data(),
+            number,
+        )
+        result["parsed_{0}_us".format(size)] = per_call(
+            lambda: RestResponse(resp).parsed(List[ZoneRecord]),
+            number,
+        )
+    return result
+
+
+def run(count: int, concurrency: int) -> Report:
+    """Run the whole suite.
+
+    :param count: Requests per network benchmark
+    :type count: int
+    :param concurrency: Threads or tasks of the concurrent benchmarks
+    :type concurrency: int
+    :return: The report
+    :rtype: Report
+    """
+    results: Dict[str, Result] = {}
+    with LocalServer() as server:
+        endpoints = [
+            Endpoint(name="get_{0}".format(size), path="/records/{0}".format(size))
+            for size in (1, 100)
+        ]
+        for size in (1, 100):
+            name = "get_{0}".format(size)
+            with RestRequest(
+                server.url,
+                endpoints,
+                pool_maxsize=concurrency,
+                async_max_keepalive_connections=concurrency,
+            ) as client:
+                results["sync_{0}".format(size)] = bench_sync(client, name, count)
+                results["threaded_{0}".format(size)] = bench_threaded(
+                    client,
+                    name,
+                    count,
+                    concurrency,
+                )
+                results["async_{0}".format(size)] = bench_async(
+                    client,
+                    name,
+                    count,
+                    concurrency,
+                )
+    results["prepare"] = bench_prepare()
+    results["payload"] = bench_payload()
+    results["decode"] = bench_decode()
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "requests": count,
+        "concurrency": concurrency,
+        "results": results,
+    }
+
+
+def compare(report: Report, baseline: Report) -> List[str]:
+    """Compare a report with a baseline.
+
+    :param report: The new report
+    :type report: Report
+    :param baseline: The baseline report
+    :type baseline: Report
+    :return: One line per metric with the relative change
+    :rtype: List[str]
+    """
+    lines = []
+    new_results = report["results"]
+    old_results = baseline["results"]
+    if not isinstance(new_results, dict) or not isinstance(old_results, dict):
+        raise ValueError("Reports must hold a results mapping.")
+    for group, metrics in new_results.items():
+        for metric, valor in metrics.items():
+            old: Optional[float] = old_results.get(group, {}).get(metric)
+            if not old:
+                continue
+            lines.append(
+                "{0:<14} {1:<22} {2:>12.3f} {3:>12.3f} {4:>+8.1%}".format(
+                    group,
+                    metric,
+                    old,
+                    valor,
+                    valor / old - 1,
+                ),
+            )
+    return lines
+
+
+def main() -> None:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", help="save the report to this JSON file")
+    parser.add_argument("--compare", help="compare with this JSON report")
+    args = parser.parse_args()
+
+    report = run(args.requests, args.concurrency)
+    print(json.dumps(report["results"], indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as source:
+            baseline = json.load(source)
+        print("\n".join(compare(report, baseline)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Module server for package benchmarks of rest-api-client-framework library.
+
+A local HTTP/1.1 stand-in for the benchmarked apis, serving canned JSON bodies
+from a thread per connection so the client, not the server, is measured.
+
+Classes:
+    LocalServer
+
+Functions:
+    records
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Dict, List, Optional, Type, Union
+
+Record = Dict[str, Union[str, int, bool]]
+
+
+def records(count: int) -> List[Record]:
+    """Build a list of zone records.
+
+    :param count: Number of records
+    :type count: int
+    :return: The records
+    :rtype: List[Record]
+    """
+    return [
+        {
+            "name": "host{0}.example.com".format(index),
+            "type": "A",
+            "ttl": 3600,
+            "value": "10.0.{0}.{1}".format(index // 256 % 256, index % 256),
+            "disabled": False,
+        }
+        for index in range(count)
+    ]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer GET with a canned body and POST with an acknowledgement."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    bodies: Dict[str, bytes] = {}
+
+    def do_GET(self) -> None:
+        body = self.bodies.get(self.path.split("?", 1)[0])
+        if body is None:
+            self._reply(404, b'{"error": "not found"}')
+        else:
+            self._reply(200, body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self._reply(200, b'{"status": "ok"}')
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep the benchmark output quiet."""
+
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServer:
+    """Local HTTP server run in a background thread.
+
+    :param bodies: JSON documents served by path, defaults to ``/records/{n}``
+        for 1, 100 and 10000 zone records
+    :type bodies: Optional[Dict[str, object]], optional
+    """
+
+    def __init__(self, bodies: Optional[Dict[str, object]] = None) -> None:
+        """Construct a LocalServer object."""
+        if bodies is None:
+            bodies = {
+                "/records/{0}".format(count): records(count)
+                for count in (1, 100, 10000)
+            }
+        encoded = {path: json.dumps(doc).encode() for path, doc in bodies.items()}
+        handler = type("Handler", (_Handler,), {"bodies": encoded})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Return the server root url.
+
+        :return: The url
+        :rtype: str
+        """
+        return "http://127.0.0.1:{0}".format(self._server.server_port)
+
+    def __enter__(self) -> "LocalServer":
+        """Start the server.
+
+        :return: This server
+        :rtype: LocalServer
+        """
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -9,6 +9,7 @@ Functions:
     request_client
     response
     response_image
+    response_stream
 """
 
 import os
@@ -17,12 +18,14 @@ os.environ["REST_API_CLIENT_FRAMEWORK_TESTING"] = "Yes"
 os.environ["REST_API_CLIENT_FRAMEWORK_LOG_LEVEL"] = "DEBUG"
 
 import base64
+import io
 from http import HTTPStatus
 from typing import Dict, List
 
 import pytest
 from requests import Response
 from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
 
 from api_client.endpoint import Endpoint, HTTPMethod
 from api_client.request import RestRequest
@@ -171,3 +174,17 @@ def response_image() -> Response:
     rr.headers = CaseInsensitiveDict({"Content-Type": "image/png"})
 
     return rr
+
+
+@pytest.fixture
+def response_stream() -> Response:
+    """Fixture response_stream."""
+    rr = Response()
+    rr.raw = HTTPResponse(
+        body=io.BytesIO(b'{"line": 1}\r\n{"line": 2}\n{"line": 3}'),
+        preload_content=False,
+    )
+    rr.status_code = HTTPStatus.OK
+    rr.headers = CaseInsensitiveDict({"Content-Type": "application/x-ndjson"})
+
+    return rr
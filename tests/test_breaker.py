@@ -0,0 +1,98 @@
+"""
+Module test_breaker module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_invalid_breaker
+    test_breaker_opens
+    test_breaker_half_open
+    test_breaker_reopens
+    test_breaker_stale_trial
+    test_breaker_half_open_retry_after
+"""
+
+import time
+
+import pytest
+
+from api_client.breaker import CircuitBreaker, CircuitState
+from api_client.exception import CircuitOpenError
+
+
+def test_invalid_breaker() -> None:
+    """Test invalid breaker."""
+    with pytest.raises(ValueError, match="at least 1"):
+        CircuitBreaker(failure_threshold=0)
+
+
+def test_breaker_opens() -> None:
+    """Test breaker opens."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.failures == 0
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+    assert 59 < breaker.retry_after() <= 60
+    breaker.reset()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.retry_after() == 0
+
+
+def test_breaker_half_open() -> None:
+    """Test breaker half open."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_reopens() -> None:
+    """Test breaker reopens."""
+    breaker = CircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout=0.05,
+        half_open_max_calls=2,
+    )
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_stale_trial() -> None:
+    """Test breaker stale trial."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+
+def test_breaker_half_open_retry_after() -> None:
+    """Test breaker half open retry after."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.5)
+    breaker.record_failure()
+    time.sleep(0.55)
+    assert breaker.retry_after() == 0
+    assert breaker.allow()
+    assert 0.4 < breaker.retry_after() <= 0.5
+    error = CircuitOpenError("example.com", breaker.retry_after(), half_open=True)
+    assert "half open" in error.reason
+    assert "retry in at most 0.5s" in error.reason
+    assert "retry in 2.0s" in CircuitOpenError("example.com", 2).reason
@@ -0,0 +1,207 @@
+"""
+Module test_cache module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_lifetime
+    test_expires_lifetime
+    test_memory_cache_lru
+    test_disk_cache
+    test_disk_cache_reopen
+    test_disk_cache_threads
+    test_vary
+    test_refresh
+    test_store_decoded_headers
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from api_client.cache import (
+    CachedResponse,
+    DiskCache,
+    MemoryCache,
+    ResponseCache,
+)
+
+URL = "http://example.com/v1/data"
+
+
+def entry(expires_at: float = 0, etag: str = '"v1"') -> CachedResponse:
+    """Build a cached response."""
+    return CachedResponse(
+        status_code=200,
+        reason="OK",
+        url=URL,
+        headers={"etag": etag, "content-type": "application/json"},
+        content=b'{"foo":"bar"}',
+        expires_at=expires_at,
+    )
+
+
+@pytest.mark.parametrize(
+    ("headers", "ttl", "expected"),
+    [
+        ({"cache-control": "max-age=60"}, None, 60),
+        ({"cache-control": "public, max-age=60", "age": "10"}, None, 50),
+        ({"cache-control": "no-store, max-age=60"}, 30, None),
+        ({"cache-control": "no-cache"}, None, 0),
+        ({"cache-control": "max-age=60"}, 5, 5),
+        ({"etag": '"v1"'}, None, 0),
+        ({}, None, None),
+        ({}, 5, 5),
+    ],
+)
+def test_lifetime(
+    headers: Dict[str, str],
+    ttl: Optional[float],
+    expected: Optional[float],
+) -> None:
+    """Test lifetime."""
+    assert ResponseCache().lifetime(headers, ttl) == expected
+
+
+def test_expires_lifetime() -> None:
+    """Test expires lifetime."""
+    cache = ResponseCache(default_ttl=10)
+    headers = {
+        "date": "Sun, 18 Oct 2026 10:00:00 GMT",
+        "expires": "Sun, 18 Oct 2026 10:02:00 GMT",
+    }
+    assert cache.lifetime(headers) == 120
+    assert cache.lifetime({"expires": "0"}) == 0
+    assert cache.lifetime({}) == 10
+
+
+def test_memory_cache_lru() -> None:
+    """Test memory cache lru."""
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", entry())
+    cache.set("b", entry())
+    assert cache.get("a") is not None
+    cache.set("c", entry())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert not len(cache)
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    """Test disk cache."""
+    cache = DiskCache(tmp_path / "cache", maxsize=2)
+    cache.set("a", entry())
+    assert cache.get("a") == entry()
+    time.sleep(0.01)
+    cache.set("b", entry())
+    time.sleep(0.01)
+    assert cache.get("a") is not None
+    time.sleep(0.01)
+    cache.set("c", entry())
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert not len(cache)
+
+
+def test_disk_cache_reopen(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test disk cache reopen."""
+    cache = DiskCache(tmp_path, maxsize=3)
+    for key in ("a", "b", "c"):
+        cache.set(key, entry())
+        time.sleep(0.01)
+    assert cache.get("a") is not None
+
+    reopened = DiskCache(tmp_path, maxsize=2)
+    assert len(reopened) == 2
+    assert reopened.get("b") is None
+
+    def no_scan(*args: object) -> None:
+        raise AssertionError("directory scanned")
+
+    monkeypatch.setattr(Path, "glob", no_scan)
+    for key in ("d", "e", "f"):
+        reopened.set(key, entry())
+    assert len(reopened) == 2
+    assert reopened.get("f") is not None
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_disk_cache_threads(tmp_path: Path) -> None:
+    """Test disk cache threads."""
+    cache = DiskCache(tmp_path)
+    versions = [
+        entry(etag='"v{0}"'.format(index)).model_copy(
+            update={"content": str(index).encode() * 100000},
+        )
+        for index in range(2)
+    ]
+    cache.set("a", versions[0])
+    done = threading.Event()
+
+    def write() -> None:
+        for index in range(200):
+            cache.set("a", versions[index % 2])
+        done.set()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    while not done.is_set():
+        found = cache.get("a")
+        assert found is not None
+        assert found in versions
+    writer.join()
+
+
+def test_vary() -> None:
+    """Test vary."""
+    cache = ResponseCache(default_ttl=60)
+    headers = {"Accept": "application/json", "X-Tenant": "one"}
+    key = cache.key("get", URL, headers)
+    assert key == cache.key("GET", URL, {"Accept": "application/json"})
+    assert key != cache.key("GET", URL, {"Accept": "text/plain"})
+    stored = cache.store(key, URL, 200, "OK", {"vary": "X-Tenant"}, b"", headers)
+    assert stored is not None
+    assert stored.is_fresh()
+    assert cache.lookup(key, headers) == stored
+    assert cache.lookup(key, {"X-Tenant": "two"}) is None
+    assert cache.store(key, URL, 200, "OK", {"vary": "*"}, b"", headers) is None
+
+
+def test_refresh() -> None:
+    """Test refresh."""
+    cache = ResponseCache()
+    stale = entry()
+    assert not stale.is_fresh()
+    assert cache.conditional_headers(stale) == {"If-None-Match": '"v1"'}
+    fresh = cache.refresh("a", stale, {"cache-control": "max-age=60"})
+    assert fresh.is_fresh()
+    assert fresh.content == stale.content
+    assert cache.backend.get("a") == fresh
+    response = fresh.to_response()
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v1"'
+    assert response.content == b'{"foo":"bar"}'
+
+
+def test_store_decoded_headers() -> None:
+    """Test store decoded headers."""
+    cache = ResponseCache(default_ttl=60)
+    response_headers = {
+        "content-encoding": "gzip",
+        "content-length": "31",
+        "content-type": "application/json",
+    }
+    stored = cache.store("a", URL, 200, "OK", response_headers, b"{}", {})
+    assert stored is not None
+    assert stored.headers == {"content-type": "application/json"}
+    refreshed = cache.refresh("a", stored, {"content-encoding": "br"})
+    assert refreshed.headers == {"content-type": "application/json"}
+    assert refreshed.to_response().content == b"{}"
@@ -0,0 +1,137 @@
+"""
+Module test_coalesce module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_flight_key
+    test_single_flight
+    test_single_flight_error
+    test_async_single_flight
+    test_async_single_flight_error
+    test_async_single_flight_leader_cancelled
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from api_client.coalesce import AsyncSingleFlight, SingleFlight, flight_key
+
+KEY = flight_key("GET", "http://example.com/v1/data", {"Accept": "*/*"})
+
+
+def test_flight_key() -> None:
+    """Test flight key."""
+    assert KEY == flight_key("get", "http://example.com/v1/data", {"accept": "*/*"})
+    assert KEY != flight_key("GET", "http://example.com/v1/data", {"Accept": "x/y"})
+    assert KEY != flight_key("GET", "http://example.com/v1/info", {"Accept": "*/*"})
+
+
+def test_single_flight() -> None:
+    """Test single flight."""
+    flight = SingleFlight()
+    calls: List[int] = []
+    started = threading.Event()
+
+    def call() -> List[int]:
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return calls
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(flight.do, KEY, call)
+        started.wait()
+        waiters = [executor.submit(flight.do, KEY, call) for _ in range(7)]
+        results = [leader.result()] + [waiter.result() for waiter in waiters]
+    assert calls == [1]
+    assert all(result is calls for result in results)
+    assert not len(flight)
+    assert flight.do(KEY, lambda: 2) == 2
+
+
+def test_single_flight_error() -> None:
+    """Test single flight error."""
+    flight = SingleFlight()
+    started = threading.Event()
+    error = ValueError("boom")
+
+    def call() -> int:
+        started.set()
+        time.sleep(0.1)
+        raise error
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, KEY, call)
+        started.wait()
+        waiters = [executor.submit(flight.do, KEY, call) for _ in range(3)]
+        for future in [leader, *waiters]:
+            assert future.exception() is error
+    assert not len(flight)
+
+
+def test_async_single_flight() -> None:
+    """Test async single flight."""
+    flight = AsyncSingleFlight()
+    calls: List[int] = []
+
+    async def call() -> List[int]:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return calls
+
+    async def gather() -> List[List[int]]:
+        return await asyncio.gather(*(flight.do(KEY, call) for _ in range(8)))
+
+    results = asyncio.run(gather())
+    assert calls == [1]
+    assert all(result is calls for result in results)
+    assert not len(flight)
+
+
+def test_async_single_flight_error() -> None:
+    """Test async single flight error."""
+    flight = AsyncSingleFlight()
+    error = ValueError("boom")
+
+    async def call() -> int:
+        await asyncio.sleep(0.05)
+        raise error
+
+    async def gather() -> List[object]:
+        return await asyncio.gather(
+            *(flight.do(KEY, call) for _ in range(4)),
+            return_exceptions=True,
+        )
+
+    assert asyncio.run(gather()) == [error] * 4
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(flight.do(KEY, call))
+
+
+def test_async_single_flight_leader_cancelled() -> None:
+    """Test async single flight leader cancelled."""
+    flight = AsyncSingleFlight()
+    calls: List[int] = []
+
+    async def call() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def gather() -> List[object]:
+        leader = asyncio.create_task(flight.do(KEY, call))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do(KEY, call)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, *waiters, return_exceptions=True)
+
+    outcomes = asyncio.run(gather())
+    assert isinstance(outcomes[0], asyncio.CancelledError)
+    assert outcomes[1:] == [2, 2, 2]
+    assert calls == [1, 1]
+    assert not len(flight)
@@ -0,0 +1,105 @@
+"""
+Module test_codec module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_codec_round_trip
+    test_codec_invalid_document
+    test_unknown_codec
+    test_default_codec
+    test_payload_json_bytes
+    test_available_codecs_include_stdlib
+"""
+
+from typing import Dict, Iterator, List, Union
+
+import pytest
+from pydantic import BaseModel
+
+from api_client.codec import (
+    StdlibCodec,
+    available_codecs,
+    default_codec,
+    get_codec,
+    set_default_codec,
+)
+from api_client.payload import Payload
+
+DOCUMENT = {"name": "zone", "records": [1, 2.5, None, True], "nested": {"a": "é"}}
+
+
+class Record(BaseModel):
+    """Record model."""
+
+    name: str
+    ttl: int
+
+
+@pytest.fixture
+def restore_default() -> Iterator[None]:
+    """Fixture restore_default."""
+    codec = default_codec()
+    yield
+    set_default_codec(codec)
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codec_round_trip(name: str) -> None:
+    """Test codec round trip."""
+    codec = get_codec(name)
+    encoded = codec.dumps(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == DOCUMENT
+    assert StdlibCodec().loads(encoded) == DOCUMENT
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codec_invalid_document(name: str) -> None:
+    """Test codec invalid document."""
+    with pytest.raises(ValueError):
+        get_codec(name).loads(b"{not json")
+
+
+def test_unknown_codec() -> None:
+    """Test unknown codec."""
+    with pytest.raises(ValueError, match="not available"):
+        get_codec("simplejson")
+
+
+@pytest.mark.usefixtures("restore_default")
+def test_default_codec() -> None:
+    """Test default codec."""
+    assert default_codec().name == available_codecs()[0]
+    set_default_codec("json")
+    assert get_codec() is get_codec("json")
+
+
+@pytest.mark.parametrize(
+    ("body", "expected", "text"),
+    [
+        (
+            {"name": "a", "ttl": 60},
+            b'{"name":"a","ttl":60}',
+            '{"name": "a", "ttl": 60}',
+        ),
+        (Record(name="a", ttl=60), b'{"name":"a","ttl":60}', '{"name":"a","ttl":60}'),
+        (None, b"", ""),
+    ],
+)
+def test_payload_json_bytes(
+    body: Union[Dict[str, Union[str, int]], Record, None],
+    expected: bytes,
+    text: str,
+) -> None:
+    """Test payload json bytes."""
+    payload = Payload(body)
+    for name in available_codecs():
+        assert payload.to_json_bytes(get_codec(name)) == expected
+    assert payload.to_json() == text
+    with pytest.raises(ValueError, match="cannot be expressed as json"):
+        Payload(b"raw").to_json_bytes()
+
+
+def test_available_codecs_include_stdlib() -> None:
+    """Test available codecs include stdlib."""
+    names: List[str] = available_codecs()
+    assert names[-1] == "json"
@@ -0,0 +1,67 @@
+"""
+Module test_compression module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_accept_encoding
+    test_compress_chunks_gzip
+    test_compress_chunks_zstd
+    test_acompress_chunks
+    test_unsupported_encoding
+"""
+
+import asyncio
+import gzip
+from typing import List
+
+import pytest
+
+from api_client.compression import (
+    ACCEPT_ENCODING,
+    ASYNC_ACCEPT_ENCODING,
+    HAS_BROTLI,
+    HAS_ZSTD,
+    acompress_chunks,
+    compress_chunks,
+)
+
+BODY = b'{"name": "host.example.com", "type": "A"}' * 5000
+
+
+def test_accept_encoding() -> None:
+    """Test accept encoding."""
+    assert ACCEPT_ENCODING.startswith("gzip, deflate")
+    encodings = ASYNC_ACCEPT_ENCODING.split(", ")
+    assert encodings[:2] == ["gzip", "deflate"]
+    assert ("br" in encodings) == HAS_BROTLI
+    assert ("zstd" in encodings) == HAS_ZSTD
+
+
+def test_compress_chunks_gzip() -> None:
+    """Test compress chunks gzip."""
+    chunks = list(compress_chunks(BODY, "gzip", chunk_size=4096))
+    assert len(chunks) > 1
+    assert sum(map(len, chunks)) < len(BODY) // 10
+    assert gzip.decompress(b"".join(chunks)) == BODY
+
+
+def test_compress_chunks_zstd() -> None:
+    """Test compress chunks zstd."""
+    zstandard = pytest.importorskip("zstandard")
+    compressed = b"".join(compress_chunks(BODY, "zstd"))
+    decompressor = zstandard.ZstdDecompressor()
+    assert decompressor.decompressobj().decompress(compressed) == BODY
+
+
+def test_acompress_chunks() -> None:
+    """Test acompress chunks."""
+
+    async def collect() -> List[bytes]:
+        return [chunk async for chunk in acompress_chunks(BODY, "gzip")]
+
+    assert gzip.decompress(b"".join(asyncio.run(collect()))) == BODY
+
+
+def test_unsupported_encoding() -> None:
+    """Test unsupported encoding."""
+    with pytest.raises(ValueError, match="Unsupported"):
+        list(compress_chunks(BODY, "compress"))
@@ -0,0 +1,75 @@
+"""
+Module test_concurrency module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_bounded_map_ordered
+    test_bounded_map_unordered
+    test_bounded_map_return_exceptions
+    test_bounded_map_backpressure
+    test_bounded_map_max_workers
+"""
+
+import time
+from typing import Iterator, List
+
+import pytest
+
+from api_client.concurrency import bounded_map
+
+
+def _slow_square(number: int) -> int:
+    """Square a number sleeping longer for small numbers."""
+    time.sleep((5 - number) * 0.01)
+    return number * number
+
+
+def _fail_on_odd(number: int) -> int:
+    """Raise ValueError on odd numbers."""
+    if number % 2:
+        raise ValueError(str(number))
+    return number
+
+
+def test_bounded_map_ordered() -> None:
+    """Test bounded map ordered."""
+    results = list(bounded_map(_slow_square, range(5), max_workers=5))
+    assert results == [0, 1, 4, 9, 16]
+
+
+def test_bounded_map_unordered() -> None:
+    """Test bounded map unordered."""
+    results = list(bounded_map(_slow_square, range(5), max_workers=5, ordered=False))
+    assert set(results) == {0, 1, 4, 9, 16}
+    assert results[0] == 16
+
+
+def test_bounded_map_return_exceptions() -> None:
+    """Test bounded map return exceptions."""
+    results = list(
+        bounded_map(_fail_on_odd, range(4), max_workers=2, return_exceptions=True),
+    )
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    with pytest.raises(ValueError, match="1"):
+        list(bounded_map(_fail_on_odd, range(4), max_workers=2))
+
+
+def test_bounded_map_backpressure() -> None:
+    """Test bounded map backpressure."""
+    consumed: List[int] = []
+
+    def numbers() -> Iterator[int]:
+        for number in range(1000):
+            consumed.append(number)
+            yield number
+
+    results = bounded_map(abs, numbers(), max_workers=2, ordered=False)
+    next(results)
+    assert len(consumed) <= 4
+    results.close()
+
+
+def test_bounded_map_max_workers() -> None:
+    """Test bounded map max workers."""
+    with pytest.raises(ValueError, match="max_workers"):
+        next(bounded_map(_fail_on_odd, range(4), max_workers=0))
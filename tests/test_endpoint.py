@@ -5,11 +5,19 @@ Functions:
     test_endpoint_query_path_parameters
     test_missing_method_name_exception
     test_missing_argument_exception
+    test_template_matches_prepare
+    test_template_missing_argument_exception
+    test_template_resolves_method
+    test_endpoint_compress
+    test_debug_url_redacted
 """
 
+import logging
 import re
+from typing import Dict, List, Optional
 
 import pytest
+from pydantic import ValidationError
 
 from api_client.endpoint import Endpoint, HTTPMethod
 from api_client.exception import (
@@ -17,6 +25,7 @@ from api_client.exception import (
     MissingArgumentError,
     MissingMethodNameError,
 )
+from api_client.logger import LOGGER_NAME
 
 TT = "f7e12af65cd796d6e149a23faa1571b0"
 
@@ -82,3 +91,73 @@ def test_missing_argument_exception() -> None:
     with pytest.raises(MissingArgumentError) as ex:
         url, method = enable_blocking.prepare(url_root, token=TT, enableBlocking=True)
     assert ex.value.msg == MISSING_ARGUMENT_MSG_FMT.format("'action'")
+
+
+@pytest.mark.parametrize(
+    ("path", "query_parameters", "kwargs"),
+    [
+        ("/settings/{action}", ["token", "enableBlocking"], {"action": "set"}),
+        ("/v1/data", None, {}),
+        ("/v1/data", ["abcd", "efgh"], {"efgh": 1, "abcd": False, "zz": 3}),
+        ("/{version}/upload/{id}", None, {"version": "v1", "id": 7}),
+        ("/a/{{b}}/{c}", None, {"c": "d"}),
+        ("", None, {}),
+    ],
+)
+def test_template_matches_prepare(
+    path: str,
+    query_parameters: Optional[List[str]],
+    kwargs: Dict[str, str],
+) -> None:
+    """Test template matches prepare."""
+    endpoint = Endpoint(
+        name="get_data",
+        path=path,
+        query_parameters=query_parameters,
+    )
+    url_root = "http://example.com/api/v3/"
+    template = endpoint.compile(url_root)
+    url, method = endpoint.prepare(url_root, **kwargs)
+    assert template.build(**kwargs) == url
+    assert template.method == method
+
+
+def test_template_missing_argument_exception() -> None:
+    """Test template missing argument exception."""
+    endpoint = Endpoint(name="get_setting", path="/settings/{action}")
+    template = endpoint.compile("https://example.com/api/v3")
+    with pytest.raises(MissingArgumentError) as ex:
+        template.build(token=TT)
+    assert ex.value.msg == MISSING_ARGUMENT_MSG_FMT.format("'action'")
+
+
+def test_template_resolves_method() -> None:
+    """Test template resolves method."""
+    endpoint = Endpoint(name="update_setting", path="/settings")
+    assert endpoint.compile("https://example.com").method == HTTPMethod.PUT
+    with pytest.raises(MissingMethodNameError):
+        Endpoint(name="settings", path="/settings").compile("https://example.com")
+
+
+def test_endpoint_compress() -> None:
+    """Test endpoint compress."""
+    endpoint = Endpoint(name="post_data", path="/data", compress="gzip")
+    assert endpoint.compress_min_size == 1024
+    with pytest.raises(ValidationError, match="compress must be one of"):
+        Endpoint(name="post_data", path="/data", compress="lzma")
+
+
+def test_debug_url_redacted(caplog: pytest.LogCaptureFixture) -> None:
+    """Test debug url redacted."""
+    endpoint = Endpoint(
+        name="get_setting",
+        path="/settings/{action}",
+        query_parameters=["token", "zone"],
+    )
+    url_root = "https://example.com/api/v3"
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        endpoint.compile(url_root).build(action="get", token=TT, zone="eu")
+        endpoint.prepare(url_root, action="get", token=TT, zone="eu")
+    assert len(caplog.records) == 2
+    assert TT not in caplog.text
+    assert caplog.text.count("token=***&zone=eu") == 2
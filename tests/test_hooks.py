@@ -0,0 +1,88 @@
+"""
+Module test_hooks module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_record_transfer
+    test_finish
+    test_tracer
+    test_hooks_registered
+    test_failing_hook
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from api_client.exception import ApiClientError
+from api_client.hooks import Hooks, RequestTiming
+
+
+def test_record_transfer() -> None:
+    """Test record transfer."""
+    timing = RequestTiming(endpoint="get_data")
+    sent = time.perf_counter() - 0.5
+    timing.record_transfer(sent, 0.2)
+    assert timing.ttfb == 0.2
+    assert timing.download is not None
+    assert timing.download >= 0.3
+    timing.record_transfer(sent, 0.2, stream=True)
+    assert timing.download is None
+
+
+def test_finish() -> None:
+    """Test finish."""
+    timing = RequestTiming(endpoint="get_data", started=time.perf_counter() - 1)
+    timing.finish(200)
+    assert timing.status_code == 200
+    assert timing.total is not None
+    assert timing.total >= 1
+
+
+def test_tracer() -> None:
+    """Test tracer."""
+    timing = RequestTiming(endpoint="get_data")
+    trace = timing.tracer()
+    events = (
+        "connection.connect_tcp.started",
+        "connection.connect_tcp.complete",
+        "connection.start_tls.started",
+        "connection.start_tls.complete",
+        "http11.send_request_headers.started",
+        "http11.receive_response_headers.complete",
+        "http11.receive_response_body.complete",
+    )
+
+    async def replay() -> None:
+        for event in events:
+            await trace(event, {})
+
+    asyncio.run(replay())
+    for field in ("connect", "tls", "ttfb", "download"):
+        assert getattr(timing, field) is not None
+
+
+def test_hooks_registered() -> None:
+    """Test hooks registered."""
+    hooks = Hooks()
+    assert not hooks
+    hooks.retry.append(lambda timing, error, delay: None)
+    assert hooks
+
+
+def test_failing_hook(caplog: pytest.LogCaptureFixture) -> None:
+    """Test failing hook."""
+    hooks = Hooks()
+    seen = []
+
+    def failing(timing: RequestTiming, error: ApiClientError) -> None:
+        raise RuntimeError("hook bug")
+
+    hooks.error.append(failing)
+    hooks.error.append(lambda timing, error: seen.append(error))
+    error = ApiClientError(status=0)
+    with caplog.at_level(logging.ERROR):
+        hooks.emit_error(RequestTiming(endpoint="get_data"), error)
+    assert seen == [error]
+    assert "error hook failed" in caplog.text
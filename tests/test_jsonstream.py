@@ -0,0 +1,89 @@
+"""
+Module test_jsonstream module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_iter_array_items
+    test_split_strings
+    test_empty_array
+    test_invalid_arrays
+    test_scanner_done
+"""
+
+import json
+from typing import Any, List
+
+import pytest
+
+from api_client.jsonstream import ArrayScanner, iter_array_items
+
+DOCUMENT: List[Any] = [
+    {"name": "a]\\\"[,{", "records": [1, 2, {"ttl": None}]},
+    1,
+    "s,\\",
+    [],
+    {},
+    True,
+    None,
+    -1.5e3,
+    "é",
+    [[["nested"]]],
+]
+
+
+def _chunked(raw: bytes, size: int) -> List[bytes]:
+    return [raw[start : start + size] for start in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_iter_array_items(size: int) -> None:
+    """Test iter array items."""
+    raw = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    items = list(iter_array_items(_chunked(raw, size)))
+    assert [json.loads(item) for item in items] == DOCUMENT
+    assert items[1] == b"1"
+
+
+def test_split_strings() -> None:
+    """Test split strings."""
+    raw = json.dumps(["x" * 100000, '\\"' * 1000, 2]).encode("utf-8")
+    items = list(iter_array_items(_chunked(raw, 1000)))
+    assert [json.loads(item) for item in items] == ["x" * 100000, '\\"' * 1000, 2]
+
+
+def test_empty_array() -> None:
+    """Test empty array."""
+    assert list(iter_array_items([b" [ ", b"] \n"])) == []
+    assert list(iter_array_items([b"\n", b"[", b"1", b"]"])) == [b"1"]
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        (b'{"records": []}', "not an array"),
+        (b'"[1]"', "not an array"),
+        (b"12", "not an array"),
+        (b"[1,]", "element expected"),
+        (b"[,1]", "element expected"),
+        (b"[1,,2]", "element expected"),
+        (b"[1] x", "Extra data"),
+        (b"[1, [2]", "incomplete"),
+        (b"", "incomplete"),
+    ],
+)
+def test_invalid_arrays(raw: bytes, message: str) -> None:
+    """Test invalid arrays."""
+    with pytest.raises(ValueError, match=message):
+        list(iter_array_items(_chunked(raw, 2)))
+
+
+def test_scanner_done() -> None:
+    """Test scanner done."""
+    scanner = ArrayScanner()
+    assert scanner.feed(b'[{"a": 1}, {"b"') == [b'{"a": 1}']
+    assert not scanner.done
+    assert scanner.feed(b": 2}] ") == [b'{"b": 2}']
+    assert scanner.done
+    assert scanner.feed(b"\n") == []
+    scanner.close()
+    with pytest.raises(ValueError, match="Extra data"):
+        scanner.feed(b"[]")
@@ -0,0 +1,107 @@
+"""
+Module test_logger module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_library_logger
+    test_log_response
+    test_log_response_sampled
+    test_log_error
+    test_log_retry
+    test_log_redacted_url
+"""
+
+import logging
+
+import pytest
+from requests import Response
+
+from api_client.exception import ApiClientError
+from api_client.hooks import RequestTiming
+from api_client.logger import LOGGER_NAME, RequestLogger, logger
+from api_client.response import RestResponse
+
+
+def _timing(url: str = "http://example.com/data?q=a b") -> RequestTiming:
+    timing = RequestTiming(
+        endpoint="get_data",
+        method="GET",
+        url=url,
+        attempts=1,
+    )
+    timing.ttfb = 0.0125
+    timing.finish(200)
+    return timing
+
+
+def test_library_logger() -> None:
+    """Test library logger."""
+    assert logger.name == LOGGER_NAME
+    assert any(
+        isinstance(handler, logging.NullHandler) for handler in logger.handlers
+    )
+    assert logger is not logging.getLogger()
+
+
+def test_log_response(
+    response: Response,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test log response."""
+    request_logger = RequestLogger()
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        request_logger.log_response(_timing(), RestResponse(response))
+    record = caplog.records[0]
+    assert record.name == "api_client.requests"
+    assert record.levelno == logging.INFO
+    message = record.getMessage()
+    assert message.startswith("event=response endpoint=get_data method=GET ")
+    assert 'url="http://example.com/data?q=a b"' in message
+    assert "status=200" in message
+    assert "ttfb_ms=12.5" in message
+    assert "total_ms=" in message
+    assert record.__dict__["api_client"]["status"] == 200
+
+
+def test_log_response_sampled(
+    response: Response,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test log response sampled."""
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        RequestLogger().log_response(_timing(), RestResponse(response))
+    assert not caplog.records
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        RequestLogger(sample_rate=0).log_response(_timing(), RestResponse(response))
+    assert not caplog.records
+
+
+def test_log_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test log error."""
+    error = ApiClientError(status=503, reason="Service Unavailable\nretry later")
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        RequestLogger(sample_rate=0).log_error(_timing(), error)
+    record = caplog.records[0]
+    assert record.levelno == logging.WARNING
+    assert 'status=503 reason="Service Unavailable"' in record.getMessage()
+
+
+def test_log_retry(caplog: pytest.LogCaptureFixture) -> None:
+    """Test log retry."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        RequestLogger().log_retry(_timing(), ApiClientError(status=429), 0.25)
+    assert "event=retry" in caplog.text
+    assert "delay_ms=250.0" in caplog.text
+
+
+def test_log_redacted_url(caplog: pytest.LogCaptureFixture) -> None:
+    """Test log redacted url."""
+    timing = _timing("http://example.com/data?Token=abc&zone=x&apiKey=s3")
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        RequestLogger().log_response(timing, RestResponse(Response()))
+        RequestLogger(redact=["zone"]).log_response(timing, RestResponse(Response()))
+    first, second = (record.getMessage() for record in caplog.records)
+    assert "url=http://example.com/data?Token=***&zone=x&apiKey=***" in first
+    assert "abc" not in first
+    assert "s3" not in first
+    assert "url=http://example.com/data?Token=abc&zone=***&apiKey=s3" in second
+    assert caplog.records[0].__dict__["api_client"]["url"].count("***") == 2
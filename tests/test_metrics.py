@@ -0,0 +1,129 @@
+"""
+Module test_metrics module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_prometheus_text
+    test_summary
+    test_threads
+    test_retired_threads
+    test_reset
+    test_opentelemetry
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api_client.exception import ApiClientError
+from api_client.hooks import RequestTiming
+from api_client.metrics import ClientMetrics
+
+URL = "http://example.com:8080/v1/data"
+
+
+def _timing(total: float, endpoint: str = "get_data") -> RequestTiming:
+    """Build a finished timing record."""
+    return RequestTiming(endpoint=endpoint, method="GET", url=URL, total=total)
+
+
+def test_prometheus_text() -> None:
+    """Test prometheus text."""
+    metrics = ClientMetrics(buckets=(0.1, 1))
+    metrics.observe(_timing(0.05), 200)
+    metrics.observe(_timing(0.5), 503)
+    metrics.record_error(_timing(2), ApiClientError(status=0))
+    metrics.record_retry(_timing(0.5), ApiClientError(status=503), 0.1)
+    text = metrics.prometheus_text()
+    labels = (
+        'endpoint="get_data",method="GET",status_class="2xx",'
+        'host="example.com:8080"'
+    )
+    assert "# TYPE api_client_requests_total counter" in text
+    assert "api_client_requests_total{{{0}}} 1".format(labels) in text
+    assert 'status_class="error"' in text
+    assert (
+        'api_client_retries_total{endpoint="get_data",method="GET",'
+        'host="example.com:8080"} 1'
+    ) in text
+    assert "# TYPE api_client_request_duration_seconds histogram" in text
+    bucket = "api_client_request_duration_seconds_bucket{{{0},le=\"{1}\"}} {2}"
+    assert bucket.format(labels, "0.1", 1) in text
+    assert bucket.format(labels, "1.0", 1) in text
+    assert bucket.format(labels, "+Inf", 1) in text
+    assert "api_client_request_duration_seconds_sum{{{0}}} 0.05".format(labels) in text
+    assert "api_client_request_duration_seconds_count{{{0}}} 1".format(labels) in text
+    assert text.endswith("\n")
+
+
+def test_summary() -> None:
+    """Test summary."""
+    metrics = ClientMetrics(buckets=(0.1, 0.2, 0.4))
+    for _ in range(98):
+        metrics.observe(_timing(0.15), 200)
+    metrics.observe(_timing(0.3), 500)
+    metrics.observe(_timing(5), 0)
+    metrics.observe(_timing(0.05, "get_info"), 200)
+    summary = metrics.summary()
+    assert summary["get_data"]["requests"] == 100
+    assert summary["get_data"]["errors"] == 2
+    assert summary["get_data"]["error_rate"] == pytest.approx(0.02)
+    assert 0.1 < summary["get_data"]["p50"] < 0.2
+    assert 0.2 < summary["get_data"]["p99"] <= 0.4
+    assert summary["get_info"]["p99"] <= 0.1
+
+
+def test_threads() -> None:
+    """Test threads."""
+    metrics = ClientMetrics()
+
+    def observe(index: int) -> None:
+        for _ in range(100):
+            metrics.observe(_timing(0.01), 200)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(observe, range(8)))
+    assert metrics.summary()["get_data"]["requests"] == 800
+
+
+def test_retired_threads() -> None:
+    """Test retired threads."""
+    metrics = ClientMetrics()
+
+    def observe(index: int) -> None:
+        metrics.observe(_timing(0.01), 200)
+
+    for _ in range(20):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(observe, range(8)))
+        assert len(metrics._shards) <= 4  # noqa: WPS437
+    assert metrics.summary()["get_data"]["requests"] == 160
+    assert len(metrics._shards) <= 1  # noqa: WPS437
+    metrics.reset()
+    assert not metrics.summary()
+
+
+def test_reset() -> None:
+    """Test reset."""
+    metrics = ClientMetrics()
+    metrics.observe(_timing(0.01), 200)
+    metrics.reset()
+    assert not metrics.summary()
+
+
+def test_opentelemetry() -> None:
+    """Test opentelemetry."""
+    otel_metrics = pytest.importorskip("opentelemetry.metrics")
+    sdk_metrics = pytest.importorskip("opentelemetry.sdk.metrics")
+    export = pytest.importorskip("opentelemetry.sdk.metrics.export")
+    reader = export.InMemoryMetricReader()
+    otel_metrics.set_meter_provider(sdk_metrics.MeterProvider(metric_readers=[reader]))
+    metrics = ClientMetrics(opentelemetry=True)
+    metrics.observe(_timing(0.01), 200)
+    data = reader.get_metrics_data()
+    names = {
+        metric.name
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert names == {"api_client.requests", "api_client.request.duration"}
@@ -0,0 +1,195 @@
+"""
+Module test_pagination module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_extract
+    test_page_pagination
+    test_offset_pagination
+    test_cursor_pagination
+    test_link_pagination
+    test_iterate_pages
+    test_iterate_pages_prefetch
+    test_aiterate_pages_prefetch
+    test_prefetch_sequential
+"""
+
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+from typing import Any, Dict, List, Mapping, Optional
+
+import pytest
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from api_client.pagination import (
+    CursorPagination,
+    LinkPagination,
+    OffsetPagination,
+    PagePagination,
+    PageRequest,
+    aiterate_pages,
+    iterate_pages,
+)
+from api_client.response import RestResponse
+
+URL = "http://127.0.0.1:5050/v1/items?page=1"
+
+
+def _page(
+    document: Any,
+    headers: Optional[Mapping[str, str]] = None,
+) -> RestResponse:
+    rr = Response()
+    rr._content = json.dumps(document).encode("utf-8")  # noqa: WPS437
+    rr.status_code = HTTPStatus.OK
+    rr.url = URL
+    rr.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    rr.headers.update(headers or {})
+    return RestResponse(rr)
+
+
+def _offset_fetch(total: int) -> Any:
+    def fetch(request: PageRequest) -> RestResponse:
+        assert isinstance(request, dict)
+        start = int(request["offset"])
+        return _page({"data": list(range(start, min(start + 10, total)))})
+
+    return fetch
+
+
+def test_extract() -> None:
+    """Test extract."""
+    assert PagePagination().extract(_page([1, 2])) == [1, 2]
+    nested = PagePagination(items="result.data")
+    assert nested.extract(_page({"result": {"data": [3]}})) == [3]
+    assert nested.extract(_page({"result": {}})) == []
+    with pytest.raises(ValueError, match="not a list"):
+        nested.extract(_page({"result": {"data": 3}}))
+
+
+def test_page_pagination() -> None:
+    """Test page pagination."""
+    pagination = PagePagination(page_size=2)
+    assert pagination.parameters == ("page", "per_page")
+    first = pagination.first({"q": "x"})
+    assert first == {"q": "x", "page": 1, "per_page": 2}
+    assert pagination.next_page(first, _page([1, 2]), [1, 2]) == {
+        "q": "x",
+        "page": 2,
+        "per_page": 2,
+    }
+    assert pagination.next_page(first, _page([1]), [1]) is None
+    unsized = PagePagination(size_param=None, start=0)
+    assert unsized.parameters == ("page",)
+    assert unsized.first({}) == {"page": 0}
+    assert unsized.next_page({"page": 0}, _page([1]), [1]) == {"page": 1}
+    assert unsized.next_page({"page": 1}, _page([]), []) is None
+
+
+def test_offset_pagination() -> None:
+    """Test offset pagination."""
+    pagination = OffsetPagination(limit=10)
+    assert pagination.parameters == ("offset", "limit")
+    assert pagination.page({}, 3) == {"offset": 30, "limit": 10}
+    items = list(range(10))
+    assert pagination.next_page({"offset": 10, "limit": 10}, _page(items), items) == {
+        "offset": 20,
+        "limit": 10,
+    }
+    assert pagination.next_page({"offset": 20, "limit": 10}, _page([1]), [1]) is None
+
+
+def test_cursor_pagination() -> None:
+    """Test cursor pagination."""
+    pagination = CursorPagination(items="data", next_cursor="meta.next")
+    assert pagination.parameters == ("cursor",)
+    assert pagination.page({}, 1) is None
+    first = pagination.first({"q": "x"})
+    page = _page({"data": [1], "meta": {"next": "abc"}})
+    assert pagination.next_page(first, page, [1]) == {"q": "x", "cursor": "abc"}
+    page = _page({"data": [1], "meta": {"next": ""}})
+    assert pagination.next_page(first, page, [1]) is None
+    assert pagination.next_page(first, _page({"data": [1]}), [1]) is None
+
+
+def test_link_pagination() -> None:
+    """Test link pagination."""
+    pagination = LinkPagination()
+    assert pagination.parameters == ()
+    links = '</v1/items?page=1>; rel="prev", </v1/items?page=3>; rel="next"'
+    page = _page([1], {"Link": links})
+    assert (
+        pagination.next_page({}, page, [1])
+        == "http://127.0.0.1:5050/v1/items?page=3"
+    )
+    page = _page([1], {"Link": '</v1/items?page=1>; rel="first"'})
+    assert pagination.next_page({}, page, [1]) is None
+    assert pagination.next_page({}, _page([1]), [1]) is None
+
+
+def test_iterate_pages() -> None:
+    """Test iterate pages."""
+    pages: Dict[str, RestResponse] = {
+        "": _page({"items": [1, 2], "next_cursor": "b"}),
+        "b": _page({"items": [3], "next_cursor": None}),
+    }
+    requested: List[PageRequest] = []
+
+    def fetch(request: PageRequest) -> RestResponse:
+        requested.append(request)
+        assert isinstance(request, dict)
+        return pages[str(request.get("cursor", ""))]
+
+    pagination = CursorPagination(items="items")
+    assert list(iterate_pages(pagination, fetch, {"q": "x"})) == [1, 2, 3]
+    assert requested == [{"q": "x"}, {"q": "x", "cursor": "b"}]
+
+
+def test_iterate_pages_prefetch() -> None:
+    """Test iterate pages prefetch."""
+    fetch = _offset_fetch(35)
+    pagination = OffsetPagination(items="data", limit=10)
+    expected = list(range(35))
+    assert list(iterate_pages(pagination, fetch, {}, prefetch=2)) == expected
+    assert list(iterate_pages(pagination, fetch, {})) == expected
+
+    threads = set()
+
+    def tracked(request: PageRequest) -> RestResponse:
+        threads.add(threading.get_ident())
+        return fetch(request)
+
+    items = iterate_pages(pagination, tracked, {}, prefetch=3)
+    assert next(items) == 0
+    items.close()
+    assert threading.get_ident() not in threads
+
+
+def test_aiterate_pages_prefetch() -> None:
+    """Test aiterate pages prefetch."""
+    fetch = _offset_fetch(25)
+
+    async def afetch(request: PageRequest) -> RestResponse:
+        await asyncio.sleep(0)
+        return fetch(request)
+
+    async def run(prefetch: int) -> List[int]:
+        pagination = OffsetPagination(items="data", limit=10)
+        return [
+            item async for item in aiterate_pages(pagination, afetch, {}, prefetch)
+        ]
+
+    assert asyncio.run(run(2)) == list(range(25))
+    assert asyncio.run(run(0)) == list(range(25))
+
+
+def test_prefetch_sequential() -> None:
+    """Test prefetch sequential."""
+
+    def fetch(request: PageRequest) -> RestResponse:
+        return _page([])
+
+    with pytest.raises(ValueError, match="CursorPagination pages cannot be"):
+        list(iterate_pages(CursorPagination(), fetch, {}, prefetch=2))
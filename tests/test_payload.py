@@ -0,0 +1,135 @@
+"""
+Module test_payload module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_content_type
+    test_buffer_chunks
+    test_path_chunks
+    test_file_chunks_replay
+    test_iterator_chunks
+    test_progress
+    test_achunks_thread
+    test_not_streamed
+"""
+
+import asyncio
+import io
+import mmap
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import pytest
+
+from api_client.payload import OCTET_STREAM, Payload, SizedChunks
+
+DATA = bytes(range(256)) * 1000
+
+
+def test_content_type(tmp_path: Path) -> None:
+    """Test content type."""
+    json_file = tmp_path / "data.json"
+    json_file.write_bytes(b"{}")
+    assert Payload(json_file).content_type == "application/json"
+    assert Payload(tmp_path / "data.unknown-ext").content_type == OCTET_STREAM
+    assert Payload(memoryview(DATA)).content_type == OCTET_STREAM
+    assert Payload(iter([DATA])).content_type == OCTET_STREAM
+    assert Payload(DATA).content_type is None
+
+
+def test_buffer_chunks() -> None:
+    """Test buffer chunks."""
+    source = bytearray(DATA)
+    with mmap.mmap(-1, len(DATA)) as mapped:
+        mapped.write(DATA)
+        for body in (memoryview(source), mapped):
+            payload = Payload(body, chunk_size=10000)
+            assert payload.is_stream
+            assert payload.is_replayable
+            chunks = payload.chunks()
+            assert isinstance(chunks, SizedChunks)
+            assert len(chunks) == len(DATA)
+            parts = list(chunks)
+            assert all(isinstance(part, memoryview) for part in parts)
+            assert b"".join(parts) == DATA
+            del parts, chunks  # noqa: WPS420
+    source[0] = 255
+    assert bytes(next(iter(Payload(memoryview(source)).chunks())))[0] == 255
+
+
+def test_path_chunks(tmp_path: Path) -> None:
+    """Test path chunks."""
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(DATA)
+    payload = Payload(path, chunk_size=4096)
+    assert payload.content_length == len(DATA)
+    assert b"".join(payload.chunks()) == DATA
+    assert b"".join(payload.chunks()) == DATA
+
+
+def test_file_chunks_replay() -> None:
+    """Test file chunks replay."""
+    source = io.BytesIO(DATA)
+    source.seek(1000)
+    payload = Payload(source)
+    assert payload.is_replayable
+    assert payload.content_length == len(DATA) - 1000
+    assert b"".join(payload.chunks()) == DATA[1000:]
+    assert b"".join(payload.chunks()) == DATA[1000:]
+
+
+def test_iterator_chunks() -> None:
+    """Test iterator chunks."""
+
+    def generate() -> Iterator[bytes]:
+        yield b"first"
+        yield b"second"
+
+    payload = Payload(generate())
+    assert not payload.is_replayable
+    assert payload.content_length is None
+    chunks = payload.chunks()
+    assert not isinstance(chunks, SizedChunks)
+    assert b"".join(chunks) == b"firstsecond"
+
+
+def test_progress() -> None:
+    """Test progress."""
+    reports: List[Tuple[int, Optional[int]]] = []
+    payload = Payload(
+        memoryview(DATA),
+        progress=lambda sent, total: reports.append((sent, total)),
+        chunk_size=100000,
+    )
+
+    async def collect() -> List[bytes]:
+        return [bytes(chunk) async for chunk in payload.achunks()]
+
+    assert b"".join(asyncio.run(collect())) == DATA
+    assert reports == [(100000, 256000), (200000, 256000), (256000, 256000)]
+
+
+def test_achunks_thread() -> None:
+    """Test achunks thread."""
+    readers: List[int] = []
+
+    def produce() -> Iterator[bytes]:
+        for chunk in (b"first", b"second"):
+            readers.append(threading.get_ident())
+            yield chunk
+
+    async def collect() -> List[bytes]:
+        return [bytes(chunk) async for chunk in Payload(produce()).achunks()]
+
+    assert asyncio.run(collect()) == [b"first", b"second"]
+    assert len(readers) == 2
+    assert threading.get_ident() not in readers
+
+
+def test_not_streamed() -> None:
+    """Test not streamed."""
+    payload = Payload({"foo": "bar"})
+    assert not payload.is_stream
+    assert payload.is_replayable
+    with pytest.raises(ValueError, match="cannot be streamed"):
+        payload.chunks()
@@ -0,0 +1,81 @@
+"""
+Module test_ratelimit module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_invalid_rate
+    test_reserve
+    test_acquire_threads
+    test_aacquire
+    test_adaptive_rate
+    test_not_adaptive
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api_client.ratelimit import TokenBucket
+
+
+def test_invalid_rate() -> None:
+    """Test invalid rate."""
+    with pytest.raises(ValueError, match="positive"):
+        TokenBucket(0)
+
+
+def test_reserve() -> None:
+    """Test reserve."""
+    bucket = TokenBucket(10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_acquire_threads() -> None:
+    """Test acquire threads."""
+    bucket = TokenBucket(50, capacity=1)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: bucket.acquire(), range(11)))
+    assert time.monotonic() - started >= 0.19
+
+
+def test_aacquire() -> None:
+    """Test aacquire."""
+    bucket = TokenBucket(50, capacity=1)
+
+    async def burst() -> None:
+        await asyncio.gather(*(bucket.aacquire() for _ in range(11)))
+
+    started = time.monotonic()
+    asyncio.run(burst())
+    assert time.monotonic() - started >= 0.19
+
+
+def test_adaptive_rate() -> None:
+    """Test adaptive rate."""
+    bucket = TokenBucket(100, increase=0.1)
+    bucket.on_throttle()
+    assert bucket.rate == 50
+    bucket.on_throttle()
+    assert bucket.rate == 50
+    bucket.on_success()
+    assert bucket.rate == 60
+    for _ in range(10):
+        bucket.on_success()
+    assert bucket.rate == 100
+    bucket = TokenBucket(100, min_rate=80)
+    bucket.on_throttle(retry_after=1)
+    assert bucket.rate == 80
+    assert bucket.reserve() == pytest.approx(1 + 1 / 80, abs=0.01)
+
+
+def test_not_adaptive() -> None:
+    """Test not adaptive."""
+    bucket = TokenBucket(100, adaptive=False)
+    bucket.on_throttle(retry_after=0.5)
+    assert bucket.rate == 100
+    assert bucket.reserve() == pytest.approx(0.51, abs=0.01)
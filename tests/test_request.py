@@ -9,23 +9,105 @@ Functions:
     test_delete_request_with_params
     test_put_request_with_params
     test_post_request_with_image
+    test_session_reused_across_calls
+    test_session_pool_configuration
+    test_async_call_endpoint
+    test_async_call_endpoint_concurrent
+    test_async_call_endpoint_error
+    test_async_response_close
+    test_async_client_per_loop
+    test_call_endpoint_async_mode
+    test_call_many
+    test_call_many_return_exceptions
+    test_api_root_recompiles_templates
+    test_missing_method_raised_on_call
+    test_call_endpoint_stream
+    test_call_endpoint_stream_error
+    test_request_codec
+    test_post_json_payload_encoded_once
+    test_async_post_model_payload
+    test_parsed_endpoint_model
+    test_cached_get
+    test_cache_revalidation
+    test_coalesced_get
+    test_coalesced_error
+    test_retry
+    test_retry_exhausted
+    test_endpoint_retry
+    test_rate_limit
+    test_rate_limits_overlap
+    test_circuit_breaker
+    test_hooks
+    test_error_hooks
+    test_metrics
+    test_request_logger
+    test_default_headers
+    test_cache_varies_on_api_key
+    test_compressed_post
+    test_zstd_response
+    test_streamed_upload
+    test_streamed_upload_not_replayable
+    test_download_to
+    test_download_to_resume
+    test_download_to_resume_gzip
+    test_paginate
+    test_paginate_link
+    test_paginate_link_other_host
+    test_apaginate
+    test_stream_ndjson_records
 """
 
+import asyncio
+import gzip
+import json
+import logging
+import time
 from http import HTTPStatus
+from pathlib import Path
 from types import MappingProxyType
-from typing import Dict
+from typing import Callable, Dict, List, Tuple
 
 import pytest
+from pydantic import BaseModel
 from pytest_httpserver import HTTPServer
 from requests.structures import CaseInsensitiveDict
+from werkzeug import Request, Response
 
-from api_client.exception import ApiClientError
+from api_client.breaker import CircuitBreaker, CircuitState
+from api_client.cache import ResponseCache
+from api_client.codec import get_codec
+from api_client.compression import ACCEPT_ENCODING, ASYNC_ACCEPT_ENCODING
+from api_client.endpoint import Endpoint
+from api_client.exception import (
+    ApiClientError,
+    CircuitOpenError,
+    MissingMethodNameError,
+)
+from api_client.hooks import RequestTiming
+from api_client.logger import LOGGER_NAME, RequestLogger
+from api_client.metrics import ClientMetrics
+from api_client.pagination import (
+    CursorPagination,
+    LinkPagination,
+    OffsetPagination,
+    PagePagination,
+)
 from api_client.payload import Payload
-from api_client.request import RestRequest
+from api_client.ratelimit import TokenBucket
+from api_client.request import EndpointNotFoundError, ExecutionMode, RestRequest
+from api_client.response import RestResponse
+from api_client.retry import RetryPolicy
 
 FOO_BAR = MappingProxyType({"foo": "bar"})
 POST = "POST"
 V1DATA = "/v1/data"
+V1INFO = "/v1/info"
+
+
+class FooBar(BaseModel):
+    """FooBar model."""
+
+    foo: str = "bar"
 
 
 def test_send_post_request(
@@ -149,3 +231,1129 @@ def test_post_request_with_image(
     )
     assert response.status_code == HTTPStatus.OK
     assert response.data() == FOO_BAR
+
+
+def test_session_reused_across_calls(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test session reused across calls."""
+    httpserver.expect_request(V1DATA, method=POST).respond_with_json(foo_bar)
+
+    session = request_client.session
+    request_client.call_endpoint("post_v1_data")
+    request_client.call_endpoint("post_v1_data")
+    assert request_client.session is session
+    assert len(httpserver.log) == 2
+
+
+def test_session_pool_configuration() -> None:
+    """Test session pool configuration."""
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    with RestRequest(
+        "http://127.0.0.1:5050",
+        endpoint,
+        pool_connections=2,
+        pool_maxsize=32,
+        pool_block=True,
+    ) as client:
+        adapter = client.session.get_adapter("http://127.0.0.1:5050")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+
+def test_async_call_endpoint(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test async call endpoint."""
+    httpserver.expect_request(
+        V1DATA,
+        method="GET",
+        query_string={"abcd": "1"},
+    ).respond_with_json(foo_bar)
+
+    async def run() -> RestResponse:
+        async with request_client as client:
+            return await client.acall_endpoint("get_v1_data", abcd="1")
+
+    response = asyncio.run(run())
+    assert response.status_code == HTTPStatus.OK
+    assert response.reason == "OK"
+    assert response.data() == FOO_BAR
+
+
+def test_async_call_endpoint_concurrent(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test async call endpoint concurrent."""
+    httpserver.expect_request("/v1/data/id1", method="PUT").respond_with_json(
+        foo_bar,
+    )
+
+    async def run() -> List[RestResponse]:
+        calls = [
+            request_client.acall_endpoint("put_v1_data", id="id1") for _ in range(20)
+        ]
+        responses = await asyncio.gather(*calls)
+        await request_client.aclose()
+        return responses
+
+    responses = asyncio.run(run())
+    assert len(responses) == 20
+    assert all(response.data() == FOO_BAR for response in responses)
+
+
+def test_async_call_endpoint_error(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test async call endpoint error."""
+    httpserver.expect_request(V1DATA, method=POST).respond_with_json(
+        foo_bar,
+        HTTPStatus.BAD_REQUEST.value,
+    )
+
+    async def run() -> RestResponse:
+        async with request_client as client:
+            return await client.acall_endpoint("post_v1_data")
+
+    with pytest.raises(ApiClientError) as ex:
+        asyncio.run(run())
+    assert ex.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_async_response_close(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test async response close."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    async def run() -> List[RestResponse]:
+        async with request_client as client:
+            async with await client.acall_endpoint("get_v1_data") as response:
+                assert response.data() == FOO_BAR
+            unclosed = await client.acall_endpoint("get_v1_data")
+            unclosed.close()
+            return [response, unclosed]
+
+    response, unclosed = asyncio.run(run())
+    assert response.closed
+    assert response.response.is_closed
+    assert unclosed.closed
+
+
+def test_async_client_per_loop(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test async client per loop."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+    session_closed: List[bool] = []
+    monkeypatch.setattr(
+        request_client.session,
+        "close",
+        lambda: session_closed.append(True),
+    )
+
+    async def run() -> object:
+        response = await request_client.acall_endpoint("get_v1_data")
+        assert response.data() == FOO_BAR
+        return request_client._async_client  # noqa: WPS437
+
+    first = asyncio.run(run())
+    assert asyncio.run(run()) is not first
+
+    async def run_closed() -> RestResponse:
+        async with request_client as client:
+            return await client.acall_endpoint("get_v1_data")
+
+    assert asyncio.run(run_closed()).data() == FOO_BAR
+    assert not session_closed
+
+
+def test_call_endpoint_async_mode(request_client: RestRequest) -> None:
+    """Test call endpoint async mode."""
+    with pytest.raises(NotImplementedError):
+        request_client.call_endpoint("get_v1_data", mode=ExecutionMode.ASYNC)
+
+
+def test_call_many(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+) -> None:
+    """Test call many."""
+    for ident in range(10):
+        httpserver.expect_request(
+            "/v1/data/id{0}".format(ident),
+            method="DELETE",
+        ).respond_with_json({"id": ident})
+
+    responses = request_client.call_many(
+        "delete_v1_data",
+        ({"id": "id{0}".format(ident)} for ident in range(10)),
+        max_workers=4,
+    )
+    assert [response.data()["id"] for response in responses] == list(range(10))
+
+
+def test_call_many_return_exceptions(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test call many return exceptions."""
+    httpserver.expect_request("/v1/data/good", method="DELETE").respond_with_json(
+        foo_bar,
+    )
+    httpserver.expect_request("/v1/data/bad", method="DELETE").respond_with_json(
+        foo_bar,
+        HTTPStatus.NOT_FOUND.value,
+    )
+
+    responses = list(
+        request_client.call_many(
+            "delete_v1_data",
+            [{"id": "good"}, {"id": "bad"}],
+            return_exceptions=True,
+        ),
+    )
+    assert isinstance(responses[0], RestResponse)
+    assert isinstance(responses[1], ApiClientError)
+    assert responses[1].status == HTTPStatus.NOT_FOUND
+
+
+def test_api_root_recompiles_templates(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test api root recompiles templates."""
+    httpserver.expect_request("/api/v1/data/id1", method="PUT").respond_with_json(
+        foo_bar,
+    )
+
+    request_client.api_root = "http://127.0.0.1:5050/api/"
+    response = request_client.call_endpoint("put_v1_data", id="id1")
+    assert response.data() == FOO_BAR
+
+
+def test_missing_method_raised_on_call() -> None:
+    """Test missing method raised on call."""
+    endpoints = [
+        Endpoint(name="settings", path="/settings"),
+        Endpoint(name="get_x", path="/x"),
+    ]
+    client = RestRequest("http://127.0.0.1:5050", endpoints)
+    with pytest.raises(MissingMethodNameError):
+        client.call_endpoint("settings")
+    with pytest.raises(EndpointNotFoundError):
+        client.call_endpoint("get_y")
+
+
+def test_call_endpoint_stream(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+) -> None:
+    """Test call endpoint stream."""
+    body = b"".join("line {0}\n".format(number).encode() for number in range(1000))
+    httpserver.expect_request(V1DATA, method="GET").respond_with_data(body)
+
+    with request_client.call_endpoint("get_v1_data", stream=True) as response:
+        assert response.read(7) == b"line 0\n"
+        lines = list(response.iter_lines(chunk_size=100))
+    assert len(lines) == 999
+    assert lines[-1] == b"line 999"
+
+
+def test_call_endpoint_stream_error(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test call endpoint stream error."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(
+        foo_bar,
+        HTTPStatus.NOT_FOUND.value,
+    )
+
+    with pytest.raises(ApiClientError) as ex:
+        request_client.call_endpoint("get_v1_data", stream=True)
+    response = ex.value.response
+    assert response is not None
+    assert response.response.raw.connection is None
+    assert response.data() == FOO_BAR
+    assert "HTTP response body" in str(ex.value)
+
+
+def test_request_codec(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test request codec."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    assert request_client.codec is get_codec()
+    client = RestRequest(
+        request_client.api_root,
+        Endpoint(name="get_v1_data", path=V1DATA),
+        codec="json",
+    )
+    assert client.codec.name == "json"
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+
+
+def test_post_json_payload_encoded_once(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test post json payload encoded once."""
+    httpserver.expect_request(
+        V1DATA,
+        method=POST,
+        headers={"Content-Type": "application/json"},
+        data=b'{"foo":"bar"}',
+    ).respond_with_json(foo_bar)
+
+    response = request_client.call_endpoint("post_v1_data", Payload(foo_bar))
+    assert response.data() == FOO_BAR
+
+
+def test_async_post_model_payload(
+    request_client: RestRequest,
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test async post model payload."""
+    httpserver.expect_request(
+        V1DATA,
+        method=POST,
+        json=foo_bar,
+    ).respond_with_json(foo_bar)
+
+    async def run() -> RestResponse:
+        async with request_client as client:
+            return await client.acall_endpoint("post_v1_data", Payload(FooBar()))
+
+    assert asyncio.run(run()).data() == FOO_BAR
+
+
+def test_parsed_endpoint_model(
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test parsed endpoint model."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA, model=FooBar)
+    with RestRequest("http://127.0.0.1:5050", endpoint) as client:
+        assert client.call_endpoint("get_v1_data").parsed() == FooBar()
+        adapter = endpoint.compile(client.api_root).adapter
+        client.api_root = "http://127.0.0.1:5050/"
+        assert endpoint.compile(client.api_root).adapter is adapter
+
+
+def test_cached_get(
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test cached get."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(
+        foo_bar,
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    httpserver.expect_request(V1INFO, method="GET").respond_with_json(
+        foo_bar,
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    endpoints = [
+        Endpoint(name="get_v1_data", path=V1DATA),
+        Endpoint(name="get_v1_info", path=V1INFO, cache_ttl=0),
+    ]
+    client = RestRequest("http://127.0.0.1:5050", endpoints, cache=ResponseCache())
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+    assert asyncio.run(client.acall_endpoint("get_v1_data")).data() == FOO_BAR
+    assert len(httpserver.log) == 1
+    client.call_endpoint("get_v1_info")
+    client.call_endpoint("get_v1_info")
+    assert len(httpserver.log) == 3
+
+
+def test_cache_revalidation(
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test cache revalidation."""
+    httpserver.expect_oneshot_request(
+        V1DATA,
+        method="GET",
+        headers={"If-None-Match": '"v1"'},
+    ).respond_with_data(status=HTTPStatus.NOT_MODIFIED.value, headers={"ETag": '"v1"'})
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(
+        foo_bar,
+        headers={"ETag": '"v1"', "Cache-Control": "no-cache"},
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, cache=ResponseCache())
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+    response = client.call_endpoint("get_v1_data")
+    assert response.status_code == HTTPStatus.OK
+    assert response.data() == FOO_BAR
+    assert len(httpserver.log) == 2
+    assert httpserver.log[1][1].status_code == HTTPStatus.NOT_MODIFIED
+
+
+def _slow_handler(status: int) -> Callable[[Request], Response]:
+    """Return a handler answering after a delay."""
+
+    def handler(request: Request) -> Response:
+        time.sleep(0.2)
+        return Response('{"foo": "bar"}', status, content_type="application/json")
+
+    return handler
+
+
+def test_coalesced_get(httpserver: HTTPServer) -> None:
+    """Test coalesced get."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_handler(
+        _slow_handler(HTTPStatus.OK.value),
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    with RestRequest("http://127.0.0.1:5050", endpoint, coalesce=True) as client:
+        timings: List[RequestTiming] = []
+        client.on_response(lambda timing, response: timings.append(timing))
+        responses = list(client.call_many("get_v1_data", [{}] * 8, max_workers=8))
+        assert len({id(response.response) for response in responses}) == 1
+        assert len({id(response) for response in responses}) == 8
+        assert {id(response.timing) for response in responses} == {
+            id(timing) for timing in timings
+        }
+        assert all(timing.attempts == 1 for timing in timings)
+        assert len({timing.ttfb for timing in timings}) == 1
+        assert timings[0].ttfb is not None
+        assert timings[0].download is not None
+        assert responses[0].data() == FOO_BAR
+        assert len(httpserver.log) == 1
+
+        async def gather() -> List[RestResponse]:
+            return await asyncio.gather(
+                *(client.acall_endpoint("get_v1_data") for _ in range(8)),
+            )
+
+        timings.clear()
+        responses = asyncio.run(gather())
+        assert len({id(response.response) for response in responses}) == 1
+        assert len({id(response.timing) for response in responses}) == 8
+        assert all(timing.attempts == 1 for timing in timings)
+        assert len({timing.ttfb for timing in timings}) == 1
+        assert timings[0].ttfb is not None
+        assert len(httpserver.log) == 2
+
+        client.call_endpoint("get_v1_data")
+        client.call_endpoint("get_v1_data")
+        assert len(httpserver.log) == 4
+
+
+def test_coalesced_error(httpserver: HTTPServer) -> None:
+    """Test coalesced error."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_handler(
+        _slow_handler(HTTPStatus.SERVICE_UNAVAILABLE.value),
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, coalesce=True)
+    outcomes = list(
+        client.call_many(
+            "get_v1_data",
+            [{}] * 4,
+            max_workers=4,
+            return_exceptions=True,
+        ),
+    )
+    assert len({id(outcome) for outcome in outcomes}) == 1
+    assert isinstance(outcomes[0], ApiClientError)
+    assert outcomes[0].status == HTTPStatus.SERVICE_UNAVAILABLE
+    assert len(httpserver.log) == 1
+
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_factor=0)
+
+
+def test_retry(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test retry."""
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.SERVICE_UNAVAILABLE.value,
+    )
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.TOO_MANY_REQUESTS.value,
+        headers={"Retry-After": "0"},
+    )
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_json(foo_bar)
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.BAD_GATEWAY.value,
+    )
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, retry=NO_WAIT)
+    retried: List[ApiClientError] = []
+
+    @client.on_retry
+    def on_retry(timing: RequestTiming, error: ApiClientError, delay: float) -> None:
+        retried.append(error)
+
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+    assert asyncio.run(client.acall_endpoint("get_v1_data")).data() == FOO_BAR
+    assert len(httpserver.log) == 5
+    assert all(error.response and error.response.closed for error in retried)
+    assert retried[-1].response and retried[-1].response.response.is_closed
+    metrics = client.retry_metrics.snapshot()
+    assert metrics["retries"] == {"get_v1_data": 3}
+    assert metrics["reasons"] == {"503": 1, "429": 1, "502": 1}
+    assert not metrics["exhausted"]
+
+
+def test_retry_exhausted(httpserver: HTTPServer) -> None:
+    """Test retry exhausted."""
+    httpserver.expect_request(V1DATA).respond_with_data(
+        status=HTTPStatus.SERVICE_UNAVAILABLE.value,
+    )
+
+    endpoints = [
+        Endpoint(name="get_v1_data", path=V1DATA),
+        Endpoint(name="post_v1_data", path=V1DATA),
+    ]
+    client = RestRequest("http://127.0.0.1:5050", endpoints, retry=NO_WAIT)
+    with pytest.raises(ApiClientError) as exc_info:
+        client.call_endpoint("get_v1_data")
+    assert exc_info.value.status == HTTPStatus.SERVICE_UNAVAILABLE
+    assert len(httpserver.log) == 3
+    with pytest.raises(ApiClientError):
+        client.call_endpoint("post_v1_data", payload=Payload({"foo": "bar"}))
+    assert len(httpserver.log) == 4
+    assert client.retry_metrics.snapshot()["exhausted"] == {"get_v1_data": 1}
+
+
+def test_endpoint_retry(httpserver: HTTPServer) -> None:
+    """Test endpoint retry."""
+    httpserver.expect_request(V1DATA).respond_with_data(
+        status=HTTPStatus.SERVICE_UNAVAILABLE.value,
+    )
+
+    endpoints = [
+        Endpoint(name="get_v1_data", path=V1DATA),
+        Endpoint(name="post_v1_data", path=V1DATA, retry=RetryPolicy(
+            max_attempts=2,
+            backoff_factor=0,
+            methods=frozenset(("POST",)),
+        )),
+    ]
+    client = RestRequest("http://127.0.0.1:5050", endpoints)
+    with pytest.raises(ApiClientError):
+        client.call_endpoint("get_v1_data")
+    assert len(httpserver.log) == 1
+    with pytest.raises(ApiClientError):
+        client.call_endpoint("post_v1_data", payload=Payload({"foo": "bar"}))
+    assert len(httpserver.log) == 3
+
+
+def test_rate_limit(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test rate limit."""
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.TOO_MANY_REQUESTS.value,
+        headers={"Retry-After": "0"},
+    )
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    root_limit = TokenBucket(1000, increase=0.25)
+    endpoint_limit = TokenBucket(20, capacity=1)
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA, rate_limit=endpoint_limit)
+    client = RestRequest(
+        "http://127.0.0.1:5050",
+        endpoint,
+        retry=NO_WAIT,
+        rate_limit=root_limit,
+    )
+    started = time.monotonic()
+    client.call_endpoint("get_v1_data")
+    assert asyncio.run(client.acall_endpoint("get_v1_data")).data() == FOO_BAR
+    assert time.monotonic() - started >= 0.1
+    assert endpoint_limit.rate == 12
+    assert root_limit.rate == 1000
+    assert len(httpserver.log) == 3
+
+
+def test_rate_limits_overlap(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test rate limits overlap."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    root_limit = TokenBucket(5, capacity=1, adaptive=False)
+    endpoint_limit = TokenBucket(5, capacity=1, adaptive=False)
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA, rate_limit=endpoint_limit)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, rate_limit=root_limit)
+    client.call_endpoint("get_v1_data")
+    started = time.monotonic()
+    client.call_endpoint("get_v1_data")
+    elapsed = time.monotonic() - started
+    assert 0.15 <= elapsed < 0.35
+
+
+def test_circuit_breaker(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test circuit breaker."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.BAD_GATEWAY.value,
+    )
+    httpserver.expect_request(V1INFO, method="GET").respond_with_data(
+        status=HTTPStatus.NOT_FOUND.value,
+    )
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    endpoints = [
+        Endpoint(name="get_v1_data", path=V1DATA),
+        Endpoint(name="get_v1_info", path=V1INFO),
+    ]
+    client = RestRequest(
+        "http://127.0.0.1:5050",
+        endpoints,
+        retry=NO_WAIT,
+        circuit_breaker=breaker,
+    )
+    with pytest.raises(ApiClientError):
+        client.call_endpoint("get_v1_info")
+    assert breaker.failures == 0
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.call_endpoint("get_v1_data")
+    assert exc_info.value.host == "127.0.0.1:5050"
+    assert exc_info.value.retry_after > 59
+    assert breaker.state == CircuitState.OPEN
+    assert len(httpserver.log) == 3
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(client.acall_endpoint("get_v1_info"))
+    assert len(httpserver.log) == 3
+
+    httpserver.clear()
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+    breaker.recovery_timeout = 0
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_hooks(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test hooks."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    started: List[RequestTiming] = []
+    finished: List[RequestTiming] = []
+    client.on_request_start(started.append)
+
+    @client.on_response
+    def on_response(timing: RequestTiming, response: RestResponse) -> None:
+        assert response.status_code == HTTPStatus.OK
+        finished.append(timing)
+
+    response = client.call_endpoint("get_v1_data")
+    timing = finished[0]
+    assert started == [timing]
+    assert response.timing is timing
+    assert timing.endpoint == "get_v1_data"
+    assert timing.method == "GET"
+    assert timing.url == "http://127.0.0.1:5050/v1/data"
+    assert timing.attempts == 1
+    assert timing.status_code == HTTPStatus.OK
+    for field in ("prepare_url", "prepare_headers", "ttfb", "download", "total"):
+        assert getattr(timing, field) is not None
+    assert timing.decode is None
+    assert response.data() == FOO_BAR
+    assert timing.decode is not None
+
+    response = asyncio.run(client.acall_endpoint("get_v1_data"))
+    timing = finished[1]
+    for field in ("connect", "ttfb", "download", "total"):
+        assert getattr(timing, field) is not None
+
+
+def test_error_hooks(httpserver: HTTPServer) -> None:
+    """Test error hooks."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.SERVICE_UNAVAILABLE.value,
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, retry=NO_WAIT)
+    retries: List[float] = []
+    errors: List[ApiClientError] = []
+    client.on_retry(lambda timing, error, delay: retries.append(delay))
+    client.on_error(lambda timing, error: errors.append(error))
+    with pytest.raises(ApiClientError) as exc_info:
+        client.call_endpoint("get_v1_data")
+    assert retries == [0, 0]
+    assert errors == [exc_info.value]
+    with pytest.raises(ApiClientError):
+        asyncio.run(client.acall_endpoint("get_v1_data"))
+    assert len(retries) == 4
+    assert len(errors) == 2
+
+
+def test_metrics(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test metrics."""
+    httpserver.expect_ordered_request(V1DATA, method="GET").respond_with_data(
+        status=HTTPStatus.SERVICE_UNAVAILABLE.value,
+    )
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+    httpserver.expect_request(V1INFO, method="GET").respond_with_data(
+        status=HTTPStatus.NOT_FOUND.value,
+    )
+
+    metrics = ClientMetrics()
+    endpoints = [
+        Endpoint(name="get_v1_data", path=V1DATA),
+        Endpoint(name="get_v1_info", path=V1INFO),
+    ]
+    client = RestRequest(
+        "http://127.0.0.1:5050",
+        endpoints,
+        retry=NO_WAIT,
+        metrics=metrics,
+    )
+    client.call_endpoint("get_v1_data")
+    asyncio.run(client.acall_endpoint("get_v1_data"))
+    with pytest.raises(ApiClientError):
+        client.call_endpoint("get_v1_info")
+    summary = metrics.summary()
+    assert summary["get_v1_data"]["requests"] == 2
+    assert summary["get_v1_data"]["errors"] == 0
+    assert summary["get_v1_info"]["error_rate"] == 1
+    text = metrics.prometheus_text()
+    assert 'endpoint="get_v1_info",method="GET",status_class="4xx"' in text
+    assert (
+        'api_client_retries_total{endpoint="get_v1_data",method="GET",'
+        'host="127.0.0.1:5050"} 1'
+    ) in text
+
+
+def test_request_logger(
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test request logger."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest(
+        "http://127.0.0.1:5050",
+        endpoint,
+        request_logger=RequestLogger(),
+    )
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        client.call_endpoint("get_v1_data")
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "api_client.requests"
+    ]
+    assert len(messages) == 1
+    assert "endpoint=get_v1_data method=GET" in messages[0]
+    assert "status=200" in messages[0]
+
+
+def test_default_headers(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test default headers."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(foo_bar)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, api_key="key1")
+    client.call_endpoint("get_v1_data")
+    asyncio.run(client.acall_endpoint("get_v1_data"))
+    client.api_key = "key2"
+    client.user_agent = "tester"
+    client.call_endpoint("get_v1_data")
+    asyncio.run(client.acall_endpoint("get_v1_data"))
+    client.api_key = None
+    client.call_endpoint(
+        "get_v1_data",
+        headers=CaseInsensitiveDict({"user-agent": "mine"}),
+    )
+    sent = [request.headers for request, _ in httpserver.log]
+    assert [heads.get("Authorization") for heads in sent] == [
+        "Bearer key1",
+        "Bearer key1",
+        "Bearer key2",
+        "Bearer key2",
+        None,
+    ]
+    assert sent[2]["User-Agent"] == "tester {0}".format(client.version)
+    assert sent[3]["User-Agent"] == sent[2]["User-Agent"]
+    assert sent[4]["User-Agent"] == "mine"
+    assert [heads["Accept-Encoding"] for heads in sent] == [
+        ACCEPT_ENCODING,
+        ASYNC_ACCEPT_ENCODING,
+        ACCEPT_ENCODING,
+        ASYNC_ACCEPT_ENCODING,
+        ACCEPT_ENCODING,
+    ]
+    assert all(heads["Content-Type"] == "application/json" for heads in sent)
+    assert client.default_headers["User-Agent"] == sent[2]["User-Agent"]
+
+
+def test_cache_varies_on_api_key(
+    httpserver: HTTPServer,
+    foo_bar: Dict[str, str],
+) -> None:
+    """Test cache varies on api key."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(
+        foo_bar,
+        headers={"Cache-Control": "max-age=60"},
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest(
+        "http://127.0.0.1:5050",
+        endpoint,
+        api_key="key1",
+        cache=ResponseCache(),
+    )
+    client.call_endpoint("get_v1_data")
+    client.call_endpoint("get_v1_data")
+    assert len(httpserver.log) == 1
+    client.api_key = "key2"
+    client.call_endpoint("get_v1_data")
+    assert len(httpserver.log) == 2
+
+
+def test_compressed_post(httpserver: HTTPServer) -> None:
+    """Test compressed post."""
+    bodies: List[bytes] = []
+    encodings: List[str] = []
+
+    def handler(request: Request) -> Response:
+        encodings.append(request.headers.get("Content-Encoding", ""))
+        bodies.append(request.get_data())
+        if len(bodies) == 1:
+            return Response(status=HTTPStatus.SERVICE_UNAVAILABLE.value)
+        return Response('{"status": "ok"}', content_type="application/json")
+
+    httpserver.expect_request(V1DATA, method="POST").respond_with_handler(handler)
+
+    endpoint = Endpoint(
+        name="post_v1_data",
+        path=V1DATA,
+        compress="gzip",
+        compress_min_size=100,
+        retry=RetryPolicy(max_attempts=2, backoff_factor=0, methods={"POST"}),
+    )
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    large = {"records": ["record {0}".format(index) for index in range(1000)]}
+    client.call_endpoint("post_v1_data", Payload(large))
+    asyncio.run(client.acall_endpoint("post_v1_data", Payload(large)))
+    client.call_endpoint("post_v1_data", Payload({"small": True}))
+    assert encodings == ["gzip", "gzip", "gzip", ""]
+    assert [json.loads(gzip.decompress(body)) for body in bodies[:3]] == [large] * 3
+    assert json.loads(bodies[3]) == {"small": True}
+
+
+def test_zstd_response(httpserver: HTTPServer, foo_bar: Dict[str, str]) -> None:
+    """Test zstd response."""
+    zstandard = pytest.importorskip("zstandard")
+    if "zstd" not in ACCEPT_ENCODING:
+        pytest.skip("urllib3 cannot decode zstd")
+    httpserver.expect_request(V1DATA, method="GET").respond_with_data(
+        zstandard.ZstdCompressor().compress(json.dumps(foo_bar).encode()),
+        content_type="application/json",
+        headers={"Content-Encoding": "zstd"},
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    assert client.call_endpoint("get_v1_data").data() == FOO_BAR
+    assert asyncio.run(client.acall_endpoint("get_v1_data")).data() == FOO_BAR
+    assert "zstd" in httpserver.log[0][0].headers["Accept-Encoding"]
+
+
+def test_streamed_upload(httpserver: HTTPServer, tmp_path: Path) -> None:
+    """Test streamed upload."""
+    received: List[Tuple[bytes, str, str]] = []
+
+    def handler(request: Request) -> Response:
+        received.append(
+            (
+                request.get_data(),
+                request.headers.get("Content-Length", ""),
+                request.headers.get("Content-Encoding", ""),
+            ),
+        )
+        if len(received) == 1:
+            return Response(status=HTTPStatus.SERVICE_UNAVAILABLE.value)
+        return Response('{"status": "ok"}', content_type="application/json")
+
+    httpserver.expect_request(V1DATA, method="PUT").respond_with_handler(handler)
+
+    artifact = tmp_path / "artifact.bin"
+    artifact.write_bytes(bytes(range(256)) * 1000)
+    endpoints = [
+        Endpoint(name="put_v1_data", path=V1DATA),
+        Endpoint(name="update_v1_data", path=V1DATA, compress="gzip"),
+    ]
+    client = RestRequest("http://127.0.0.1:5050", endpoints, retry=NO_WAIT)
+    sent: List[int] = []
+    payload = Payload(artifact, progress=lambda done, total: sent.append(done))
+    client.call_endpoint("put_v1_data", payload)
+    asyncio.run(client.acall_endpoint("put_v1_data", Payload(memoryview(b"abc"))))
+    client.call_endpoint("update_v1_data", Payload(artifact))
+    data = artifact.read_bytes()
+    assert received[:3] == [
+        (data, str(len(data)), ""),
+        (data, str(len(data)), ""),
+        (b"abc", "3", ""),
+    ]
+    assert received[3][2] == "gzip"
+    assert gzip.decompress(received[3][0]) == data
+    assert sent[-1] == len(data)
+
+
+def test_streamed_upload_not_replayable(httpserver: HTTPServer) -> None:
+    """Test streamed upload not replayable."""
+    httpserver.expect_request(V1DATA, method="PUT").respond_with_data(
+        status=HTTPStatus.SERVICE_UNAVAILABLE.value,
+    )
+
+    endpoint = Endpoint(name="put_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint, retry=NO_WAIT)
+    with pytest.raises(ApiClientError):
+        client.call_endpoint("put_v1_data", Payload(iter([b"part1", b"part2"])))
+    assert len(httpserver.log) == 1
+    request = httpserver.log[0][0]
+    assert request.headers.get("Transfer-Encoding") == "chunked"
+    assert request.get_data() == b"part1part2"
+
+
+def test_download_to(httpserver: HTTPServer, tmp_path: Path) -> None:
+    """Test download to."""
+    body = b'{"records": []}' * 10000
+    httpserver.expect_request(V1DATA, method="GET").respond_with_data(
+        body,
+        content_type="application/json",
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    target = tmp_path / "data.json"
+    assert client.download_to("get_v1_data", target) == str(target)
+    assert target.read_bytes() == body
+    assert [entry.name for entry in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_download_to_resume(httpserver: HTTPServer, tmp_path: Path) -> None:
+    """Test download to resume."""
+    body = bytes(range(256)) * 100
+
+    def handler(request: Request) -> Response:
+        start = int(request.headers["Range"].split("=")[1].rstrip("-"))
+        if start >= len(body):
+            return Response(
+                status=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE.value,
+                headers={"Content-Range": "bytes */{0}".format(len(body))},
+            )
+        return Response(
+            body[start:],
+            status=HTTPStatus.PARTIAL_CONTENT.value,
+            headers={
+                "Content-Range": "bytes {0}-{1}/{2}".format(
+                    start,
+                    len(body) - 1,
+                    len(body),
+                ),
+            },
+        )
+
+    httpserver.expect_request(V1DATA, method="GET").respond_with_handler(handler)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    target = tmp_path / "data.bin"
+    part = tmp_path / "data.bin.part"
+    part.write_bytes(body[:1000])
+    client.download_to("get_v1_data", target, resume=True)
+    assert target.read_bytes() == body
+    assert httpserver.log[0][0].headers["Range"] == "bytes=1000-"
+
+    errors: List[ApiClientError] = []
+    client.on_error(lambda timing, error: errors.append(error))
+    part.write_bytes(body)
+    client.download_to("get_v1_data", target, resume=True)
+    assert target.read_bytes() == body
+    assert not part.exists()
+    assert errors[0].status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert errors[0].response and errors[0].response.closed
+
+
+def test_download_to_resume_gzip(httpserver: HTTPServer, tmp_path: Path) -> None:
+    """Test download to resume gzip."""
+    body = json.dumps(list(range(5000))).encode("utf-8")
+    encoded = gzip.compress(body)
+
+    def handler(request: Request) -> Response:
+        gzipped = "gzip" in request.headers.get("Accept-Encoding", "")
+        representation = encoded if gzipped else body
+        start = int(request.headers["Range"].split("=")[1].rstrip("-"))
+        headers = {
+            "Content-Range": "bytes {0}-{1}/{2}".format(
+                start,
+                len(representation) - 1,
+                len(representation),
+            ),
+        }
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+        return Response(
+            representation[start:],
+            status=HTTPStatus.PARTIAL_CONTENT.value,
+            headers=headers,
+        )
+
+    httpserver.expect_request(V1DATA, method="GET").respond_with_handler(handler)
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA)
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    target = tmp_path / "data.json"
+    (tmp_path / "data.json.part").write_bytes(body[:1000])
+    client.download_to("get_v1_data", target, resume=True)
+    assert target.read_bytes() == body
+    assert httpserver.log[0][0].headers["Accept-Encoding"] == "identity"
+
+
+def test_paginate(httpserver: HTTPServer) -> None:
+    """Test paginate."""
+
+    def handler(request: Request) -> Response:
+        offset = int(request.args["offset"])
+        items = list(range(offset, min(offset + 10, 45)))
+        return Response(json.dumps({"data": items}), content_type="application/json")
+
+    httpserver.expect_request(V1DATA, method="GET").respond_with_handler(handler)
+    httpserver.expect_request("/v1/info", method="GET").respond_with_json(
+        {"data": [1, 2], "next_cursor": None},
+    )
+
+    endpoints = [
+        Endpoint(
+            name="get_v1_data",
+            path=V1DATA,
+            query_parameters=["q"],
+            pagination=OffsetPagination(items="data", limit=10, prefetch_pages=2),
+        ),
+        Endpoint(
+            name="get_v1_info",
+            path=V1INFO,
+            pagination=CursorPagination(items="data"),
+        ),
+        Endpoint(name="post_v1_data", path=V1DATA),
+    ]
+    client = RestRequest("http://127.0.0.1:5050", endpoints)
+    assert list(client.paginate("get_v1_data", q="x")) == list(range(45))
+    queries = sorted(entry[0].query_string for entry in httpserver.log)
+    assert queries[0] == b"q=x&offset=0&limit=10"
+    assert len(queries) >= 5
+    assert list(client.paginate("get_v1_data", prefetch=0)) == list(range(45))
+    assert list(client.paginate("get_v1_info")) == [1, 2]
+    with pytest.raises(ValueError, match="CursorPagination pages cannot be"):
+        list(client.paginate("get_v1_info", prefetch=1))
+    with pytest.raises(ValueError, match="is not paginated"):
+        client.paginate("post_v1_data")
+
+
+def test_paginate_link(httpserver: HTTPServer) -> None:
+    """Test paginate link."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(
+        [1, 2],
+        headers={"Link": '</v1/data/2?token=abc>; rel="next"'},
+    )
+    httpserver.expect_request("/v1/data/2", method="GET").respond_with_json([3])
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA, pagination=LinkPagination())
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    assert list(client.paginate("get_v1_data")) == [1, 2, 3]
+    assert httpserver.log[1][0].query_string == b"token=abc"
+
+
+def test_paginate_link_other_host(httpserver: HTTPServer) -> None:
+    """Test paginate link other host."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_json(
+        [1, 2],
+        headers={"Link": '<http://localhost:5050/v1/data/2>; rel="next"'},
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA, pagination=LinkPagination())
+    client = RestRequest("http://127.0.0.1:5050", endpoint, api_key="secret")
+    items = client.paginate("get_v1_data")
+    assert [next(items), next(items)] == [1, 2]
+    with pytest.raises(ValueError, match="is not on the api root"):
+        next(items)
+
+    async def run() -> List[int]:
+        async with client:
+            return [item async for item in client.apaginate("get_v1_data")]
+
+    with pytest.raises(ValueError, match="is not on the api root"):
+        asyncio.run(run())
+    assert len(httpserver.log) == 2
+    assert all(entry[0].path == V1DATA for entry in httpserver.log)
+
+
+def test_apaginate(httpserver: HTTPServer) -> None:
+    """Test apaginate."""
+
+    def handler(request: Request) -> Response:
+        page = int(request.args["page"])
+        items = [page] * (3 if page < 4 else 1)
+        return Response(json.dumps(items), content_type="application/json")
+
+    httpserver.expect_request(V1DATA, method="GET").respond_with_handler(handler)
+
+    endpoint = Endpoint(
+        name="get_v1_data",
+        path=V1DATA,
+        pagination=PagePagination(page_size=3),
+    )
+
+    async def run(prefetch: int) -> List[int]:
+        async with RestRequest("http://127.0.0.1:5050", endpoint) as client:
+            pages = client.apaginate("get_v1_data", prefetch=prefetch)
+            return [item async for item in pages]
+
+    expected = [1, 1, 1, 2, 2, 2, 3, 3, 3, 4]
+    assert asyncio.run(run(0)) == expected
+    assert asyncio.run(run(2)) == expected
+
+
+def test_stream_ndjson_records(httpserver: HTTPServer) -> None:
+    """Test stream ndjson records."""
+    httpserver.expect_request(V1DATA, method="GET").respond_with_data(
+        "".join('{{"foo": "r{0}"}}\n'.format(index) for index in range(1000)),
+        content_type="application/x-ndjson",
+    )
+
+    endpoint = Endpoint(name="get_v1_data", path=V1DATA, model=FooBar, stream=True)
+    client = RestRequest("http://127.0.0.1:5050", endpoint)
+    with client.call_endpoint("get_v1_data") as response:
+        records = list(response.iter_ndjson(parsed=True, chunk_size=1024))
+    assert len(records) == 1000
+    assert records[-1] == FooBar(foo="r999")
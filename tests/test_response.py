@@ -6,15 +6,36 @@ Functions:
     test_parse_response
     test_save_json_in_file
     test_image_as_response
+    test_stream_iter_lines
+    test_iter_long_lines
+    test_stream_read
+    test_stream_data
+    test_buffered_read_and_iter_bytes
+    test_lazy_decode
+    test_json_by_content_type
+    test_parsed_into_model
+    test_stream_write_to
+    test_save_streamed
+    test_stream_ndjson
+    test_ndjson_parsed
+    test_stream_sse
+    test_stream_array
 """
 
 import hashlib
+import io
 from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Dict, List, Union
 
+import pytest
+from pydantic import BaseModel, ValidationError
 from pyfakefs.fake_filesystem import FakeFilesystem
 from requests import Response
+from urllib3 import HTTPResponse
 
-from api_client.response import RestResponse
+from api_client.codec import StdlibCodec, model_adapter
+from api_client.response import RestResponse, ServerSentEvent
 
 
 def assert_file_hash(file_path: str, match: str) -> None:
@@ -61,3 +82,196 @@ def test_image_as_response(response_image: Response, fs: FakeFilesystem) -> None
     assert resp.is_json() is False
     assert resp.save("/testing/image.png") == "/testing/image.png"
     assert_file_hash("/testing/image.png", "d16fbdccd830021d48d0a7498b0c4456")
+
+
+def test_stream_iter_lines(response_stream: Response) -> None:
+    """Test stream iter lines."""
+    with RestResponse(response_stream, stream=True) as resp:
+        lines = list(resp.iter_lines(chunk_size=4))
+    assert lines == [b'{"line": 1}', b'{"line": 2}', b'{"line": 3}']
+    assert resp.closed
+    with pytest.raises(ValueError, match="consumed"):
+        resp.data()
+
+
+def test_iter_long_lines() -> None:
+    """Test iter long lines."""
+    body = b"".join((b"x" * 300000, b"\r\n\n", b"y" * 5, b"\nz" * 3))
+    rr = Response()
+    rr.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    rr.status_code = HTTPStatus.OK
+    with RestResponse(rr, stream=True) as resp:
+        lines = list(resp.iter_lines(chunk_size=7))
+    assert lines == [b"x" * 300000, b"", b"yyyyy", b"z", b"z", b"z"]
+
+
+def test_stream_read(response_stream: Response) -> None:
+    """Test stream read."""
+    resp = RestResponse(response_stream, stream=True)
+    assert resp.readable()
+    assert resp.read(11) == b'{"line": 1}'
+    assert resp.read().endswith(b'{"line": 3}')
+    assert resp.read() == b""
+
+
+def test_stream_data(response_stream: Response) -> None:
+    """Test stream data."""
+    resp = RestResponse(response_stream, stream=True)
+    assert response_stream.raw.tell() == 0
+    assert resp.data().startswith(b'{"line": 1}')
+    assert resp.read(11) == b'{"line": 1}'
+
+
+def test_buffered_read_and_iter_bytes(response: Response) -> None:
+    """Test buffered read and iter bytes."""
+    resp = RestResponse(response)
+    assert list(resp.iter_bytes(chunk_size=8)) == [b'{"foo": ', b'"bar"}']
+    assert resp.read(3) == b'{"f'
+    assert resp.read() == b'oo": "bar"}'
+
+
+def test_lazy_decode(response: Response) -> None:
+    """Test lazy decode."""
+    loads: List[Union[bytes, str]] = []
+
+    class CountingCodec(StdlibCodec):
+        def loads(self, data: Union[bytes, str]) -> Any:  # noqa: WPS110
+            loads.append(data)
+            return super().loads(data)
+
+    resp = RestResponse(response, codec=CountingCodec())
+    assert resp.status_code == HTTPStatus.OK
+    assert not loads
+    assert resp.data() == {"foo": "bar"}
+    assert resp.data() == {"foo": "bar"}
+    assert loads == [b'{"foo": "bar"}']
+
+
+def test_json_by_content_type(response: Response) -> None:
+    """Test json by content type."""
+    response.headers["Content-Type"] = "text/plain"
+    assert RestResponse(response).data() == b'{"foo": "bar"}'
+    response.headers["Content-Type"] = "application/problem+json"
+    assert RestResponse(response).data() == {"foo": "bar"}
+
+
+class FooBar(BaseModel):
+    """FooBar model."""
+
+    foo: str
+
+
+class FooInt(BaseModel):
+    """FooInt model."""
+
+    foo: int
+
+
+def test_parsed_into_model(response: Response) -> None:
+    """Test parsed into model."""
+    resp = RestResponse(response, adapter=model_adapter(FooBar))
+    parsed = resp.parsed()
+    assert parsed == FooBar(foo="bar")
+    assert resp.parsed() is parsed
+    assert resp.parsed(Dict[str, str]) == {"foo": "bar"}
+    with pytest.raises(ValidationError):
+        resp.parsed(FooInt)
+    with pytest.raises(ValueError, match="No response model"):
+        RestResponse(response).parsed()
+
+
+def test_stream_write_to(response_stream: Response) -> None:
+    """Test stream write to."""
+    resp = RestResponse(response_stream, stream=True)
+    target = io.BytesIO()
+    assert resp.write_to(target, chunk_size=8) == 36
+    assert target.getvalue() == b'{"line": 1}\r\n{"line": 2}\n{"line": 3}'
+    with pytest.raises(ValueError, match="consumed"):
+        resp.data()
+
+
+def test_save_streamed(response_stream: Response, tmp_path: Path) -> None:
+    """Test save streamed."""
+    target = tmp_path / "lines.json"
+    resp = RestResponse(response_stream, stream=True)
+    assert resp.save(str(target)) == str(target)
+    assert target.read_bytes().endswith(b'{"line": 3}')
+    assert [entry.name for entry in tmp_path.iterdir()] == ["lines.json"]
+
+
+class Line(BaseModel):
+    """Line model."""
+
+    line: int
+
+
+def test_stream_ndjson(response_stream: Response) -> None:
+    """Test stream ndjson."""
+    resp = RestResponse(response_stream, stream=True)
+    records = resp.iter_ndjson(chunk_size=4)
+    assert next(records) == {"line": 1}
+    assert response_stream.raw.tell() < 36
+    assert list(records) == [{"line": 2}, {"line": 3}]
+    with pytest.raises(ValueError, match="consumed"):
+        resp.data()
+
+
+def test_ndjson_parsed(response: Response) -> None:
+    """Test ndjson parsed."""
+    response._content = b'{"line": 1}\n\n{"line": 2}\n'  # noqa: WPS437
+    resp = RestResponse(response, adapter=model_adapter(Line))
+    assert list(resp.iter_ndjson(parsed=True)) == [Line(line=1), Line(line=2)]
+    assert list(resp.iter_ndjson(model=Dict[str, int])) == [{"line": 1}, {"line": 2}]
+    assert list(resp.iter_ndjson()) == [{"line": 1}, {"line": 2}]
+    with pytest.raises(ValueError, match="No response model"):
+        list(RestResponse(response).iter_ndjson(parsed=True))
+    response._content = b'{"line": "one"}'  # noqa: WPS437
+    with pytest.raises(ValidationError):
+        list(RestResponse(response).iter_ndjson(model=Line))
+
+
+def test_stream_sse(response_stream: Response) -> None:
+    """Test stream sse."""
+    body = (
+        b": keep-alive\r\n\r\n"
+        b"retry: 3000\n"
+        b'data: {"line": 1}\n\n'
+        b"event: update\nid: 7\ndata: first\ndata:second\n\n"
+        b"data: {}\n\n"
+        b"data: incomplete"
+    )
+    response_stream.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    response_stream.headers["Content-Type"] = "text/event-stream"
+    resp = RestResponse(response_stream, stream=True)
+    events = list(resp.iter_sse(chunk_size=5))
+    assert events == [
+        ServerSentEvent(data='{"line": 1}', retry=3000),
+        ServerSentEvent(
+            event="update",
+            data="first\nsecond",
+            event_id="7",
+            retry=3000,
+        ),
+        ServerSentEvent(data="{}", event_id="7", retry=3000),
+    ]
+    assert events[0].decode() == {"line": 1}
+    assert events[0].parsed(Line) == Line(line=1)
+    assert events[2].decode(StdlibCodec()) == {}
+
+
+def test_stream_array(response_stream: Response, response: Response) -> None:
+    """Test stream array."""
+    body = b'[{"line": 1}, {"line": 2},\n {"line": 3}]'
+    response_stream.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    response_stream.headers["Content-Type"] = "application/json"
+    resp = RestResponse(response_stream, stream=True, adapter=model_adapter(Line))
+    elements = resp.iter_array(parsed=True, chunk_size=8)
+    assert next(elements) == Line(line=1)
+    assert response_stream.raw.tell() < len(body)
+    assert list(elements) == [Line(line=2), Line(line=3)]
+
+    with pytest.raises(ValueError, match="not an array"):
+        list(RestResponse(response).iter_array(model=Line))
+    response._content = body  # noqa: WPS437
+    resp = RestResponse(response)
+    assert list(resp.iter_array()) == [{"line": 1}, {"line": 2}, {"line": 3}]
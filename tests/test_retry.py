@@ -0,0 +1,97 @@
+"""
+Module test_retry module for package tests of rest-api-client-framework library.
+
+Functions:
+    test_parse_retry_after
+    test_backoff
+    test_is_retryable
+    test_next_delay
+    test_retry_metrics
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+from requests import Response
+
+from api_client.exception import ApiClientError
+from api_client.response import RestResponse
+from api_client.retry import RetryMetrics, RetryPolicy, parse_retry_after
+
+
+def _error(status: int, retry_after: str = "") -> ApiClientError:
+    """Build an ApiClientError carrying a response."""
+    resp = Response()
+    resp.status_code = status
+    resp._content = b""  # noqa: WPS437
+    if retry_after:
+        resp.headers["Retry-After"] = retry_after
+    return ApiClientError(response=RestResponse(resp))
+
+
+def test_parse_retry_after() -> None:
+    """Test parse retry after."""
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after(" 7 ") == 7
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0
+    delay = parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+    assert delay is not None
+    assert 55 < delay <= 60
+
+
+def test_backoff() -> None:
+    """Test backoff."""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+    assert all(0 <= policy.backoff(4) <= 5 for _ in range(100))
+
+
+def test_is_retryable() -> None:
+    """Test is retryable."""
+    policy = RetryPolicy()
+    transport = ApiClientError(status=0, reason="ConnectionError")
+    assert policy.is_retryable("GET", transport)
+    assert policy.is_retryable("get", _error(503))
+    assert policy.is_retryable("DELETE", _error(429))
+    assert not policy.is_retryable("GET", _error(500))
+    assert not policy.is_retryable("GET", _error(404))
+    assert not policy.is_retryable("POST", _error(503))
+    assert not RetryPolicy(retry_transport_errors=False).is_retryable("GET", transport)
+    assert RetryPolicy(methods=frozenset(("POST",))).is_retryable("post", _error(503))
+
+
+def test_next_delay() -> None:
+    """Test next delay."""
+    policy = RetryPolicy(max_attempts=3, backoff_factor=0.1, jitter=False)
+    now = time.monotonic()
+    assert policy.next_delay("GET", 1, now, _error(503)) == pytest.approx(0.1)
+    assert policy.next_delay("GET", 2, now, _error(503)) == pytest.approx(0.2)
+    assert policy.next_delay("GET", 3, now, _error(503)) is None
+    assert policy.next_delay("GET", 1, now, _error(429, "3")) == 3
+    assert policy.next_delay("GET", 1, now, _error(404)) is None
+    ignore = RetryPolicy(backoff_factor=0.1, jitter=False, respect_retry_after=False)
+    assert ignore.next_delay("GET", 1, now, _error(429, "3")) == pytest.approx(0.1)
+    budget = RetryPolicy(backoff_factor=0.1, jitter=False, total_timeout=2)
+    assert budget.next_delay("GET", 1, now, _error(503)) == pytest.approx(0.1)
+    assert budget.next_delay("GET", 1, now, _error(429, "3")) is None
+    assert budget.next_delay("GET", 1, now - 2, _error(503)) is None
+    clamped = RetryPolicy(max_backoff=5)
+    assert clamped.next_delay("GET", 1, now, _error(503, "7200")) == 5
+
+
+def test_retry_metrics() -> None:
+    """Test retry metrics."""
+    metrics = RetryMetrics()
+    metrics.record_retry("get_data", _error(503), 0.5)
+    metrics.record_retry("get_data", ApiClientError(status=0), 0.25)
+    metrics.record_exhausted("get_data")
+    assert metrics.snapshot() == {
+        "retries": {"get_data": 2},
+        "reasons": {"503": 1, "transport": 1},
+        "exhausted": {"get_data": 1},
+        "delay": {"seconds": 0.75},
+    }